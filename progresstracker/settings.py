@@ -16,6 +16,7 @@ from django.utils.translation import gettext_lazy as _
 
 from pathlib import Path
 import os
+import tempfile
 from dotenv import load_dotenv
 import dj_database_url
 load_dotenv()
@@ -64,6 +65,8 @@ INSTALLED_APPS = [
 ]
 # third midlware for dual
 MIDDLEWARE = [
+    # First, so its timings cover the whole stack; inert unless enabled below.
+    'tracker_app.middleware.ProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.locale.LocaleMiddleware',    
@@ -116,6 +119,21 @@ DATABASES = {
 
 
 
+# Cache used for rendered theme modals, counters and the content version
+# (see tracker_app/cache.py). Every worker must see the same content version,
+# so the default is a file cache shared by the processes on this host; set
+# CACHE_BACKEND/CACHE_LOCATION to Redis or Memcached when serving from several
+# hosts. LocMemCache is per process and fails the system check when
+# WEB_CONCURRENCY asks for more than one worker (see tracker_app/checks.py).
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.filebased.FileBasedCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', os.path.join(tempfile.gettempdir(), 'progress-tracker-cache')),
+        'OPTIONS': {'MAX_ENTRIES': 2000},
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -182,6 +200,13 @@ else:
 
 
 
+# Approval e-mails are queued in ApprovalNotification and sent as digests by
+# `python manage.py send_approval_notifications` (cron, or --watch).
+# When True, the web process also flushes the queue from a background thread
+# right after a staff update is saved.
+APPROVAL_NOTIFICATIONS_IN_PROCESS = os.getenv('APPROVAL_NOTIFICATIONS_IN_PROCESS', 'True') == 'True'
+
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -202,12 +227,17 @@ LOGGING = {
         },
     },
     'handlers': {
+        # Moved behind a queue at start-up (TRACKER_QUEUED_LOG_HANDLERS):
+        # records are written by a background thread so logging never
+        # blocks a request on file I/O.
         'file': {
             'level': 'DEBUG',
             'class': 'logging.handlers.RotatingFileHandler',
             'filename': str(LOGS_DIR / 'tracker_app.log'),
             'maxBytes': 1024 * 1024 * 5,  # 5MB
             'backupCount': 5,
+            'encoding': 'utf-8',
+            'delay': True,
             'formatter': 'standard',
         },
     },
@@ -217,6 +247,13 @@ LOGGING = {
             'level': 'DEBUG',
             'propagate': False,
         },
+        # Admin save diagnostics (tracker_app/diagnostics.py): off unless the
+        # level is INFO or lower; optionally limited to some users/actions.
+        'tracker_app.diagnostics': {
+            'handlers': ['file'],
+            'level': os.getenv('TRACKER_DIAGNOSTICS_LEVEL', 'WARNING'),
+            'propagate': False,
+        },
         # also capture Django errors to the same file for convenience
         'django': {
             'handlers': ['file'],
@@ -226,4 +263,27 @@ LOGGING = {
     },
 }
 
-
+# LOGGING handlers that tracker_app.log_handlers.queue_handlers() puts behind
+# a QueueHandler/QueueListener pair when the app is ready.
+TRACKER_QUEUED_LOG_HANDLERS = ['file']
+
+# Restrict admin save diagnostics to these usernames / action ids
+# (comma-separated). Leave both empty to record every save once enabled.
+TRACKER_DIAGNOSTICS_USERS = [u for u in os.getenv('TRACKER_DIAGNOSTICS_USERS', '').split(',') if u]
+TRACKER_DIAGNOSTICS_ACTIONS = [int(a) for a in os.getenv('TRACKER_DIAGNOSTICS_ACTIONS', '').split(',') if a]
+
+# Request profiling (tracker_app.middleware.ProfilingMiddleware): Server-Timing
+# headers plus a log line per request. Enable for all requests, or per request
+# with the header "X-Tracker-Profile: <token>" when a token is set.
+TRACKER_PROFILING = os.getenv('TRACKER_PROFILING', 'False') == 'True'
+TRACKER_PROFILING_TOKEN = os.getenv('TRACKER_PROFILING_TOKEN', '')
+# Share of profiled requests run under cProfile; their stats are dumped to
+# TRACKER_PROFILING_DIR when they take at least TRACKER_PROFILING_SLOW_MS.
+TRACKER_PROFILING_SAMPLE_RATE = float(os.getenv('TRACKER_PROFILING_SAMPLE_RATE', '0.1'))
+TRACKER_PROFILING_SLOW_MS = int(os.getenv('TRACKER_PROFILING_SLOW_MS', '500'))
+TRACKER_PROFILING_DIR = LOGS_DIR
+
+# Where the Roadmap series come from: "fields" (progress_started_at/updated_at
+# of approved actions) or "events" (the ActionStatusEvent log). Run
+# "manage.py backfill_status_events" before switching to "events".
+TRACKER_ROADMAP_SOURCE = os.getenv('TRACKER_ROADMAP_SOURCE', 'fields')
@@ -1,17 +1,20 @@
 from django.contrib import admin
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.translation import ngettext
 from django_summernote.admin import SummernoteModelAdmin 
-from django.core.mail import send_mail
-from django.conf import settings
-from django.urls import reverse
-from django.utils.html import strip_tags 
-from django.contrib.auth import get_user_model
 import logging
 
 
 logger = logging.getLogger("tracker_app")
 
 
-from .models import Theme, Objective, Action, ActionStatus 
+from .models import Theme, Objective, Action, ActionStatus, ApprovalNotification
+from .changelist import AutocompleteFilter, EstimatedCountPaginator, autocomplete_filter_media
+from .diagnostics import log_action_save
+from .sanitize import plain_text
+from .notifications import queue_update_notification
 from datetime import date
 
 
@@ -24,11 +27,41 @@ class ThemeAdmin(admin.ModelAdmin):
 @admin.register(Objective)
 class ObjectiveAdmin(SummernoteModelAdmin):
     list_display = ("title", "theme")
+    list_select_related = ("theme",)
     list_filter = ("theme",)
     search_fields = ("title", "description", "description_ga")
     summernote_fields = ('description', 'description_ga')
 
 
+# An action "has an update" when either language's progress text is non-blank.
+HAS_UPDATE = ~Q(update_plain="") | ~Q(update_ga_plain="")
+
+
+def superuser_status_updates(selected_status, user):
+    """Returns queryset.update() kwargs applying save_model()'s superuser rules to many rows.
+
+    ``selected_status`` is the status a superuser picked, or None to keep
+    each row's own (approval only). As in save_model(): the result is
+    approved; anything not completed is in progress when it has update text
+    and not started otherwise; newly in-progress rows get today's start date.
+    """
+    updates = {"is_approved": True, "updated_by": user, "updated_at": timezone.now()}
+    if selected_status == ActionStatus.COMPLETED:
+        updates["status"] = ActionStatus.COMPLETED
+        return updates
+    rules = [When(HAS_UPDATE, then=Value(ActionStatus.IN_PROGRESS))]
+    becomes_in_progress = HAS_UPDATE
+    if selected_status is None:
+        rules.insert(0, When(status=ActionStatus.COMPLETED, then=Value(ActionStatus.COMPLETED)))
+        becomes_in_progress = HAS_UPDATE & ~Q(status=ActionStatus.COMPLETED)
+    updates["status"] = Case(*rules, default=Value(ActionStatus.NOT_STARTED))
+    updates["progress_started_at"] = Case(
+        When(becomes_in_progress, then=Coalesce(F("progress_started_at"), Value(timezone.localdate()))),
+        default=F("progress_started_at"),
+    )
+    return updates
+
+
 @admin.register(Action)
 class ActionAdmin(SummernoteModelAdmin):
     list_display = (
@@ -42,7 +75,22 @@ class ActionAdmin(SummernoteModelAdmin):
         "updated_at",
     )
     
-    list_filter = ("objective", "status", "progress_started_at", "is_approved", "updated_by") 
+    # Sized for a large action table: the related columns come from one joined
+    # query, the objective/user filters load only the selected row (others
+    # are searched via the autocomplete view) and the unfiltered list is
+    # counted from the database statistics, once.
+    list_select_related = ("objective", "updated_by")
+    list_filter = (
+        ("objective", AutocompleteFilter),
+        "status",
+        "progress_started_at",
+        "is_approved",
+        ("updated_by", AutocompleteFilter),
+    )
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+    autocomplete_fields = ("objective",)
+    actions = ("approve_selected", "mark_completed", "set_in_progress")
     search_fields = ("title", "small_description", "description", "update",
                      "small_description_ga", "description_ga", "update_ga")
     
@@ -69,23 +117,12 @@ class ActionAdmin(SummernoteModelAdmin):
     def save_model(self, request, obj, form, change):
         is_super = request.user.is_superuser
 
-        # Capture pre-save progress text for diagnostics (if this is an update)
-        original_update = None
-        original_update_ga = None
-        if obj.pk:
-            try:
-                orig = Action.objects.get(pk=obj.pk)
-                original_update = (orig.update or "").strip()
-                original_update_ga = (orig.update_ga or "").strip()
-            except Action.DoesNotExist:
-                pass
-
         if not change and obj.created_by is None:
             obj.created_by = request.user
         obj.updated_by = request.user
 
-        plain_update_en = strip_tags(form.cleaned_data.get('update') or "").strip()
-        plain_update_ga = strip_tags(form.cleaned_data.get('update_ga') or "").strip()
+        plain_update_en = plain_text(form.cleaned_data.get('update'))
+        plain_update_ga = plain_text(form.cleaned_data.get('update_ga'))
         user_selected_status = form.cleaned_data.get('status')
 
         if is_super:
@@ -110,30 +147,8 @@ class ActionAdmin(SummernoteModelAdmin):
             obj.is_approved = True
 
         super().save_model(request, obj, form, change)
-        #DEBUG
-        logger.error("Changed fields: %s", form.changed_data)
-
-        # DIAGNOSTICS: Log detailed pre/post values to help debug missing emails
-        logger.error(
-            "DIAG save_model: user=%s is_super=%s change=%s changed_data=%s",
-            getattr(request.user, 'username', None),
-            is_super,
-            change,
-            form.changed_data,
-        )
-        logger.error(
-            "DIAG pre_update=%r pre_update_ga=%r form_update=%r form_update_ga=%r",
-            original_update,
-            original_update_ga,
-            (form.cleaned_data.get('update') or "").strip(),
-            (form.cleaned_data.get('update_ga') or "").strip(),
-        )
-        # limit POST keys logged to avoid huge output
-        try:
-            post_keys = list(request.POST.keys())[:50]
-        except Exception:
-            post_keys = []
-        logger.error("DIAG request.POST keys: %s", post_keys)
+        # Off unless enabled by level and user/action (see tracker_app/diagnostics.py).
+        log_action_save(request, obj, form, change)
 
         # THE NOTIFICATION LOGIC
         if not is_super:
@@ -142,47 +157,61 @@ class ActionAdmin(SummernoteModelAdmin):
 
             # Only notify admins when the progress text was changed.
             if change and (update_changed or update_ga_changed):
-                logger.debug("EMAIL BLOCK REACHED for action %s; changed: %s, %s", obj.id, update_changed, update_ga_changed)
-
-                subject = f"Meath County Council – Action Update Pending Approval: {obj.title}"
-
-                admin_url = request.build_absolute_uri(
-                    reverse('admin:tracker_app_action_change', args=[obj.id])
-                )
-
                 if update_changed and update_ga_changed:
                     update_note = "ENGLISH and IRISH"
                 elif update_ga_changed:
                     update_note = "IRISH"
-                elif update_changed:
+                else:
                     update_note = "ENGLISH"
 
-                message = (
-                    "Meath County Council – Digital and ICT Strategy Tracker\n\n"
-                    f"User {request.user.username} has updated the {update_note} progress for: {obj.title}.\n\n"
-                    f"Please review and approve the update here: {admin_url}\n\n"
-                    f"Note: Updates are hidden from the public until you click Save."
-                )
-
-                # FIND THE BOSS: Get all superuser emails
-                superusers = get_user_model().objects.filter(is_superuser=True).values_list('email', flat=True)
-
-                logger.debug("Preparing to send update email; from=%s to=%s", settings.DEFAULT_FROM_EMAIL, list(superusers))
-
-                if superusers:
-                    try:
-                        send_mail(
-                            subject,
-                            message,
-                            settings.DEFAULT_FROM_EMAIL,
-                            list(superusers),
-                            fail_silently=False
-                        )
-                    except Exception:
-                        logger.exception("email send failed for action %s", obj.id)
+                # Queue the e-mail; superusers get it in a digest sent outside this request.
+                queue_update_notification(request, obj, update_note)
+                logger.debug("Queued approval notification for action %s (%s)", obj.id, update_note)
             elif change:
                 logger.debug("Change detected for action %s but no progress text changed; skipping email.", obj.id)
 
     # FIXED INDENTATION: This is now correctly a method of ActionAdmin
     def get_queryset(self, request):
         return super().get_queryset(request)
+
+    def has_approve_permission(self, request):
+        # Only superusers approve, or pick a status (it is read-only for staff).
+        return request.user.is_superuser
+
+    def _bulk_status_update(self, request, queryset, selected_status, message):
+        # One UPDATE for the whole selection: the rollups, search index and
+        # caches are refreshed once (actions_updated) rather than per row.
+        count = queryset.update(**superuser_status_updates(selected_status, request.user))
+        self.message_user(request, message(count) % {"count": count})
+
+    @admin.action(description="Approve selected actions", permissions=["approve"])
+    def approve_selected(self, request, queryset):
+        self._bulk_status_update(request, queryset, None, lambda count: ngettext(
+            "%(count)d action approved.", "%(count)d actions approved.", count
+        ))
+
+    @admin.action(description="Mark selected actions completed", permissions=["approve"])
+    def mark_completed(self, request, queryset):
+        self._bulk_status_update(request, queryset, ActionStatus.COMPLETED, lambda count: ngettext(
+            "%(count)d action marked completed.", "%(count)d actions marked completed.", count
+        ))
+
+    @admin.action(description="Set selected actions in progress", permissions=["approve"])
+    def set_in_progress(self, request, queryset):
+        self._bulk_status_update(request, queryset, ActionStatus.IN_PROGRESS, lambda count: ngettext(
+            "%(count)d action updated (in progress where it has update text).",
+            "%(count)d actions updated (in progress where they have update text).",
+            count,
+        ))
+
+    @property
+    def media(self):
+        return super().media + autocomplete_filter_media(Action._meta.get_field("objective"), self.admin_site)
+
+
+@admin.register(ApprovalNotification)
+class ApprovalNotificationAdmin(admin.ModelAdmin):
+    list_display = ("action", "update_note", "requested_by", "created_at", "sent_at", "attempts")
+    list_filter = ("sent_at",)
+    list_select_related = ("action", "requested_by")
+    readonly_fields = ("action", "requested_by", "update_note", "admin_url", "created_at", "claimed_at", "sent_at", "attempts", "last_error")
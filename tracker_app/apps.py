@@ -1,6 +1,18 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class TrackerAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'tracker_app'
+
+    def ready(self):
+        # Write log files from a background thread (see settings.LOGGING).
+        from .log_handlers import queue_handlers
+
+        queue_handlers(getattr(settings, "TRACKER_QUEUED_LOG_HANDLERS", ()))
+
+        # Connect receivers that keep derived data (roadmap rollups) up to date.
+        from . import signals  # noqa: F401
+        # Register the deployment checks (shared cache).
+        from . import checks  # noqa: F401
@@ -0,0 +1,224 @@
+"""Benchmarks for the public tracker views at several dataset sizes.
+
+run_benchmarks() seeds a synthetic dataset of each size (via seeding.seed(),
+growing the same deterministic dataset), then measures every target in each
+language: wall time over ``repeat`` runs, the number of queries, peak Python
+memory (tracemalloc, measured on a separate run) and response size. The
+``benchmark_tracker`` command runs it against a throw-away test database,
+writes the results as JSON, and fails when a result breaks its budget (see
+check_budgets()) or regresses against an earlier run (see compare()).
+"""
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+
+import django
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone, translation
+
+from .cache import bump_content_version
+from .models import Theme
+from .seeding import seed
+from .views import _build_roadmap_payload
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+LANGUAGES = ("en", "ga")
+
+# Query budgets per target; they do not grow with the dataset size.
+QUERY_BUDGETS = {
+    "roadmap_payload": 1,
+    # Cold modals: theme + two prefetches, the counters and the per-theme roadmap.
+    "theme_details": 5,
+    "theme_details_cached": 0,
+    "theme_details_batch": 5,
+    "all_actions": 2,
+    "all_actions_last_page": 2,
+    "actions_by_status": 2,
+    "actions_by_status_theme": 2,
+}
+
+# Median wall-time budgets (ms) per dataset size and target, about three times
+# the SQLite figures of a developer laptop so slower CI machines still pass.
+WALL_MS_BUDGETS = {
+    1000: {
+        "roadmap_payload": 10,
+        "theme_details": 500,
+        "theme_details_cached": 30,
+        "theme_details_batch": 1200,
+        "all_actions": 25,
+        "all_actions_last_page": 25,
+        "actions_by_status": 25,
+        "actions_by_status_theme": 25,
+    },
+}
+
+# compare() ignores wall-time changes smaller than this; they are timer noise.
+NOISE_MS = 1.0
+
+
+def _targets(client, theme_ids, year):
+    """Returns ``{name: callable}``; each callable returns the payload size in bytes."""
+    theme_id = theme_ids[0]
+
+    def get(url_name, *args, **params):
+        def fetch():
+            response = client.get(reverse(f"tracker_app:{url_name}", args=args), params)
+            assert response.status_code == 200, f"{url_name} returned {response.status_code}"
+            return len(response.content)
+        return fetch
+
+    def roadmap_payload():
+        return len(repr(_build_roadmap_payload(str(year))))
+
+    def cold(fetch):
+        # A new content version drops the cached modal, so every run renders it.
+        def run():
+            bump_content_version()
+            return fetch()
+        return run
+
+    return {
+        "roadmap_payload": roadmap_payload,
+        "theme_details": cold(get("get_theme_details", theme_id)),
+        "theme_details_cached": get("get_theme_details", theme_id),
+        "theme_details_batch": cold(get("get_themes_details", ids=",".join(map(str, theme_ids)))),
+        "all_actions": get("all_actions", page=1),
+        "all_actions_last_page": get("all_actions", page=10 ** 9),
+        "actions_by_status": get("filter_actions_by_status", "in_progress", page=1),
+        "actions_by_status_theme": get("filter_actions_by_status", "in_progress", page=1, theme_id=theme_id),
+    }
+
+
+class _QueryCounter:
+    """execute_wrapper() hook counting queries.
+
+    CaptureQueriesContext cannot be used around client requests: the
+    request_started signal clears ``connection.queries_log`` mid-capture.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def _measure(run, repeat):
+    run()  # warm-up: imports, template loading, cache priming
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    queries = _QueryCounter()
+    with connection.execute_wrapper(queries):
+        size = run()
+
+    tracemalloc.start()
+    try:
+        run()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "wall_ms": {
+            "min": round(min(timings), 3),
+            "median": round(statistics.median(timings), 3),
+            "max": round(max(timings), 3),
+        },
+        "queries": queries.count,
+        "peak_kib": round(peak / 1024, 1),
+        "bytes": size,
+    }
+
+
+def environment():
+    """Describes where the numbers came from."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "recorded_at": timezone.now().isoformat(),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "database": connection.vendor,
+    }
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, repeat=5, languages=LANGUAGES, targets=None, log=None):
+    """Seeds each of ``sizes`` in turn and returns the measurements as a JSON-ready dict."""
+    results = []
+    year = timezone.now().year
+    for size in sorted(sizes):
+        started = time.perf_counter()
+        seed({"synthetic": {"actions": size, "years": [year - 2, year], "seed": 1}})
+        if log:
+            log(f"Seeded {size} actions in {time.perf_counter() - started:.1f}s")
+        theme_ids = list(Theme.objects.order_by("id").values_list("id", flat=True))
+
+        for language in languages:
+            with translation.override(language):
+                client = Client(HTTP_ACCEPT_LANGUAGE=language)
+                for name, run in _targets(client, theme_ids, year).items():
+                    if targets and name not in targets:
+                        continue
+                    row = {"size": size, "language": language, "target": name, **_measure(run, repeat)}
+                    results.append(row)
+                    if log:
+                        log(
+                            f"{size:>7} {language} {name:<24} median {row['wall_ms']['median']:>9.2f} ms "
+                            f"{row['queries']:>3} queries {row['peak_kib']:>9.1f} KiB"
+                        )
+    return {"environment": environment(), "repeat": repeat, "results": results}
+
+
+def _label(row):
+    return f"{row['size']} {row['language']} {row['target']}"
+
+
+def check_budgets(report):
+    """Returns a message for every result over its query or wall-time budget."""
+    problems = []
+    for row in report["results"]:
+        query_budget = QUERY_BUDGETS.get(row["target"])
+        if query_budget is not None and row["queries"] > query_budget:
+            problems.append(f"{_label(row)}: {row['queries']} queries, budget {query_budget}")
+        wall_budget = WALL_MS_BUDGETS.get(row["size"], {}).get(row["target"])
+        if wall_budget is not None and row["wall_ms"]["median"] > wall_budget:
+            problems.append(f"{_label(row)}: median {row['wall_ms']['median']:.2f} ms, budget {wall_budget} ms")
+    return problems
+
+
+def compare(report, baseline, tolerance=0.25):
+    """Returns a message for every result that regressed against ``baseline`` (an earlier report).
+
+    A result regresses when it runs more queries, or when its median wall
+    time or peak memory grew by more than ``tolerance`` (a fraction; wall
+    time also by more than NOISE_MS). Results missing from either report
+    are not compared.
+    """
+    previous = {(row["size"], row["language"], row["target"]): row for row in baseline["results"]}
+    problems = []
+    for row in report["results"]:
+        before = previous.get((row["size"], row["language"], row["target"]))
+        if before is None:
+            continue
+        if row["queries"] > before["queries"]:
+            problems.append(f"{_label(row)}: {before['queries']} -> {row['queries']} queries")
+        median, previous_median = row["wall_ms"]["median"], before["wall_ms"]["median"]
+        if median > previous_median * (1 + tolerance) and median - previous_median > NOISE_MS:
+            problems.append(f"{_label(row)}: median {previous_median:.2f} -> {median:.2f} ms")
+        if row["peak_kib"] > before["peak_kib"] * (1 + tolerance):
+            problems.append(f"{_label(row)}: peak {before['peak_kib']:.1f} -> {row['peak_kib']:.1f} KiB")
+    return problems
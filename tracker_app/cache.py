@@ -0,0 +1,106 @@
+import datetime
+import time
+from uuid import uuid4
+
+from django.core.cache import cache
+
+CONTENT_VERSION_KEY = "tracker:content-version"
+DASHBOARD_COUNTS_KEY = "tracker:dashboard-counts"
+THEME_DETAILS_TIMEOUT = 60 * 60
+DASHBOARD_COUNTS_TIMEOUT = 60 * 60
+THEME_ROADMAP_TIMEOUT = 60 * 60
+
+
+def _theme_details_key(theme_id, language):
+    """Returns the cache key holding the rendered modal for a theme/language pair."""
+    return f"tracker:theme-details:{theme_id}:{language}"
+
+
+def _theme_roadmap_key(year):
+    """Returns the cache key holding the per-theme roadmap matrix of ``year``."""
+    return f"tracker:theme-roadmap:{year}"
+
+
+def _new_content_version():
+    """Returns a unique version token that also records when it was issued."""
+    return f"{time.time():.6f}-{uuid4().hex[:8]}"
+
+
+def bump_content_version():
+    """Invalidates every cached fragment by moving to a new content version."""
+    version = _new_content_version()
+    cache.set(CONTENT_VERSION_KEY, version, timeout=None)
+    return version
+
+
+def current_content_version():
+    """Returns the current content version, creating one if the cache was flushed."""
+    version = cache.get(CONTENT_VERSION_KEY)
+    if version is None:
+        cache.add(CONTENT_VERSION_KEY, _new_content_version(), timeout=None)
+        version = cache.get(CONTENT_VERSION_KEY)
+    return version
+
+def content_version_issued_at(version):
+    """Returns the (UTC) time a content version token was issued."""
+    return datetime.datetime.fromtimestamp(float(version.split("-", 1)[0]), tz=datetime.timezone.utc)
+
+
+def _fresh_payload(found, key):
+    """Returns the payload cached under ``key`` if it matches the current content version."""
+    entry, version = found.get(key), found.get(CONTENT_VERSION_KEY)
+    if entry is None or version is None or entry["version"] != version:
+        return None
+    return entry["payload"]
+
+
+def get_theme_details(theme_id, language):
+    """Returns the cached modal payload, or None when missing or stale.
+
+    The content version and the fragment are fetched in one ``get_many`` call,
+    so a warm modal costs a single cache round-trip.
+    """
+    key = _theme_details_key(theme_id, language)
+    return _fresh_payload(cache.get_many([CONTENT_VERSION_KEY, key]), key)
+
+def set_theme_details(theme_id, language, payload, version):
+    """Stores a modal payload rendered against ``version`` of the content."""
+    cache.set(
+        _theme_details_key(theme_id, language),
+        {"version": version, "payload": payload},
+        THEME_DETAILS_TIMEOUT,
+    )
+
+def get_many_theme_details(theme_ids, language):
+    """Returns ``{theme id: payload}`` for the themes with a fresh cached modal, in one round-trip."""
+    keys = {_theme_details_key(theme_id, language): theme_id for theme_id in theme_ids}
+    found = cache.get_many([CONTENT_VERSION_KEY, *keys])
+    payloads = {theme_id: _fresh_payload(found, key) for key, theme_id in keys.items()}
+    return {theme_id: payload for theme_id, payload in payloads.items() if payload is not None}
+
+def set_many_theme_details(payloads, language, version):
+    """Stores ``{theme id: payload}`` modals rendered against ``version`` of the content."""
+    cache.set_many(
+        {
+            _theme_details_key(theme_id, language): {"version": version, "payload": payload}
+            for theme_id, payload in payloads.items()
+        },
+        THEME_DETAILS_TIMEOUT,
+    )
+
+def get_dashboard_counts():
+    """Returns the cached counters (see tracker_app.counts), or None when missing or stale."""
+    return _fresh_payload(cache.get_many([CONTENT_VERSION_KEY, DASHBOARD_COUNTS_KEY]), DASHBOARD_COUNTS_KEY)
+
+def set_dashboard_counts(payload, version):
+    """Stores counters computed against ``version`` of the content."""
+    cache.set(DASHBOARD_COUNTS_KEY, {"version": version, "payload": payload}, DASHBOARD_COUNTS_TIMEOUT)
+
+def get_theme_roadmap(year):
+    """Returns the cached per-theme roadmap matrix of ``year``, or None when missing or stale."""
+    key = _theme_roadmap_key(year)
+    return _fresh_payload(cache.get_many([CONTENT_VERSION_KEY, key]), key)
+
+def set_theme_roadmap(year, payload, version):
+    """Stores a per-theme roadmap matrix computed against ``version`` of the content."""
+    cache.set(_theme_roadmap_key(year), {"version": version, "payload": payload}, THEME_ROADMAP_TIMEOUT)
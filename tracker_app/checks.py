@@ -0,0 +1,56 @@
+import os
+
+from django.conf import settings
+from django.core.checks import Error, register
+
+from .sanitize import keeps_inline_styles
+
+LOCMEM_BACKEND = "django.core.cache.backends.locmem.LocMemCache"
+
+
+def _worker_count():
+    """Returns the worker count requested through WEB_CONCURRENCY (read by gunicorn), or 1."""
+    try:
+        return int(os.environ.get("WEB_CONCURRENCY", "1"))
+    except ValueError:
+        return 1
+
+
+@register()
+def check_shared_cache(app_configs, **kwargs):
+    """Fails when the default cache is per process but several workers will serve requests.
+
+    The content version that invalidates cached modals and counters lives in
+    the default cache; with LocMemCache a save in one worker leaves the others
+    serving stale content until their entries expire.
+    """
+    backend = settings.CACHES.get("default", {}).get("BACKEND")
+    workers = _worker_count()
+    if backend != LOCMEM_BACKEND or workers <= 1:
+        return []
+    return [
+        Error(
+            f"The default cache is LocMemCache but WEB_CONCURRENCY={workers}.",
+            hint="Use a cache shared by all workers (the default file cache, Redis or Memcached) "
+            "through CACHE_BACKEND/CACHE_LOCATION.",
+            id="tracker_app.E001",
+        )
+    ]
+
+
+@register()
+def check_css_sanitizer(app_configs, **kwargs):
+    """Fails when rich-text saves would strip Summernote's inline styles.
+
+    bleach >= 5 needs tinycss2 to filter ``style`` attributes; without it
+    every style is removed from the stored HTML.
+    """
+    if keeps_inline_styles():
+        return []
+    return [
+        Error(
+            "bleach cannot filter inline styles without tinycss2.",
+            hint='Install the pinned requirements (or pip install "bleach[css]").',
+            id="tracker_app.E002",
+        )
+    ]
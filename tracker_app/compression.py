@@ -0,0 +1,63 @@
+"""Response compression for the tracker's JSON endpoints.
+
+compress_response() encodes a view's response with Brotli when the optional
+``brotli`` package is installed and the client accepts ``br``, and with gzip
+otherwise. Only the JSON views that are worth it are wrapped, rather than
+adding GZipMiddleware to every response.
+"""
+from functools import wraps
+
+from django.utils.cache import patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+# Bodies smaller than this gain nothing once the headers are counted.
+MIN_COMPRESS_SIZE = 200
+# Quality 11 (the default) is meant for static assets; 5 is close in size and
+# far cheaper for per-request JSON.
+BROTLI_QUALITY = 5
+
+_accepts_br = _lazy_re_compile(r"\bbr\b")
+_accepts_gzip = _lazy_re_compile(r"\bgzip\b")
+
+
+def compress(request, response):
+    """Encodes ``response`` in place for ``request``'s Accept-Encoding and returns it."""
+    if response.streaming or response.status_code != 200 or response.has_header("Content-Encoding"):
+        return response
+    if len(response.content) < MIN_COMPRESS_SIZE:
+        return response
+
+    patch_vary_headers(response, ("Accept-Encoding",))
+    accept_encoding = request.headers.get("Accept-Encoding", "")
+    if brotli is not None and _accepts_br.search(accept_encoding):
+        content, encoding = brotli.compress(response.content, quality=BROTLI_QUALITY), "br"
+    elif _accepts_gzip.search(accept_encoding):
+        content, encoding = compress_string(response.content), "gzip"
+    else:
+        return response
+    if len(content) >= len(response.content):
+        return response
+
+    response.content = content
+    response.headers["Content-Length"] = str(len(content))
+    response.headers["Content-Encoding"] = encoding
+    # The encoded bytes differ from what a strong ETag described (RFC 9110 8.8.1).
+    etag = response.get("ETag")
+    if etag and etag.startswith('"'):
+        response.headers["ETag"] = "W/" + etag
+    return response
+
+
+def compress_response(view):
+    """Decorator compressing a view's response (see compress())."""
+    @wraps(view)
+    def inner(request, *args, **kwargs):
+        return compress(request, view(request, *args, **kwargs))
+
+    return inner
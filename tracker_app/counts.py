@@ -0,0 +1,59 @@
+"""Theme, objective and action counters shared by the home page and theme modals.
+
+All counters come from one grouped query over themes and are cached against
+the content version, which every Theme/Objective/Action change bumps (see
+tracker_app.signals). A warm cache answers without touching the database.
+Every action is counted, matching the views' (empty) PUBLIC_ACTIONS_FILTER.
+"""
+from django.db.models import Count, Q
+
+from . import cache as tracker_cache
+from .models import ActionStatus, Theme
+
+STATUS_KEYS = {
+    "completed": ActionStatus.COMPLETED,
+    "in_progress": ActionStatus.IN_PROGRESS,
+    "not_started": ActionStatus.NOT_STARTED,
+}
+EMPTY_THEME_COUNTS = dict.fromkeys(STATUS_KEYS, 0)
+
+
+def _count_rows():
+    return Theme.objects.order_by().values("id").annotate(
+        objective_count=Count("objectives", distinct=True),
+        **{
+            key: Count("objectives__actions", filter=Q(objectives__actions__status=status))
+            for key, status in STATUS_KEYS.items()
+        },
+    )
+
+
+def _summarise(rows):
+    by_theme = {row["id"]: {key: row[key] for key in STATUS_KEYS} for row in rows}
+    return {
+        "themes": len(by_theme),
+        "objectives": sum(row["objective_count"] for row in rows),
+        "actions": sum(sum(counts.values()) for counts in by_theme.values()),
+        "by_theme": by_theme,
+    }
+
+
+def compute_counts():
+    """Returns ``{"themes", "objectives", "actions", "by_theme": {theme id: status counts}}``.
+
+    Status counts use the keys of STATUS_KEYS, as the modal's status cards do.
+    """
+    return _summarise(list(_count_rows()))
+
+def dashboard_counts():
+    """Returns compute_counts(), served from the cache while the content is unchanged."""
+    counts = tracker_cache.get_dashboard_counts()
+    if counts is None:
+        version = tracker_cache.current_content_version()
+        counts = compute_counts()
+        tracker_cache.set_dashboard_counts(counts, version)
+    return counts
+
+def theme_counts(counts, theme_id):
+    """Returns one theme's status counts from a dashboard_counts() payload."""
+    return counts["by_theme"].get(theme_id, EMPTY_THEME_COUNTS)
@@ -0,0 +1,59 @@
+import json
+import logging
+
+from django.conf import settings
+
+logger = logging.getLogger("tracker_app.diagnostics")
+
+# Longest value (in characters) written for a single field.
+MAX_VALUE_LENGTH = 200
+
+
+def diagnostics_enabled(user, action):
+    """Returns True when save diagnostics should be recorded for ``user`` editing ``action``.
+
+    Diagnostics are gated by the ``tracker_app.diagnostics`` logger level
+    (INFO or lower) and, when TRACKER_DIAGNOSTICS_USERS or
+    TRACKER_DIAGNOSTICS_ACTIONS are set, restricted to those usernames or
+    action ids.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return False
+    users = getattr(settings, "TRACKER_DIAGNOSTICS_USERS", [])
+    actions = getattr(settings, "TRACKER_DIAGNOSTICS_ACTIONS", [])
+    if not users and not actions:
+        return True
+    return getattr(user, "username", None) in users or getattr(action, "pk", None) in actions
+
+
+def _clip(value):
+    """Returns a JSON-safe, length-limited representation of a form value."""
+    text = value if isinstance(value, str) else str(value)
+    return text if len(text) <= MAX_VALUE_LENGTH else text[:MAX_VALUE_LENGTH] + "…"
+
+
+def log_action_save(request, action, form, change):
+    """Writes one structured record describing an admin save of ``action``.
+
+    Previous values come from the form's ``initial`` data, so no extra query
+    is made, and only changed fields are included.
+    """
+    if not diagnostics_enabled(request.user, action):
+        return
+    initial = getattr(form, "initial", None) or {}
+    cleaned = getattr(form, "cleaned_data", None) or {}
+    changed = list(getattr(form, "changed_data", []))
+    record = {
+        "event": "action_save",
+        "action": action.pk,
+        "user": getattr(request.user, "username", None),
+        "is_superuser": request.user.is_superuser,
+        "change": change,
+        "changed": {
+            name: {"from": _clip(initial.get(name, "")), "to": _clip(cleaned.get(name, ""))}
+            for name in changed
+        },
+        "status": action.status,
+        "is_approved": action.is_approved,
+    }
+    logger.info("%s", json.dumps(record, default=str, ensure_ascii=False))
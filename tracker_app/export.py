@@ -0,0 +1,80 @@
+"""Row-at-a-time export of every action for reporting.
+
+Rows are read with ``QuerySet.iterator()`` and encoded one line at a time, so
+memory stays flat however many actions there are; both the export view and
+the ``export_actions`` command stream from here.
+"""
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .models import Action
+
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_FORMATS = ("csv", "jsonl")
+
+# Output column -> ORM lookup.
+EXPORT_COLUMNS = {
+    "id": "id",
+    "title": "title",
+    "theme": "objective__theme__title",
+    "theme_ga": "objective__theme__title_ga",
+    "objective": "objective__title",
+    "status": "status",
+    "is_approved": "is_approved",
+    "is_ga_approved": "is_ga_approved",
+    "progress_started_at": "progress_started_at",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "small_description": "small_description",
+    "small_description_ga": "small_description_ga",
+    "description": "description",
+    "description_ga": "description_ga",
+    "update": "update",
+    "update_ga": "update_ga",
+}
+HTML_COLUMNS = ("description", "description_ga", "update", "update_ga")
+
+
+def export_rows(strip_html=False, queryset=None):
+    """Yields one dict per action (ordered by id) keyed by EXPORT_COLUMNS.
+
+    ``strip_html`` reads the stored plain-text copies of HTML_COLUMNS instead.
+    """
+    if queryset is None:
+        queryset = Action.objects.all()
+    lookups = [
+        f"{lookup}_plain" if strip_html and column in HTML_COLUMNS else lookup
+        for column, lookup in EXPORT_COLUMNS.items()
+    ]
+    rows = queryset.order_by("id").values_list(*lookups)
+    for values in rows.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield dict(zip(EXPORT_COLUMNS, values))
+
+
+class _Echo:
+    """File-like object whose write() hands the encoded line straight back."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(rows):
+    """Yields a CSV header followed by one encoded line per row."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_COLUMNS)
+    for row in rows:
+        yield writer.writerow(row.values())
+
+
+def iter_jsonl(rows):
+    """Yields one JSON document per line."""
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n"
+
+
+def iter_export(export_format, strip_html=False, queryset=None):
+    """Yields the encoded export in ``export_format`` (one of EXPORT_FORMATS)."""
+    encode = iter_csv if export_format == "csv" else iter_jsonl
+    return encode(export_rows(strip_html=strip_html, queryset=queryset))
@@ -0,0 +1,54 @@
+from django.db import models
+from django_summernote.fields import SummernoteTextField
+
+from .sanitize import clean_html, plain_text
+
+
+class SanitizedHTMLField(SummernoteTextField):
+    """Summernote rich text sanitized once per write, with a stored plain-text copy.
+
+    SummernoteTextField runs bleach in ``to_python()``, i.e. every time a
+    value is prepared for the database, including lookups. This field cleans
+    the value in ``pre_save()`` instead (saves and ``bulk_create()``), writes
+    the result back to the instance and fills ``plain_field`` with its text,
+    so readers never need to parse the HTML again.
+
+    ``plain_field`` must be declared after this field. Saves limited with
+    ``update_fields`` must list it too; queryset updates go through
+    sanitize_update_kwargs().
+    """
+
+    def __init__(self, *args, plain_field=None, **kwargs):
+        self.plain_field = plain_field
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.plain_field:
+            kwargs["plain_field"] = self.plain_field
+        return name, path, args, kwargs
+
+    def to_python(self, value):
+        # Skip SummernoteTextField's bleach pass; pre_save() does it once.
+        return models.TextField.to_python(self, value)
+
+    def pre_save(self, model_instance, add):
+        value = clean_html(getattr(model_instance, self.attname))
+        setattr(model_instance, self.attname, value)
+        if self.plain_field:
+            setattr(model_instance, self.plain_field, plain_text(value))
+        return value
+
+
+def sanitize_update_kwargs(model, kwargs):
+    """Sanitizes literal rich-text values passed to ``QuerySet.update()`` and adds their plain text.
+
+    Expressions (e.g. ``F()``) are left to the database and do not refresh the
+    plain-text copy.
+    """
+    for field in model._meta.concrete_fields:
+        if isinstance(field, SanitizedHTMLField) and isinstance(kwargs.get(field.name), str):
+            kwargs[field.name] = clean_html(kwargs[field.name])
+            if field.plain_field:
+                kwargs[field.plain_field] = plain_text(kwargs[field.name])
+    return kwargs
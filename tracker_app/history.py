@@ -0,0 +1,133 @@
+"""Writing the ActionStatusEvent log.
+
+Events are appended when a save or queryset update changes an action's
+status or approval (see the receivers in tracker_app.signals), and
+backfill_events() reconstructs a plausible history for actions saved before
+the log existed. Reading the log for the roadmap lives in tracker_app.roadmap.
+"""
+import datetime
+
+from django.utils import timezone
+
+from .models import Action, ActionStatus, ActionStatusEvent
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _last_public_statuses(action_ids):
+    """Returns ``{action id: to_status}`` of each action's latest approved event."""
+    latest = {}
+    rows = (
+        ActionStatusEvent.objects.filter(action_id__in=action_ids, approved=True)
+        .order_by("action_id", "at", "id")
+        .values_list("action_id", "to_status")
+    )
+    for action_id, status in rows:
+        latest[action_id] = status
+    return latest
+
+
+def transition_events(changes, at=None):
+    """Returns the (unsaved) events for ``changes``: ``(action id, before, after)`` triples.
+
+    ``before``/``after`` are ``(status, is_approved)``; ``before`` is None for
+    a new action. An approved action gets an approved event when its status
+    differs from the one the public last saw. An unapproved action gets an
+    unapproved event when its status changed.
+    """
+    at = at or timezone.now()
+    # Actions approved just now: the public saw their last approved status, not the loaded one.
+    newly_approved = [
+        action_id for action_id, before, (_status, approved) in changes if approved and not (before and before[1])
+    ]
+    last_public = _last_public_statuses(newly_approved) if newly_approved else {}
+
+    events = []
+    for action_id, before, (status, approved) in changes:
+        previous_status, was_approved = before or ("", False)
+        if approved:
+            public_status = previous_status if was_approved else last_public.get(action_id, "")
+            if status != public_status:
+                events.append(ActionStatusEvent(
+                    action_id=action_id, from_status=public_status, to_status=status, at=at, approved=True
+                ))
+        elif status != previous_status:
+            events.append(ActionStatusEvent(
+                action_id=action_id, from_status=previous_status, to_status=status, at=at, approved=False
+            ))
+    return events
+
+
+def record_save(action, created):
+    """Logs the transition made by saving ``action`` (if any)."""
+    before = None if created else getattr(action, "_loaded_state", None)
+    if before is None and not created:
+        # Loaded without its status fields (e.g. .only()); compare with the last logged state.
+        last = action.status_events.order_by("-at", "-id").values_list("to_status", "approved").first()
+        before = tuple(last) if last else None
+    events = transition_events([(action.pk, before, (action.status, action.is_approved))])
+    ActionStatusEvent.objects.bulk_create(events)
+    action._loaded_state = (action.status, action.is_approved)
+    return events
+
+
+def record_update(pks, previous_states):
+    """Logs the transitions made by a queryset update, given each row's state before it."""
+    after = Action.objects.filter(pk__in=pks).values_list("pk", "status", "is_approved")
+    changes = [(pk, previous_states.get(pk), (status, approved)) for pk, status, approved in after]
+    events = transition_events(changes)
+    ActionStatusEvent.objects.bulk_create(events, batch_size=BACKFILL_BATCH_SIZE)
+    return events
+
+
+def _midnight(day):
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+
+
+def backfill_events_for(action):
+    """Reconstructs an action's history from its fields; ``action`` is a values() row.
+
+    The action appears (not started) when it was created, starts on
+    ``progress_started_at`` and, if completed, completes at ``updated_at``.
+    An in-progress action without a start date is taken to have started when
+    it was created. All events carry the action's current approval.
+    """
+    approved = action["is_approved"]
+    status = action["status"]
+    created_at = action["created_at"] or action["updated_at"]
+    started = action["progress_started_at"]
+    started_at = _midnight(started) if started else None
+
+    steps = [(ActionStatus.NOT_STARTED, created_at)]
+    if status != ActionStatus.NOT_STARTED:
+        steps.append((ActionStatus.IN_PROGRESS, started_at or created_at))
+    if status == ActionStatus.COMPLETED:
+        steps.append((ActionStatus.COMPLETED, max(action["updated_at"], steps[-1][1])))
+    # A start date before creation (entered retrospectively) opens the history.
+    if status != ActionStatus.NOT_STARTED and started_at and started_at < created_at:
+        steps = [(ActionStatus.IN_PROGRESS, started_at)] + steps[2:]
+
+    events, previous = [], ""
+    for to_status, at in steps:
+        events.append(ActionStatusEvent(
+            action_id=action["id"], from_status=previous, to_status=to_status, at=at, approved=approved
+        ))
+        previous = to_status
+    return events
+
+
+def backfill_events(batch_size=BACKFILL_BATCH_SIZE):
+    """Writes reconstructed histories for every action that has no events yet; returns the count."""
+    fields = ("id", "status", "is_approved", "progress_started_at", "created_at", "updated_at")
+    rows = Action.objects.filter(status_events__isnull=True).order_by("id").values(*fields)
+    written, batch = 0, []
+    for row in rows.iterator(chunk_size=batch_size):
+        batch.extend(backfill_events_for(row))
+        if len(batch) >= batch_size:
+            ActionStatusEvent.objects.bulk_create(batch)
+            written += len(batch)
+            batch = []
+    if batch:
+        ActionStatusEvent.objects.bulk_create(batch)
+        written += len(batch)
+    return written
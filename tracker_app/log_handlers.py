@@ -0,0 +1,47 @@
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+_listeners = []
+
+
+def queue_handlers(names):
+    """Moves the LOGGING handlers called ``names`` behind a queue so logging never blocks on disk I/O.
+
+    Each handler is replaced, on every logger using it, by a QueueHandler;
+    a background QueueListener passes the records on to the original handler,
+    which keeps its level, formatter and rotation. Called from
+    TrackerAppConfig.ready(), after dictConfig() has built the handlers, so
+    LOGGING itself only names stdlib classes. Calling it again is a no-op.
+    """
+    loggers = [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values() if isinstance(logger, logging.Logger)
+    ]
+    replacements = {}
+    for logger in loggers:
+        for index, handler in enumerate(logger.handlers):
+            if handler.get_name() not in names or isinstance(handler, QueueHandler):
+                continue
+            if handler not in replacements:
+                records = queue.SimpleQueue()
+                queued = QueueHandler(records)
+                queued.set_name(handler.get_name())
+                queued.setLevel(handler.level)
+                listener = QueueListener(records, handler, respect_handler_level=True)
+                listener.start()
+                _listeners.append(listener)
+                replacements[handler] = queued
+            logger.handlers[index] = replacements[handler]
+
+
+def _stop_listeners():
+    """Flushes queued records and closes the files at exit."""
+    while _listeners:
+        listener = _listeners.pop()
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(_stop_listeners)
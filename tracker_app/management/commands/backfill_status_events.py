@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from tracker_app.cache import bump_content_version
+from tracker_app.history import BACKFILL_BATCH_SIZE, backfill_events
+from tracker_app.roadmap import events_enabled, refresh_rollups, source_years
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstruct the status history of actions that have none yet from their start date, "
+        "update time and status. Safe to re-run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=BACKFILL_BATCH_SIZE, help="Events written per INSERT.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            written = backfill_events(batch_size=options["batch_size"])
+            if written and events_enabled():
+                # The roadmap reads the log, so its rollups change with the backfill.
+                refresh_rollups(source_years())
+                transaction.on_commit(bump_content_version)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} status event(s)."))
@@ -0,0 +1,66 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from tracker_app.benchmarks import DEFAULT_SIZES, LANGUAGES, check_budgets, compare, run_benchmarks
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the roadmap payload, theme details and action lists at several dataset sizes "
+        "on a throw-away test database, and write the results as JSON. Fails when a result is over "
+        "its query or wall-time budget, or regressed against --compare."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+        parser.add_argument("--repeat", type=int, default=5, help="Timed runs per target (after one warm-up).")
+        parser.add_argument("--languages", nargs="+", default=list(LANGUAGES), choices=LANGUAGES)
+        parser.add_argument("--target", action="append", dest="targets", help="Only run this target (repeatable).")
+        parser.add_argument("--output", "-o", help="Write the JSON here instead of stdout.")
+        parser.add_argument("--keepdb", action="store_true", help="Reuse (and keep) the test database.")
+        parser.add_argument("--compare", metavar="BASELINE", help="Fail on regressions against this earlier JSON report.")
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.25,
+            help="Allowed growth of wall time and peak memory with --compare, as a fraction (default 0.25).",
+        )
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options["compare"]:
+            # Read it before spending minutes on the run.
+            with open(options["compare"], encoding="utf-8") as handle:
+                baseline = json.load(handle)
+
+        setup_test_environment()
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0, keepdb=options["keepdb"])
+        try:
+            report = run_benchmarks(
+                sizes=options["sizes"],
+                repeat=options["repeat"],
+                languages=options["languages"],
+                targets=options["targets"],
+                log=self.stderr.write,
+            )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options["keepdb"])
+            teardown_test_environment()
+
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as handle:
+                handle.write(output + "\n")
+            self.stdout.write(self.style.SUCCESS(f"Wrote {len(report['results'])} result(s) to {options['output']}."))
+        else:
+            self.stdout.write(output)
+
+        problems = check_budgets(report)
+        if baseline is not None:
+            problems += compare(report, baseline, options["tolerance"])
+        if problems:
+            raise CommandError("Benchmarks failed:\n  " + "\n  ".join(problems))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from tracker_app.export import EXPORT_FORMATS, iter_export
+
+
+class Command(BaseCommand):
+    help = "Stream every action (with objective, theme, status, dates and bilingual text) as CSV or JSON lines."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv", dest="export_format")
+        parser.add_argument("--strip-html", action="store_true", help="Export descriptions/updates as plain text.")
+        parser.add_argument("--output", "-o", help="File to write to (defaults to stdout).")
+
+    def handle(self, *args, **options):
+        lines = iter_export(options["export_format"], strip_html=options["strip_html"])
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8", newline="") as output:
+                output.writelines(lines)
+            return
+        for line in lines:
+            self.stdout.write(line, ending="")
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from tracker_app.models import ActionMonthlyStat
+from tracker_app.roadmap import MONTHS, SERIES, live_series, refresh_rollups, rollup_series, source_years
+
+
+class Command(BaseCommand):
+    help = "Rebuild the monthly Roadmap rollups from scratch and verify them against the live aggregation."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only verify the stored rollups; do not rebuild them.",
+        )
+
+    def handle(self, *args, **options):
+        years = source_years() | set(
+            ActionMonthlyStat.objects.values_list("year", flat=True).distinct()
+        )
+
+        if not options["check"]:
+            with transaction.atomic():
+                ActionMonthlyStat.objects.all().delete()
+                refresh_rollups(source_years())
+            self.stdout.write(f"Rebuilt rollups for {len(years)} year(s).")
+
+        mismatches = []
+        for year in sorted(years):
+            stored, live = rollup_series(year), live_series(year)
+            for name in SERIES:
+                for month in MONTHS:
+                    if stored[name][month - 1] != live[name][month - 1]:
+                        mismatches.append(
+                            f"{year}-{month:02d} {name}: stored={stored[name][month - 1]} live={live[name][month - 1]}"
+                        )
+
+        if mismatches:
+            for line in mismatches:
+                self.stderr.write(line)
+            raise CommandError(f"{len(mismatches)} rollup value(s) differ from the live aggregation.")
+        self.stdout.write(self.style.SUCCESS(f"Verified rollups for {len(years)} year(s)."))
@@ -0,0 +1,53 @@
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tracker_app.seeding import BATCH_SIZE, load_spec, seed
+
+DEMO_SPEC = Path(__file__).resolve().parents[2] / "seed_specs" / "demo.json"
+
+
+class Command(BaseCommand):
+    help = (
+        "Upsert themes, objectives and actions from a declarative JSON/YAML spec in one transaction, "
+        "optionally adding a synthetic dataset of any size."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("spec", nargs="?", help=f"Seed spec file (defaults to {DEMO_SPEC.name}).")
+        parser.add_argument(
+            "--synthetic",
+            type=int,
+            metavar="N",
+            help="Generate N synthetic actions (overrides the spec's synthetic count).",
+        )
+        parser.add_argument("--years", type=int, nargs=2, metavar=("FIRST", "LAST"), help="Synthetic date range.")
+        parser.add_argument("--seed", type=int, help="Random seed for synthetic data.")
+        parser.add_argument("--replace", action="store_true", help="Delete all existing actions first.")
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            spec = load_spec(options["spec"] or DEMO_SPEC)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Could not read seed spec: {exc}")
+
+        synthetic = dict(spec.get("synthetic") or {})
+        if options["synthetic"] is not None:
+            synthetic["actions"] = options["synthetic"]
+        if options["years"]:
+            synthetic["years"] = options["years"]
+        if options["seed"] is not None:
+            synthetic["seed"] = options["seed"]
+        spec["synthetic"] = synthetic if synthetic.get("actions") else None
+
+        started = time.perf_counter()
+        try:
+            counts = seed(spec, replace=options["replace"], batch_size=options["batch_size"])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {counts['themes']} theme(s), {counts['objectives']} objective(s) and "
+            f"{counts['actions']} action(s) in {time.perf_counter() - started:.1f}s."
+        ))
@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from tracker_app.notifications import MAX_ATTEMPTS, deliver_pending_notifications
+
+
+class Command(BaseCommand):
+    help = "Deliver queued approval notifications as one digest e-mail per superuser."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--watch",
+            action="store_true",
+            help="Keep running and deliver new notifications every --interval seconds.",
+        )
+        parser.add_argument("--interval", type=int, default=60, help="Seconds between deliveries with --watch.")
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=MAX_ATTEMPTS,
+            help="Give up on notifications that have failed this many times.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            sent = deliver_pending_notifications(max_attempts=options["max_attempts"])
+            self.stdout.write(f"Delivered {sent} approval notification(s).")
+            if not options["watch"]:
+                return
+            time.sleep(options["interval"])
@@ -1,6 +1,31 @@
+import cProfile
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.template.base import Template
 from django.utils import translation
+from django.utils.crypto import constant_time_compare
+from django.utils.text import slugify
 from django.http import HttpResponseRedirect
 
+profiling_logger = logging.getLogger("tracker_app.profiling")
+
+PROFILE_HEADER = "X-Tracker-Profile"
+
+# The profile of the request being handled. Context variables follow the
+# request into sync_to_async() threads, so ORM work done by views run under
+# ASGI is attributed to the right request.
+_current_profile = ContextVar("tracker_request_profile", default=None)
+
 
 class AdminEnglishMiddleware:
     """Force English locale for Django admin only."""
@@ -17,3 +42,212 @@ class AdminEnglishMiddleware:
             request.LANGUAGE_CODE = "en"
         response = self.get_response(request)
         return response
+
+
+class RequestProfile:
+    """Timings collected for one request."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.template_seconds = 0.0
+        self.rendering = False
+
+
+def _record_query(execute, sql, params, many, context):
+    """execute_wrapper() hook: times queries run while a request is being profiled."""
+    profile = _current_profile.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.queries += 1
+        profile.query_seconds += time.perf_counter() - started
+
+
+def _add_query_recorder():
+    """Adds the query hook to this thread's connections and returns them (see _remove_query_recorder())."""
+    wrapped = list(connections.all())
+    for connection in wrapped:
+        connection.execute_wrappers.append(_record_query)
+    return wrapped
+
+
+def _remove_query_recorder(wrapped):
+    for connection in wrapped:
+        connection.execute_wrappers.remove(_record_query)
+
+
+@contextmanager
+def _query_recorder():
+    """Times this thread's queries while the block runs."""
+    wrapped = _add_query_recorder()
+    try:
+        yield
+    finally:
+        _remove_query_recorder(wrapped)
+
+
+def _timed_render(original):
+    """Returns a Template.render() that times top-level renders of profiled requests."""
+
+    @wraps(original)
+    def render(self, context):
+        profile = _current_profile.get()
+        # Included templates render inside their parent; only time the outermost.
+        if profile is None or profile.rendering:
+            return original(self, context)
+        profile.rendering = True
+        started = time.perf_counter()
+        try:
+            return original(self, context)
+        finally:
+            profile.rendering = False
+            profile.template_seconds += time.perf_counter() - started
+
+    return render
+
+
+# Template.render() is only wrapped while at least one profiled request is in
+# flight; the last one to finish puts the original back.
+_template_timer_lock = threading.Lock()
+_template_timer_users = 0
+_original_render = None
+
+
+@contextmanager
+def _template_timer():
+    """Times top-level template renders of profiled requests while the block runs."""
+    global _template_timer_users, _original_render
+    with _template_timer_lock:
+        if _template_timer_users == 0:
+            _original_render = Template.render
+            Template.render = _timed_render(_original_render)
+        _template_timer_users += 1
+    try:
+        yield
+    finally:
+        with _template_timer_lock:
+            _template_timer_users -= 1
+            if _template_timer_users == 0:
+                Template.render = _original_render
+                _original_render = None
+
+
+class ProfilingMiddleware:
+    """Opt-in per-request profiling without DEBUG=True.
+
+    Enabled for every request by ``TRACKER_PROFILING``, or for a single request
+    by sending ``X-Tracker-Profile: <TRACKER_PROFILING_TOKEN>``. A profiled
+    request gets a ``Server-Timing`` header (total, ORM and template time, the
+    query count and response size) and one log line on "tracker_app.profiling".
+    A ``TRACKER_PROFILING_SAMPLE_RATE`` share of profiled requests (all
+    header-enabled ones) also run under cProfile, and the stats are written to
+    ``TRACKER_PROFILING_DIR`` when the request took at least
+    ``TRACKER_PROFILING_SLOW_MS``. Under ASGI, cProfile only sees the event
+    loop thread, so ORM and template work appear as time spent awaiting.
+
+    The query and template hooks are installed only while a profiled request
+    runs, so unprofiled requests cost nothing beyond a settings check.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def _requested_by_header(self, request):
+        token = getattr(settings, "TRACKER_PROFILING_TOKEN", "")
+        return bool(token) and constant_time_compare(request.headers.get(PROFILE_HEADER, ""), token)
+
+    def _start(self, request):
+        """Returns (context token, profiler or None), or None when the request is not profiled."""
+        by_header = self._requested_by_header(request)
+        if not (by_header or getattr(settings, "TRACKER_PROFILING", False)):
+            return None
+        token = _current_profile.set(RequestProfile())
+        profiler = None
+        if by_header or random.random() < getattr(settings, "TRACKER_PROFILING_SAMPLE_RATE", 0):
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                # Another request on this thread is already being profiled (ASGI).
+                profiler = None
+        return token, profiler
+
+    def _finish(self, request, response, started):
+        token, profiler = started
+        if profiler is not None:
+            profiler.disable()
+        profile = _current_profile.get()
+        _current_profile.reset(token)
+
+        total_ms = (time.perf_counter() - profile.started) * 1000
+        db_ms = profile.query_seconds * 1000
+        template_ms = profile.template_seconds * 1000
+        size = None if response.streaming else len(response.content)
+        metrics = [
+            f"total;dur={total_ms:.1f}",
+            f'db;dur={db_ms:.1f};desc="{profile.queries} queries"',
+            f"tpl;dur={template_ms:.1f}",
+        ]
+        if size is not None:
+            metrics.append(f'size;desc="{size} bytes"')
+        response.headers["Server-Timing"] = ", ".join(metrics)
+
+        dump = None
+        if profiler is not None and total_ms >= getattr(settings, "TRACKER_PROFILING_SLOW_MS", 500):
+            directory = Path(getattr(settings, "TRACKER_PROFILING_DIR", settings.BASE_DIR / "logs"))
+            directory.mkdir(parents=True, exist_ok=True)
+            dump = directory / (
+                f"profile-{time.strftime('%Y%m%d-%H%M%S')}-{total_ms:.0f}ms-"
+                f"{slugify(request.path.replace('/', ' '))[:60] or 'root'}.prof"
+            )
+            profiler.dump_stats(dump)
+
+        profiling_logger.info(
+            "%s %s %s total=%.1fms db=%.1fms queries=%d templates=%.1fms size=%s%s",
+            request.method,
+            request.get_full_path(),
+            response.status_code,
+            total_ms,
+            db_ms,
+            profile.queries,
+            template_ms,
+            size if size is not None else "streaming",
+            f" profile={dump}" if dump else "",
+        )
+        return response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = self._start(request)
+        if started is None:
+            return self.get_response(request)
+        with _template_timer(), _query_recorder():
+            # Django turns view exceptions into responses before they get here.
+            response = self.get_response(request)
+        return self._finish(request, response, started)
+
+    async def __acall__(self, request):
+        started = self._start(request)
+        if started is None:
+            return await self.get_response(request)
+        with _template_timer():
+            # Sync views run in this request's thread-sensitive thread, so the
+            # query hook goes on that thread's connections.
+            wrapped = await sync_to_async(_add_query_recorder)()
+            try:
+                # Django turns view exceptions into responses before they get here.
+                response = await self.get_response(request)
+            finally:
+                await sync_to_async(_remove_query_recorder)(wrapped)
+        return self._finish(request, response, started)
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:25
+
+from collections import defaultdict
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+# Status values and series as they were when this migration was written.
+COMPLETED = 'COMPLETED'
+IN_PROGRESS = 'IN_PROGRESS'
+SERIES = ('completed', 'started', 'continued')
+
+
+def build_rollups(apps, schema_editor):
+    """Fills one ActionMonthlyStat row per month of every year with activity.
+
+    Same rules as the live roadmap of the time, over approved actions:
+    completions and in-progress work bucketed by ``updated_at`` (local
+    time), starts by ``progress_started_at``; "continued" counts only work
+    started before that year or with no start date.
+    """
+    Action = apps.get_model('tracker_app', 'Action')
+    ActionMonthlyStat = apps.get_model('tracker_app', 'ActionMonthlyStat')
+    alias = schema_editor.connection.alias
+
+    totals = defaultdict(lambda: {name: [0] * 12 for name in SERIES})
+    rows = (
+        Action.objects.using(alias)
+        .filter(is_approved=True)
+        .values_list('status', 'updated_at', 'progress_started_at')
+        .iterator(chunk_size=2000)
+    )
+    for status, updated_at, started_at in rows:
+        if started_at is not None:
+            totals[started_at.year]['started'][started_at.month - 1] += 1
+        if updated_at is None:
+            continue
+        updated = timezone.localtime(updated_at) if timezone.is_aware(updated_at) else updated_at
+        if status == COMPLETED:
+            totals[updated.year]['completed'][updated.month - 1] += 1
+        elif status == IN_PROGRESS and (started_at is None or started_at.year < updated.year):
+            totals[updated.year]['continued'][updated.month - 1] += 1
+
+    ActionMonthlyStat.objects.using(alias).bulk_create(
+        [
+            ActionMonthlyStat(year=year, month=month, **{name: series[name][month - 1] for name in SERIES})
+            for year, series in sorted(totals.items())
+            for month in range(1, 13)
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker_app', '0008_action_progress_started_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActionMonthlyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('month', models.PositiveSmallIntegerField()),
+                ('completed', models.PositiveIntegerField(default=0)),
+                ('started', models.PositiveIntegerField(default=0)),
+                ('continued', models.PositiveIntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['year', 'month'],
+                'constraints': [models.UniqueConstraint(fields=('year', 'month'), name='unique_action_monthly_stat')],
+            },
+        ),
+        migrations.RunPython(build_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker_app', '0009_action_monthly_stat'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='action',
+            index=models.Index(fields=['status', 'id'], name='action_status_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='action',
+            index=models.Index(fields=['objective', 'status'], name='action_objective_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='action',
+            index=models.Index(fields=['is_approved', 'status', 'updated_at'], name='action_appr_status_upd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='action',
+            index=models.Index(condition=models.Q(('is_approved', True)), fields=['updated_at'], name='action_approved_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='action',
+            index=models.Index(condition=models.Q(('is_approved', True)), fields=['progress_started_at'], name='action_approved_started_idx'),
+        ),
+    ]
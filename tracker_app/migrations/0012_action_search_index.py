@@ -0,0 +1,99 @@
+import html
+import re
+
+from django.db import migrations
+
+
+TEXT_FIELDS_EN = ('small_description', 'description', 'update')
+TEXT_FIELDS_GA = ('small_description_ga', 'description_ga', 'update_ga')
+BATCH_SIZE = 500
+
+# The search tables as tracker_app.search defined them when this migration
+# was written; later changes to that module must not change this migration.
+SQLITE_TABLE = 'tracker_app_action_fts'
+POSTGRES_TABLE = 'tracker_app_action_search'
+POSTGRES_DOCUMENT = (
+    "setweight(to_tsvector('simple', %s), 'A') || "
+    "setweight(to_tsvector('simple', %s), 'B') || "
+    "setweight(to_tsvector('simple', %s), 'B')"
+)
+TAG = re.compile(r'<[^>]*>')
+
+
+def plain_text(value):
+    return ' '.join(html.unescape(TAG.sub(' ', value or '')).split())
+
+
+def _write_batch(cursor, vendor, documents):
+    if vendor == 'sqlite':
+        cursor.executemany(
+            f'INSERT INTO {SQLITE_TABLE} (rowid, title, body_en, body_ga) VALUES (%s, %s, %s, %s)',
+            documents,
+        )
+    else:
+        cursor.executemany(
+            f'INSERT INTO {POSTGRES_TABLE} (action_id, document) VALUES (%s, {POSTGRES_DOCUMENT})',
+            documents,
+        )
+
+
+def build_search_index(apps, schema_editor):
+    # Documents are built from the HTML columns as they exist at this point
+    # (the plain-text copies arrive in 0013).
+    connection = schema_editor.connection
+    if connection.vendor not in ('sqlite', 'postgresql'):
+        return
+
+    Action = apps.get_model('tracker_app', 'Action')
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_TABLE} '
+                "USING fts5(title, body_en, body_ga, tokenize = 'unicode61 remove_diacritics 2')"
+            )
+        else:
+            cursor.execute(
+                f'CREATE TABLE IF NOT EXISTS {POSTGRES_TABLE} ('
+                'action_id bigint PRIMARY KEY REFERENCES tracker_app_action (id) '
+                'ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, '
+                'document tsvector NOT NULL)'
+            )
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS {POSTGRES_TABLE}_document_gin '
+                f'ON {POSTGRES_TABLE} USING GIN (document)'
+            )
+
+        rows = Action.objects.using(connection.alias).values(
+            'id', 'title', *TEXT_FIELDS_EN, *TEXT_FIELDS_GA
+        ).iterator(chunk_size=BATCH_SIZE)
+        batch = []
+        for row in rows:
+            batch.append((
+                row['id'],
+                plain_text(row['title']),
+                ' '.join(plain_text(row[field]) for field in TEXT_FIELDS_EN),
+                ' '.join(plain_text(row[field]) for field in TEXT_FIELDS_GA),
+            ))
+            if len(batch) == BATCH_SIZE:
+                _write_batch(cursor, connection.vendor, batch)
+                batch = []
+        if batch:
+            _write_batch(cursor, connection.vendor, batch)
+
+
+def drop_search_index(apps, schema_editor):
+    table = {'sqlite': SQLITE_TABLE, 'postgresql': POSTGRES_TABLE}.get(schema_editor.connection.vendor)
+    if table:
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {table}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker_app', '0011_approval_notification'),
+    ]
+
+    operations = [
+        migrations.RunPython(build_search_index, drop_search_index),
+    ]
@@ -0,0 +1,135 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:16
+
+import html
+import re
+
+import bleach
+import tracker_app.fields
+from django.core.exceptions import ImproperlyConfigured
+from django.db import migrations, models
+from django_summernote.settings import ALLOWED_TAGS, ATTRIBUTES, STYLES
+
+RICH_TEXT_FIELDS = {
+    'Action': ('description', 'description_ga', 'update', 'update_ga'),
+    'Objective': ('description', 'description_ga'),
+}
+
+# Frozen copies of tracker_app.sanitize.clean_html()/plain_text() as they
+# were when this migration was written, so later changes to the app cannot
+# change what the migration does.
+TAG = re.compile(r'<[^>]*>')
+
+
+def _style_options():
+    try:
+        from bleach.css_sanitizer import CSSSanitizer
+    except ImportError:
+        CSSSanitizer = None
+    if CSSSanitizer is not None:
+        return {'css_sanitizer': CSSSanitizer(allowed_css_properties=STYLES)}
+    if int(bleach.__version__.split('.')[0]) < 5:
+        return {'styles': STYLES}
+    # bleach >= 5 without tinycss2 would strip every inline style from the
+    # stored HTML, and this migration overwrites it in place.
+    raise ImproperlyConfigured(
+        'Migration tracker_app.0013 needs a CSS sanitizer to keep inline styles: '
+        'install tinycss2 (pip install "bleach[css]") and run migrate again.'
+    )
+
+
+def sanitize_existing_rows(apps, schema_editor):
+    """Re-cleans the stored HTML and fills the new plain-text columns."""
+    style_options = _style_options()  # before any row is touched
+
+    def clean_html(value):
+        if not value:
+            return value
+        return bleach.clean(value, tags=ALLOWED_TAGS, attributes=ATTRIBUTES, **style_options)
+
+    def plain_text(value):
+        return ' '.join(html.unescape(TAG.sub(' ', value or '')).split())
+
+    for model_name, fields in RICH_TEXT_FIELDS.items():
+        model = apps.get_model('tracker_app', model_name)
+        manager = model.objects.using(schema_editor.connection.alias)
+        updated = []
+        for row in manager.only('id', *fields).iterator(chunk_size=500):
+            for field in fields:
+                value = clean_html(getattr(row, field))
+                setattr(row, field, value)
+                setattr(row, f'{field}_plain', plain_text(value))
+            updated.append(row)
+        manager.bulk_update(
+            updated, [*fields, *(f'{field}_plain' for field in fields)], batch_size=500
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker_app', '0012_action_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='action',
+            name='description_ga_plain',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='action',
+            name='description_plain',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='action',
+            name='update_ga_plain',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='action',
+            name='update_plain',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='objective',
+            name='description_ga_plain',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='objective',
+            name='description_plain',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AlterField(
+            model_name='action',
+            name='description',
+            field=tracker_app.fields.SanitizedHTMLField(blank=True, default='', plain_field='description_plain'),
+        ),
+        migrations.AlterField(
+            model_name='action',
+            name='description_ga',
+            field=tracker_app.fields.SanitizedHTMLField(blank=True, default='', null=True, plain_field='description_ga_plain', verbose_name='Description (Irish)'),
+        ),
+        migrations.AlterField(
+            model_name='action',
+            name='update',
+            field=tracker_app.fields.SanitizedHTMLField(blank=True, default='', plain_field='update_plain'),
+        ),
+        migrations.AlterField(
+            model_name='action',
+            name='update_ga',
+            field=tracker_app.fields.SanitizedHTMLField(blank=True, default='', null=True, plain_field='update_ga_plain', verbose_name='Update (Irish)'),
+        ),
+        migrations.AlterField(
+            model_name='objective',
+            name='description',
+            field=tracker_app.fields.SanitizedHTMLField(blank=True, default='', plain_field='description_plain'),
+        ),
+        migrations.AlterField(
+            model_name='objective',
+            name='description_ga',
+            field=tracker_app.fields.SanitizedHTMLField(blank=True, default='', null=True, plain_field='description_ga_plain', verbose_name='Description (Irish)'),
+        ),
+        migrations.RunPython(sanitize_existing_rows, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:25
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker_app', '0013_sanitized_rich_text'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActionStatusEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(blank=True, choices=[('NOT_STARTED', 'Inactive'), ('IN_PROGRESS', 'In progress'), ('COMPLETED', 'Completed')], default='', max_length=20)),
+                ('to_status', models.CharField(choices=[('NOT_STARTED', 'Inactive'), ('IN_PROGRESS', 'In progress'), ('COMPLETED', 'Completed')], max_length=20)),
+                ('at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('approved', models.BooleanField(default=False)),
+                ('action', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_events', to='tracker_app.action')),
+            ],
+            options={
+                'ordering': ['at', 'id'],
+                'indexes': [models.Index(condition=models.Q(('approved', True)), fields=['at'], name='status_event_approved_at_idx'), models.Index(fields=['action', 'at'], name='status_event_action_at_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker_app', '0014_action_status_event'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='approvalnotification',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, help_text='When a delivery run took this row; cleared once it finishes.', null=True),
+        ),
+    ]
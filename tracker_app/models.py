@@ -1,10 +1,32 @@
 from django.conf import settings
 from django.db import models
+from django.db.models.functions import Coalesce
+from django.dispatch import Signal
+from django.utils import timezone
 from django.utils.html import strip_tags
-from django_summernote.fields import SummernoteTextField
+from .fields import SanitizedHTMLField, sanitize_update_kwargs
 # NEW IMPORT: Necessary for marking text for the .po file
 from django.utils.translation import gettext_lazy as _
 
+def _localized_text(field, language, ga_condition=None):
+    """Builds an expression yielding ``<field>_ga`` on the Irish site when it has text, else ``field``.
+
+    ``ga_condition`` adds a further requirement (e.g. approved Irish content)
+    before the Irish column is preferred.
+    """
+    english = Coalesce(models.F(field), models.Value(""), output_field=models.TextField())
+    if language != 'ga':
+        return english
+    has_irish = models.Q(**{f"{field}_ga__isnull": False}) & ~models.Q(**{f"{field}_ga": ""})
+    if ga_condition is not None:
+        has_irish &= ga_condition
+    return models.Case(
+        models.When(has_irish, then=models.F(f"{field}_ga")),
+        default=english,
+        output_field=models.TextField(),
+    )
+
+
 class Theme(models.Model):
     """Represents a top-level strategy theme grouping related objectives."""
     title = models.CharField(max_length=200, unique=True)
@@ -16,15 +38,35 @@ class Theme(models.Model):
         return self.title
 
 
+class ObjectiveQuerySet(models.QuerySet):
+    """QuerySet for objectives with language-resolved projections."""
+
+    def with_display_text(self, language):
+        """Annotates ``description_text`` with the same text as ``display_description``."""
+        return self.annotate(description_text=_localized_text("description", language))
+
+    def update(self, **kwargs):
+        return super().update(**sanitize_update_kwargs(self.model, kwargs))
+
+    update.alters_data = True
+
+
 class Objective(models.Model):
     """Defines a single objective within a theme, including bilingual content."""
     title = models.CharField(max_length=200, unique=True)
-    description = SummernoteTextField(default="", blank=True)
+    description = SanitizedHTMLField(default="", blank=True, plain_field="description_plain")
     # New Irish field for Objective Description
-    description_ga = SummernoteTextField(default="", blank=True, null=True, verbose_name=_("Description (Irish)"))
-    
+    description_ga = SanitizedHTMLField(
+        default="", blank=True, null=True, verbose_name=_("Description (Irish)"), plain_field="description_ga_plain"
+    )
+    # Plain-text copies of the descriptions, written by SanitizedHTMLField.
+    description_plain = models.TextField(default="", blank=True, editable=False)
+    description_ga_plain = models.TextField(default="", blank=True, editable=False)
+
     theme = models.ForeignKey(Theme, on_delete=models.CASCADE, related_name='objectives')
 
+    objects = ObjectiveQuerySet.as_manager()
+
     @property
     def display_title(self):
         """Returns Irish title if it exists, otherwise English."""
@@ -59,6 +101,69 @@ class ActionStatus(models.TextChoices):
     COMPLETED   = "COMPLETED",   _("Completed")
 
 
+# Sent after ActionQuerySet.update() with the affected ``pks`` and, when the
+# update set a field the roadmap rollups read, ``previous_rows`` ({pk:
+# ROLLUP_FIELDS values before it}); when it set ``status`` or ``is_approved``,
+# also ``previous_states`` ({pk: (status, is_approved) before it}). Queryset
+# updates bypass post_save, so derived data such as the roadmap rollups
+# listens to this.
+actions_updated = Signal()
+STATE_FIELDS = ("status", "is_approved")
+ROLLUP_FIELDS = STATE_FIELDS + ("updated_at", "progress_started_at")
+
+
+class ActionQuerySet(models.QuerySet):
+    """QuerySet for actions that keeps derived roadmap data in step with bulk updates."""
+
+    def roadmap_years(self):
+        """Returns the distinct years touched by these actions' update/start dates."""
+        years = {day.year for day in self.dates("progress_started_at", "year")}
+        years |= {moment.year for moment in self.datetimes("updated_at", "year")}
+        return years
+
+    def update(self, **kwargs):
+        sanitize_update_kwargs(self.model, kwargs)
+        pks = list(self.values_list("pk", flat=True))
+        if not pks:
+            return super().update(**kwargs)
+        previous_rows = previous_states = None
+        if any(field in kwargs for field in ROLLUP_FIELDS):
+            previous_rows = {pk: tuple(row) for pk, *row in self.values_list("pk", *ROLLUP_FIELDS)}
+        if any(field in kwargs for field in STATE_FIELDS):
+            previous_states = {pk: row[:len(STATE_FIELDS)] for pk, row in previous_rows.items()}
+        rows = super().update(**kwargs)
+        actions_updated.send(
+            sender=self.model, pks=pks, previous_rows=previous_rows, previous_states=previous_states
+        )
+        return rows
+
+    update.alters_data = True
+
+    def with_display_text(self, language):
+        """Annotates ``*_text`` columns matching the ``display_*`` properties, for templates.
+
+        Irish text wins whenever it is filled in; the update is blank until approved.
+        """
+        return self.annotate(
+            small_description_text=_localized_text("small_description", language),
+            description_text=_localized_text("description", language),
+            update_text=models.Case(
+                models.When(is_approved=True, then=_localized_text("update", language)),
+                default=models.Value(""),
+                output_field=models.TextField(),
+            ),
+        )
+
+    def with_api_text(self, language):
+        """Annotates ``*_text`` columns for the JSON lists: Irish only once it is approved."""
+        approved_irish = models.Q(is_ga_approved=True)
+        return self.annotate(
+            small_description_text=_localized_text("small_description", language, approved_irish),
+            description_text=_localized_text("description", language, approved_irish),
+            update_text=_localized_text("update", language, approved_irish),
+        )
+
+
 class Action(models.Model):
     """Represents a single action item tied to an objective, with bilingual fields."""
     title = models.CharField(max_length=200, unique=True)
@@ -78,11 +183,21 @@ class Action(models.Model):
     )
 
     # --- Full Descriptions & Updates ---
-    description = SummernoteTextField(default="", blank=True)
-    description_ga = SummernoteTextField(default="", blank=True, null=True, verbose_name=_("Description (Irish)"))
+    description = SanitizedHTMLField(default="", blank=True, plain_field="description_plain")
+    description_ga = SanitizedHTMLField(
+        default="", blank=True, null=True, verbose_name=_("Description (Irish)"), plain_field="description_ga_plain"
+    )
+
+    update = SanitizedHTMLField(default="", blank=True, editable=True, plain_field="update_plain")
+    update_ga = SanitizedHTMLField(
+        default="", blank=True, null=True, verbose_name=_("Update (Irish)"), plain_field="update_ga_plain"
+    )
 
-    update = SummernoteTextField(default="", blank=True, editable=True)
-    update_ga = SummernoteTextField(default="", blank=True, null=True, verbose_name=_("Update (Irish)"))
+    # --- Plain-text copies of the rich text, written by SanitizedHTMLField ---
+    description_plain = models.TextField(default="", blank=True, editable=False)
+    description_ga_plain = models.TextField(default="", blank=True, editable=False)
+    update_plain = models.TextField(default="", blank=True, editable=False)
+    update_ga_plain = models.TextField(default="", blank=True, editable=False)
 
     objective = models.ForeignKey(
         Objective,
@@ -115,6 +230,35 @@ class Action(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ActionQuerySet.as_manager()
+
+    class Meta:
+        """Indexes matching the public views' and the roadmap's access paths."""
+        indexes = [
+            # Status lists ordered by id (modal list + keyset paging).
+            models.Index(fields=['status', 'id'], name='action_status_id_idx'),
+            # Theme-scoped lists/counts join through objective, then filter status.
+            models.Index(fields=['objective', 'status'], name='action_objective_status_idx'),
+            # Approved actions by status and update time (completed/continued series).
+            models.Index(fields=['is_approved', 'status', 'updated_at'], name='action_appr_status_upd_idx'),
+            # Roadmap year scans only ever look at approved rows.
+            models.Index(fields=['updated_at'], condition=models.Q(is_approved=True), name='action_approved_updated_idx'),
+            models.Index(
+                fields=['progress_started_at'],
+                condition=models.Q(is_approved=True),
+                name='action_approved_started_idx',
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remembers the status and approval as loaded so saves can log what they change."""
+        instance = super().from_db(db, field_names, values)
+        loaded = dict(zip(field_names, values))
+        if all(field in loaded for field in STATE_FIELDS):
+            instance._loaded_state = tuple(loaded[field] for field in STATE_FIELDS)
+        return instance
+
     @property
     def display_small_description(self):
         """Always switches to Irish immediately if text exists."""
@@ -147,4 +291,86 @@ class Action(models.Model):
         """Returns the action title for admin/display contexts."""
         return self.title
 
-    
\ No newline at end of file
+
+class ActionStatusEvent(models.Model):
+    """Append-only log of an action's status transitions.
+
+    Approved events form the public timeline: ``from_status`` is the status
+    the public last saw (blank for the first one), so the roadmap can bucket
+    completions and starts by when they actually happened. Unapproved events
+    record changes still waiting for approval. Written by
+    ``tracker_app.history`` on saves and queryset updates; older actions are
+    backfilled with ``python manage.py backfill_status_events``.
+    """
+    action = models.ForeignKey(Action, on_delete=models.CASCADE, related_name='status_events')
+    from_status = models.CharField(max_length=20, choices=ActionStatus.choices, blank=True, default="")
+    to_status = models.CharField(max_length=20, choices=ActionStatus.choices)
+    at = models.DateTimeField(default=timezone.now)
+    approved = models.BooleanField(default=False)
+
+    class Meta:
+        """Model metadata: chronological, indexed for roadmap range scans and per-action history."""
+        ordering = ['at', 'id']
+        indexes = [
+            # Roadmap series and snapshots only read the public (approved) timeline.
+            models.Index(fields=['at'], condition=models.Q(approved=True), name='status_event_approved_at_idx'),
+            models.Index(fields=['action', 'at'], name='status_event_action_at_idx'),
+        ]
+
+    def __str__(self):
+        """Returns the transition, e.g. "Fix roads: IN_PROGRESS -> COMPLETED"."""
+        return f"{self.action}: {self.from_status or '-'} -> {self.to_status}"
+
+
+class ActionMonthlyStat(models.Model):
+    """Precomputed monthly Roadmap totals, one row per (year, month).
+
+    Each Action write moves the counts of the months it leaves and enters
+    (see ``tracker_app.signals``); rebuild them from the live aggregation in
+    ``tracker_app.roadmap`` with ``python manage.py rebuild_roadmap_rollups``.
+    """
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+    completed = models.PositiveIntegerField(default=0)
+    started = models.PositiveIntegerField(default=0)
+    continued = models.PositiveIntegerField(default=0)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Model metadata: one row per calendar month."""
+        ordering = ['year', 'month']
+        constraints = [
+            models.UniqueConstraint(fields=['year', 'month'], name='unique_action_monthly_stat'),
+        ]
+
+    def __str__(self):
+        """Returns the month this row summarises, e.g. 2026-03."""
+        return f"{self.year}-{self.month:02d}"
+
+
+class ApprovalNotification(models.Model):
+    """Outbox row for a staff progress update that superusers must approve.
+
+    Rows are written by ``ActionAdmin.save_model`` and delivered in batches
+    (one digest per superuser) by ``tracker_app.notifications``.
+    """
+    action = models.ForeignKey(Action, on_delete=models.CASCADE, related_name='approval_notifications')
+    requested_by = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL, related_name='+')
+    update_note = models.CharField(max_length=30, help_text="Which progress text changed, e.g. ENGLISH and IRISH.")
+    admin_url = models.URLField(max_length=500)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    claimed_at = models.DateTimeField(null=True, blank=True, help_text="When a delivery run took this row; cleared once it finishes.")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+
+    class Meta:
+        """Model metadata: oldest first, with an index for the pending queue."""
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['created_at'], condition=models.Q(sent_at__isnull=True), name='approval_pending_idx'),
+        ]
+
+    def __str__(self):
+        """Returns a short description of the pending approval."""
+        return f"{self.action} ({self.update_note})"
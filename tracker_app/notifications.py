@@ -0,0 +1,131 @@
+import datetime
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMessage, get_connection
+from django.db import close_old_connections, transaction
+from django.db.models import F, Q
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import ApprovalNotification
+
+logger = logging.getLogger("tracker_app")
+
+MAX_ATTEMPTS = 5
+# A claimed batch not finished within this long (the run crashed) is picked up again.
+CLAIM_TIMEOUT = datetime.timedelta(minutes=15)
+
+# A single worker thread: deliveries never overlap, and approvals queued while
+# one is running are picked up together by the next run.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="approval-notifications")
+
+
+def queue_update_notification(request, action, update_note):
+    """Records that ``action``'s progress text needs approval and schedules delivery."""
+    notification = ApprovalNotification.objects.create(
+        action=action,
+        requested_by=request.user,
+        update_note=update_note,
+        admin_url=request.build_absolute_uri(reverse('admin:tracker_app_action_change', args=[action.id])),
+    )
+    if getattr(settings, 'APPROVAL_NOTIFICATIONS_IN_PROCESS', False):
+        transaction.on_commit(lambda: _executor.submit(_deliver_in_background))
+    return notification
+
+
+def _deliver_in_background():
+    """Thread entry point: delivers the queue using (and then releasing) its own DB connection."""
+    try:
+        deliver_pending_notifications()
+    except Exception:
+        logger.exception("background approval notification delivery failed")
+    finally:
+        close_old_connections()
+
+
+def build_digest(notifications):
+    """Returns (subject, body) for one digest covering ``notifications``."""
+    if len(notifications) == 1:
+        subject = f"Meath County Council – Action Update Pending Approval: {notifications[0].action.title}"
+    else:
+        subject = f"Meath County Council – {len(notifications)} Action Updates Pending Approval"
+
+    lines = ["Meath County Council – Digital and ICT Strategy Tracker", ""]
+    for notification in notifications:
+        username = notification.requested_by.username if notification.requested_by else "A staff member"
+        lines.append(
+            f"User {username} has updated the {notification.update_note} progress for: {notification.action.title}."
+        )
+        lines.append(f"Please review and approve the update here: {notification.admin_url}")
+        lines.append("")
+    lines.append("Note: Updates are hidden from the public until you click Save.")
+    return subject, "\n".join(lines)
+
+
+def deliver_pending_notifications(max_attempts=MAX_ATTEMPTS):
+    """Sends one digest per superuser covering every pending notification.
+
+    The batch is claimed in one short transaction, mailed with no
+    transaction or row lock held, and marked sent (or failed) in a second
+    one. Failed batches stay pending with ``attempts`` incremented, and are
+    retried on the next run until ``max_attempts`` is reached. Returns the
+    number of notifications delivered.
+    """
+    pending = _claim_pending(max_attempts)
+    if not pending:
+        return 0
+    return _send_digests(pending)
+
+
+def _claim_pending(max_attempts):
+    """Marks the pending notifications as taken by this run and returns them.
+
+    Claims left by a run that died more than CLAIM_TIMEOUT ago are taken over.
+    """
+    claimed_at = timezone.now()
+    claimable = ApprovalNotification.objects.filter(sent_at__isnull=True, attempts__lt=max_attempts).filter(
+        Q(claimed_at__isnull=True) | Q(claimed_at__lt=claimed_at - CLAIM_TIMEOUT)
+    )
+    with transaction.atomic():
+        # The conditional UPDATE is the claim, so a cron run and the in-process
+        # worker never send the same row twice.
+        if not claimable.update(claimed_at=claimed_at):
+            return []
+    return list(
+        ApprovalNotification.objects.filter(claimed_at=claimed_at, sent_at__isnull=True)
+        .select_related('action', 'requested_by')
+    )
+
+
+def _send_digests(pending):
+    """Sends the digest for ``pending`` to every superuser and records the outcome."""
+    ids = [notification.pk for notification in pending]
+    recipients = [
+        email
+        for email in get_user_model().objects.filter(is_superuser=True).values_list('email', flat=True)
+        if email
+    ]
+    if not recipients:
+        logger.warning("%d approval notification(s) pending but no superuser has an email address", len(pending))
+        ApprovalNotification.objects.filter(pk__in=ids).update(claimed_at=None)
+        return 0
+
+    subject, body = build_digest(pending)
+    messages = [EmailMessage(subject, body, settings.DEFAULT_FROM_EMAIL, [email]) for email in recipients]
+    try:
+        get_connection(fail_silently=False).send_messages(messages)
+    except Exception as exc:
+        logger.exception("approval digest delivery failed for %d notification(s)", len(pending))
+        with transaction.atomic():
+            ApprovalNotification.objects.filter(pk__in=ids).update(
+                attempts=F('attempts') + 1, last_error=str(exc)[:1000], claimed_at=None
+            )
+        return 0
+
+    with transaction.atomic():
+        ApprovalNotification.objects.filter(pk__in=ids).update(sent_at=timezone.now(), last_error="", claimed_at=None)
+    logger.info("sent approval digest for %d notification(s) to %d superuser(s)", len(pending), len(recipients))
+    return len(pending)
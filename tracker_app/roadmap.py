@@ -0,0 +1,475 @@
+import datetime
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, Count, F, Max, Q, Value, When, Window
+from django.db.models.functions import RowNumber, Trunc
+from django.utils import timezone
+
+from . import cache as tracker_cache
+from .models import Action, ActionMonthlyStat, ActionStatus, ActionStatusEvent
+
+MONTHS = range(1, 13)
+SERIES = ("completed", "started", "continued")
+GRANULARITIES = ("week", "month", "quarter")
+
+
+def _month_starts(year):
+    """Returns the first day of each month in ``year`` followed by 1 January of the next year."""
+    return [datetime.date(year, month, 1) for month in MONTHS] + [datetime.date(year + 1, 1, 1)]
+
+
+def _aware(day):
+    """Returns midnight of ``day`` in the current timezone (matches TruncMonth bucketing)."""
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+
+
+def range_scope(start, end):
+    """Limits the scan to approved actions updated or started in ``[start, end)`` (dates).
+
+    Uses half-open ranges rather than ``__year`` lookups, and repeats the
+    approval test in each branch, so each side of the OR can be answered from
+    the partial indexes on ``updated_at`` / ``progress_started_at``.
+    """
+    return Q(is_approved=True, updated_at__gte=_aware(start), updated_at__lt=_aware(end)) | Q(
+        is_approved=True, progress_started_at__gte=start, progress_started_at__lt=end
+    )
+
+
+def year_scope(year):
+    """Limits the scan to approved actions updated or started during ``year``."""
+    return range_scope(datetime.date(year, 1, 1), datetime.date(year + 1, 1, 1))
+
+
+def monthly_aggregates(year):
+    """Builds one conditional Count() per series and month of ``year``.
+
+    - completed: status COMPLETED, bucketed by ``updated_at``
+    - started: bucketed by ``progress_started_at``
+    - continued: status IN_PROGRESS, bucketed by ``updated_at``, started
+      before ``year`` (or with no start date recorded)
+    """
+    starts = _month_starts(year)
+    started_earlier = Q(progress_started_at__lt=starts[0]) | Q(progress_started_at__isnull=True)
+    expressions = {}
+    for month in MONTHS:
+        day_from, day_to = starts[month - 1], starts[month]
+        updated_in_month = Q(updated_at__gte=_aware(day_from), updated_at__lt=_aware(day_to))
+        expressions[f"completed_{month}"] = Count(
+            "id", filter=updated_in_month & Q(status=ActionStatus.COMPLETED)
+        )
+        expressions[f"started_{month}"] = Count(
+            "id", filter=Q(progress_started_at__gte=day_from, progress_started_at__lt=day_to)
+        )
+        expressions[f"continued_{month}"] = Count(
+            "id", filter=updated_in_month & Q(status=ActionStatus.IN_PROGRESS) & started_earlier
+        )
+    return expressions
+
+
+def series_from_row(row):
+    """Unpacks an aggregate row into ``{series: [12 monthly counts]}``."""
+    return {name: [row.get(f"{name}_{month}") or 0 for month in MONTHS] for name in SERIES}
+
+
+def monthly_series(year, queryset=None):
+    """Computes the completed/started/continued monthly series for ``year`` in a single query."""
+    if queryset is None:
+        queryset = Action.objects.all()
+    row = queryset.filter(year_scope(year)).aggregate(**monthly_aggregates(year))
+    return series_from_row(row)
+
+
+def theme_monthly_series(year):
+    """Computes the monthly series of ``year`` per theme in a single grouped query.
+
+    Returns a compact themes x months matrix: ``{"year", "theme_ids": [...],
+    series: [[12 counts] per theme]}``, rows in ``theme_ids`` order. Themes
+    without activity in ``year`` are left out (see theme_series()). Reads the
+    action fields, like monthly_series(); theme_event_series() is the event
+    log equivalent.
+    """
+    return _theme_matrix(year, list(_theme_rows(year)))
+
+def _theme_rows(year):
+    return (
+        Action.objects.filter(year_scope(year))
+        .order_by("objective__theme_id")
+        .values("objective__theme_id")
+        .annotate(**monthly_aggregates(year))
+    )
+
+
+def _theme_matrix(year, rows):
+    per_theme = [series_from_row(row) for row in rows]
+    return {
+        "year": year,
+        "theme_ids": [row["objective__theme_id"] for row in rows],
+        **{name: [series[name] for series in per_theme] for name in SERIES},
+    }
+
+
+def theme_roadmap(year):
+    """Returns the per-theme matrix of ``year`` from the configured source (see events_enabled()).
+
+    Served from the cache while the content is unchanged (open_current_month()
+    moves the content on when a new month opens for the event source).
+    """
+    open_current_month()
+    matrix = tracker_cache.get_theme_roadmap(year)
+    if matrix is None:
+        version = tracker_cache.current_content_version()
+        matrix = theme_event_series(year) if events_enabled() else theme_monthly_series(year)
+        tracker_cache.set_theme_roadmap(year, matrix, version)
+    return matrix
+
+def theme_series(matrix, theme_id):
+    """Returns one theme's ``{"year", series: [12 counts]}`` from a theme_monthly_series() matrix."""
+    try:
+        position = matrix["theme_ids"].index(theme_id)
+    except ValueError:
+        return {"year": matrix["year"], **{name: [0] * 12 for name in SERIES}}
+    return {"year": matrix["year"], **{name: matrix[name][position] for name in SERIES}}
+
+
+def events_enabled():
+    """Whether the roadmap is computed from the ActionStatusEvent log (``TRACKER_ROADMAP_SOURCE``)."""
+    return getattr(settings, "TRACKER_ROADMAP_SOURCE", "fields") == "events"
+
+
+def _public_statuses(as_of, log=None):
+    """Yields ``(action id, status)`` for the latest approved event of each action before ``as_of``."""
+    log = ActionStatusEvent.objects.all() if log is None else log
+    latest = (
+        log.filter(approved=True, at__lt=as_of)
+        .annotate(rank=Window(RowNumber(), partition_by=[F("action_id")], order_by=[F("at").desc(), F("id").desc()]))
+        .filter(rank=1)
+        .values_list("action_id", "to_status")
+    )
+    return latest.iterator()
+
+
+def status_snapshot(as_of):
+    """Returns ``{status: number of actions}`` as the public saw them at ``as_of`` (a datetime).
+
+    Reads the approved events before ``as_of``, newest per action, in one query.
+    """
+    counts = Counter(status for _action_id, status in _public_statuses(as_of))
+    return {status: counts[status] for status in ActionStatus.values}
+
+
+def event_series(year):
+    """Computes the completed/started/continued monthly series for ``year`` from the event log.
+
+    - completed: actions whose public status became COMPLETED that month
+    - started: actions that left NOT_STARTED (or appeared already started)
+      that month
+    - continued: actions already in progress on 1 January that were still in
+      progress at the end of the month (zero for months yet to come)
+
+    Costs two queries: the year's approved events (a range scan on ``at``)
+    and the in-progress snapshot at the start of the year.
+    """
+    return _event_series_between([_aware(day) for day in _month_starts(year)])
+
+
+def _event_series_between(bounds):
+    """event_series() over the buckets ``[bounds[i], bounds[i + 1])`` (aware datetimes)."""
+    return {name: [len(actions) for actions in buckets] for name, buckets in _event_buckets(bounds).items()}
+
+
+def _event_buckets(bounds, log=None):
+    """Returns ``{series: [set of action ids per bucket]}`` from the event log (see event_series()).
+
+    ``log`` narrows the ActionStatusEvent rows read (e.g. to some actions).
+    """
+    log = ActionStatusEvent.objects.all() if log is None else log
+    buckets = len(bounds) - 1
+    carried = {
+        action_id for action_id, status in _public_statuses(bounds[0], log) if status == ActionStatus.IN_PROGRESS
+    }
+    events = (
+        log.filter(approved=True, at__gte=bounds[0], at__lt=bounds[-1])
+        .order_by("at", "id")
+        .values_list("action_id", "from_status", "to_status", "at")
+    )
+
+    completed = [set() for _bucket in range(buckets)]
+    started = [set() for _bucket in range(buckets)]
+    continued = [set() for _bucket in range(buckets)]
+    still_carried = set(carried)
+    now = timezone.now()
+    bucket = 0
+
+    def close_buckets(until):
+        nonlocal bucket
+        while bucket < buckets and bounds[bucket + 1] <= until:
+            if bounds[bucket] <= now:
+                continued[bucket] = set(still_carried)
+            bucket += 1
+
+    for action_id, from_status, to_status, at in events.iterator():
+        close_buckets(at)
+        if to_status == ActionStatus.COMPLETED:
+            completed[bucket].add(action_id)
+        if from_status in ("", ActionStatus.NOT_STARTED) and to_status != ActionStatus.NOT_STARTED:
+            started[bucket].add(action_id)
+        if action_id in carried:
+            if to_status == ActionStatus.IN_PROGRESS:
+                still_carried.add(action_id)
+            else:
+                still_carried.discard(action_id)
+    close_buckets(bounds[-1])
+
+    return {"completed": completed, "started": started, "continued": continued}
+
+
+def theme_event_series(year):
+    """Computes theme_monthly_series()'s themes x months matrix from the event log.
+
+    Same rules as event_series(), split by each action's current theme.
+    Costs three queries: event_series()'s two and one for the themes of the
+    actions that appear.
+    """
+    buckets = _event_buckets([_aware(day) for day in _month_starts(year)])
+    action_ids = set().union(*(actions for series in buckets.values() for actions in series))
+    theme_of = dict(Action.objects.filter(pk__in=action_ids).values_list("id", "objective__theme_id"))
+
+    per_theme = {}
+    for name, series in buckets.items():
+        for month, actions in enumerate(series):
+            for theme_id in map(theme_of.get, actions):
+                if theme_id is not None:
+                    per_theme.setdefault(theme_id, {key: [0] * 12 for key in SERIES})[name][month] += 1
+    theme_ids = sorted(per_theme)
+    return {
+        "year": year,
+        "theme_ids": theme_ids,
+        **{name: [per_theme[theme_id][name] for theme_id in theme_ids] for name in SERIES},
+    }
+
+
+def truncate_date(day, granularity):
+    """Returns the first day of the week (Monday), month or quarter containing ``day``."""
+    if granularity == "week":
+        return day - datetime.timedelta(days=day.weekday())
+    if granularity == "quarter":
+        return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+    return day.replace(day=1)
+
+
+def _next_bucket(day, granularity):
+    if granularity == "week":
+        return day + datetime.timedelta(weeks=1)
+    months = day.month - 1 + (3 if granularity == "quarter" else 1)
+    return datetime.date(day.year + months // 12, months % 12 + 1, 1)
+
+
+def bucket_starts(start, end, granularity):
+    """Returns the truncated start date of every bucket overlapping ``[start, end)``."""
+    starts, day = [], truncate_date(start, granularity)
+    while day < end:
+        starts.append(day)
+        day = _next_bucket(day, granularity)
+    return starts
+
+
+def field_range_series(start, end, granularity):
+    """Computes the series over ``[start, end)`` per bucket from the action fields.
+
+    Same definitions as monthly_aggregates(), with "continued" counting work
+    started before ``start``. Two grouped queries, each filtered by a
+    half-open range and bucketed with Trunc(): one over ``updated_at``
+    (completed/continued) and one over ``progress_started_at`` (started).
+    """
+    starts = bucket_starts(start, end, granularity)
+    index = {day: position for position, day in enumerate(starts)}
+    series = {name: [0] * len(starts) for name in SERIES}
+    approved = Action.objects.filter(is_approved=True).order_by()
+
+    updated = (
+        approved.filter(updated_at__gte=_aware(start), updated_at__lt=_aware(end))
+        .annotate(bucket=Trunc("updated_at", granularity))
+        .values("bucket")
+        .annotate(
+            completed=Count("id", filter=Q(status=ActionStatus.COMPLETED)),
+            continued=Count(
+                "id",
+                filter=Q(status=ActionStatus.IN_PROGRESS)
+                & (Q(progress_started_at__lt=start) | Q(progress_started_at__isnull=True)),
+            ),
+        )
+    )
+    for row in updated:
+        position = index[timezone.localtime(row["bucket"]).date()]
+        series["completed"][position] += row["completed"]
+        series["continued"][position] += row["continued"]
+
+    started = (
+        approved.filter(progress_started_at__gte=start, progress_started_at__lt=end)
+        .annotate(bucket=Trunc("progress_started_at", granularity))
+        .values("bucket")
+        .annotate(started=Count("id"))
+    )
+    for row in started:
+        series["started"][index[row["bucket"]]] += row["started"]
+    return series
+
+
+def range_series(start, end, granularity):
+    """Returns ``(bucket start dates, series)`` over ``[start, end)`` from the configured source."""
+    starts = bucket_starts(start, end, granularity)
+    if events_enabled():
+        bounds = [_aware(start)] + [_aware(day) for day in starts[1:]] + [_aware(end)]
+        return starts, _event_series_between(bounds)
+    return starts, field_range_series(start, end, granularity)
+
+
+def live_series(year):
+    """Returns the series for ``year`` from the configured source (see events_enabled())."""
+    return event_series(year) if events_enabled() else monthly_series(year)
+
+
+def source_years():
+    """Returns the years the configured roadmap source has data for."""
+    if not events_enabled():
+        return Action.objects.roadmap_years()
+    first = ActionStatusEvent.objects.filter(approved=True).datetimes("at", "year").first()
+    # In-progress work carries into every later year (the "continued" series).
+    return set(range(first.year, timezone.localtime().year + 1)) if first else set()
+
+
+def refresh_rollups(years):
+    """Recomputes the ActionMonthlyStat rows for each of ``years`` from the live aggregation.
+
+    Costs one aggregate query (two with the event source) and one upsert per
+    year, whatever the table size; for the migration, rebuilds and bulk loads.
+    Single writes move the rows with apply_rollup_deltas() instead.
+    """
+    from_events = events_enabled()
+    for year in sorted(years):
+        series = event_series(year) if from_events else monthly_series(year)
+        rows = [
+            ActionMonthlyStat(year=year, month=month, **{name: series[name][month - 1] for name in SERIES})
+            for month in MONTHS
+        ]
+        with transaction.atomic():
+            ActionMonthlyStat.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=["year", "month"],
+                update_fields=list(SERIES) + ["refreshed_at"],
+            )
+
+
+def open_current_month():
+    """Refreshes the event-source rollups once a month has started since they were last written.
+
+    The event source counts "continued" only for months already under way
+    (see event_series()), so a month reached without any write since would
+    keep reading 0. The first read or write in the new month recomputes the
+    years from the last write on. One query when nothing is due; a no-op for
+    the field source, whose months only change with the actions.
+    """
+    if not events_enabled():
+        return
+    now = timezone.localtime()
+    last = ActionMonthlyStat.objects.aggregate(last=Max("refreshed_at"))["last"]
+    if last is None or last >= _aware(now.date().replace(day=1)):
+        return
+    refresh_rollups(range(timezone.localtime(last).year, now.year + 1))
+    transaction.on_commit(tracker_cache.bump_content_version)
+
+
+def field_contributions(rows):
+    """Returns the rollup cells ``rows`` count towards, as ``Counter({(year, month, series): n})``.
+
+    ``rows`` are ROLLUP_FIELDS values ``(status, is_approved, updated_at,
+    progress_started_at)``, counted with monthly_aggregates()' rules one
+    action at a time.
+    """
+    cells = Counter()
+    for status, approved, updated_at, started_at in rows:
+        if not approved:
+            continue
+        if started_at is not None:
+            cells[started_at.year, started_at.month, "started"] += 1
+        if updated_at is None:
+            continue
+        updated = timezone.localtime(updated_at) if timezone.is_aware(updated_at) else updated_at
+        if status == ActionStatus.COMPLETED:
+            cells[updated.year, updated.month, "completed"] += 1
+        elif status == ActionStatus.IN_PROGRESS and (started_at is None or started_at.year < updated.year):
+            cells[updated.year, updated.month, "continued"] += 1
+    return cells
+
+
+def event_contributions(action_ids, years, exclude=()):
+    """Returns the rollup cells the events of ``action_ids`` count towards in ``years``.
+
+    Same cells as field_contributions(), with event_series()' rules over
+    those actions' events only, leaving out the events whose ids are in
+    ``exclude``. Costs two queries per year.
+    """
+    log = ActionStatusEvent.objects.filter(action_id__in=action_ids)
+    if exclude:
+        log = log.exclude(pk__in=exclude)
+    cells = Counter()
+    for year in years:
+        buckets = _event_buckets([_aware(day) for day in _month_starts(year)], log)
+        for name, series in buckets.items():
+            for month, actions in enumerate(series, 1):
+                if actions:
+                    cells[year, month, name] += len(actions)
+    return cells
+
+
+def apply_rollup_deltas(before, after):
+    """Moves the ActionMonthlyStat counts from the cells in ``before`` to those in ``after``.
+
+    Both come from field_contributions() or event_contributions() for the
+    same actions. Only the difference is written, with F() expressions: at
+    most one INSERT for missing months and one UPDATE, however many actions
+    or months changed.
+    """
+    deltas = Counter(after)
+    deltas.subtract(before)
+    changed = {}
+    for (year, month, name), delta in deltas.items():
+        if delta:
+            changed.setdefault((year, month), {})[name] = delta
+    if not changed:
+        return
+
+    ActionMonthlyStat.objects.bulk_create(
+        [ActionMonthlyStat(year=year, month=month) for year, month in changed], ignore_conflicts=True
+    )
+    months = Q()
+    for year, month in changed:
+        months |= Q(year=year, month=month)
+    updates = {}
+    for name in SERIES:
+        whens = [
+            When(year=year, month=month, then=Value(delta[name]))
+            for (year, month), delta in changed.items()
+            if name in delta
+        ]
+        if whens:
+            updates[name] = F(name) + Case(*whens, default=Value(0))
+    ActionMonthlyStat.objects.filter(months).update(**updates, refreshed_at=timezone.now())
+
+
+def _series_from_rollup_rows(rows):
+    """Folds ``(month, completed, started, continued)`` rows into 12-month series."""
+    series = {name: [0] * 12 for name in SERIES}
+    for month, *totals in rows:
+        for name, total in zip(SERIES, totals):
+            series[name][month - 1] = total
+    return series
+
+
+def rollup_series(year):
+    """Reads the monthly series for ``year`` from the 12 precomputed rollup rows."""
+    open_current_month()
+    return _series_from_rollup_rows(ActionMonthlyStat.objects.filter(year=year).values_list("month", *SERIES))
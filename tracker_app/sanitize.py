@@ -0,0 +1,45 @@
+"""Sanitizing Summernote HTML and deriving its plain text.
+
+Both run once, when a rich-text field is written (see
+tracker_app.fields.SanitizedHTMLField); templates and the JSON API then
+serve the stored values as they are.
+"""
+import html
+import re
+
+import bleach
+from django_summernote.settings import ALLOWED_TAGS, ATTRIBUTES, STYLES
+
+try:
+    from bleach.css_sanitizer import CSSSanitizer
+except ImportError:  # bleach < 5, or bleach >= 5 without tinycss2
+    CSSSanitizer = None
+
+if CSSSanitizer is not None:
+    _STYLE_OPTIONS = {"css_sanitizer": CSSSanitizer(allowed_css_properties=STYLES)}
+elif int(bleach.__version__.split(".")[0]) < 5:
+    _STYLE_OPTIONS = {"styles": STYLES}
+else:
+    # Without a CSS sanitizer bleach >= 5 drops style values instead of
+    # filtering them; the tracker_app.E002 system check reports this.
+    _STYLE_OPTIONS = {}
+
+_TAG = re.compile(r"<[^>]*>")
+
+
+def keeps_inline_styles():
+    """Returns True when clean_html() filters inline styles rather than dropping them."""
+    return bool(_STYLE_OPTIONS)
+
+
+def clean_html(value):
+    """Returns ``value`` restricted to the tags, attributes and styles Summernote allows."""
+    if not value:
+        return value
+    return bleach.clean(value, tags=ALLOWED_TAGS, attributes=ATTRIBUTES, **_STYLE_OPTIONS)
+
+
+def plain_text(value):
+    """Returns Summernote HTML as whitespace-normalised plain text."""
+    # Tags become spaces so "<p>one</p><p>two</p>" does not read as "onetwo".
+    return " ".join(html.unescape(_TAG.sub(" ", value or "")).split())
@@ -0,0 +1,202 @@
+"""Full-text search over actions.
+
+Each action has one row in a side index built from its English and Irish
+text, using the plain-text copies stored next to the rich-text fields:
+
+- SQLite: an FTS5 table (``tracker_app_action_fts``) whose rowid is the
+  action id, ranked with bm25().
+- PostgreSQL: a table of ``tsvector`` documents (``tracker_app_action_search``)
+  with a GIN index, ranked with ts_rank_cd().
+
+Titles weigh more than descriptions/updates. The index is created and filled
+by migration 0012 and kept in step with saves, deletes and queryset updates
+by tracker_app.signals. Other database backends fall back to a title match.
+"""
+import re
+
+from django.db import connection as default_connection
+
+from .models import Action
+from .sanitize import plain_text
+
+SQLITE_TABLE = "tracker_app_action_fts"
+POSTGRES_TABLE = "tracker_app_action_search"
+
+TEXT_FIELDS_EN = ("small_description", "description_plain", "update_plain")
+TEXT_FIELDS_GA = ("small_description_ga", "description_ga_plain", "update_ga_plain")
+INDEXED_FIELDS = ("id", "title") + TEXT_FIELDS_EN + TEXT_FIELDS_GA
+
+MAX_TERMS = 8
+WRITE_BATCH_SIZE = 500
+_TERM = re.compile(r"\w+")
+
+# Shared by both backends: title is weighted 'A', English/Irish bodies 'B'.
+_POSTGRES_DOCUMENT = (
+    "setweight(to_tsvector('simple', %s), 'A') || "
+    "setweight(to_tsvector('simple', %s), 'B') || "
+    "setweight(to_tsvector('simple', %s), 'B')"
+)
+
+
+def document_for(values):
+    """Returns ``(id, title, english body, irish body)`` for one action's field values."""
+    return (
+        values["id"],
+        plain_text(values["title"]),
+        " ".join(filter(None, (values[field] for field in TEXT_FIELDS_EN))),
+        " ".join(filter(None, (values[field] for field in TEXT_FIELDS_GA))),
+    )
+
+
+def query_terms(query):
+    """Splits user input into lower-cased word terms; punctuation and operators are dropped."""
+    return _TERM.findall((query or "").lower())[:MAX_TERMS]
+
+
+def create_index(connection=default_connection):
+    """Creates the backend's search table (no-op on unsupported backends)."""
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_TABLE} "
+                "USING fts5(title, body_en, body_ga, tokenize = 'unicode61 remove_diacritics 2')"
+            )
+        elif connection.vendor == "postgresql":
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {POSTGRES_TABLE} ("
+                "action_id bigint PRIMARY KEY REFERENCES tracker_app_action (id) "
+                "ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, "
+                "document tsvector NOT NULL)"
+            )
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {POSTGRES_TABLE}_document_gin "
+                f"ON {POSTGRES_TABLE} USING GIN (document)"
+            )
+
+
+def drop_index(connection=default_connection):
+    """Drops the backend's search table."""
+    table = {"sqlite": SQLITE_TABLE, "postgresql": POSTGRES_TABLE}.get(connection.vendor)
+    if table:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+
+
+def write_documents(documents, connection=default_connection):
+    """Inserts or replaces the index rows for ``documents`` (see document_for()).
+
+    Accepts any iterable and writes it in batches of WRITE_BATCH_SIZE.
+    """
+    if connection.vendor not in ("sqlite", "postgresql"):
+        return
+    batch = []
+    for document in documents:
+        batch.append(document)
+        if len(batch) == WRITE_BATCH_SIZE:
+            _write_batch(batch, connection)
+            batch = []
+    if batch:
+        _write_batch(batch, connection)
+
+
+def _write_batch(documents, connection):
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            # FTS5 has no upsert; replace the rows explicitly.
+            ids = [document[0] for document in documents]
+            cursor.execute(
+                f"DELETE FROM {SQLITE_TABLE} WHERE rowid IN ({', '.join(['%s'] * len(ids))})", ids
+            )
+            cursor.executemany(
+                f"INSERT INTO {SQLITE_TABLE} (rowid, title, body_en, body_ga) VALUES (%s, %s, %s, %s)",
+                documents,
+            )
+        else:
+            cursor.executemany(
+                f"INSERT INTO {POSTGRES_TABLE} (action_id, document) VALUES (%s, {_POSTGRES_DOCUMENT}) "
+                "ON CONFLICT (action_id) DO UPDATE SET document = EXCLUDED.document",
+                documents,
+            )
+
+
+def index_action(action):
+    """Re-indexes a saved action from its in-memory field values (no extra read)."""
+    write_documents([document_for({field: getattr(action, field) for field in INDEXED_FIELDS})])
+
+
+def reindex_actions(pks):
+    """Re-indexes the given actions from the database (used after queryset updates)."""
+    write_documents(document_for(row) for row in Action.objects.filter(pk__in=pks).values(*INDEXED_FIELDS))
+
+
+def rebuild_index(connection=default_connection):
+    """Re-indexes every action from scratch (after bulk loads that bypass signals)."""
+    table = {"sqlite": SQLITE_TABLE, "postgresql": POSTGRES_TABLE}.get(connection.vendor)
+    if not table:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {table}")
+    rows = Action.objects.values(*INDEXED_FIELDS).iterator(chunk_size=WRITE_BATCH_SIZE)
+    write_documents((document_for(row) for row in rows), connection)
+
+
+def remove_actions(pks, connection=default_connection):
+    """Drops deleted actions from the index."""
+    pks = list(pks)
+    if not pks or connection.vendor != "sqlite":
+        # PostgreSQL rows go with the action through ON DELETE CASCADE.
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SQLITE_TABLE} WHERE rowid IN ({', '.join(['%s'] * len(pks))})", pks)
+
+
+def search(query, limit, offset=0, connection=default_connection):
+    """Returns ``(match count, [action ids of the requested page])``, best match first.
+
+    Every term must match, as a word prefix, in the title or either language.
+    An ``offset`` past the last match is moved to the start of the last page,
+    so out-of-range page numbers never reach the database.
+    """
+    terms = query_terms(query)
+    if not terms:
+        return 0, []
+
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            match = " ".join(f'"{term}"*' for term in terms)
+            cursor.execute(f"SELECT COUNT(*) FROM {SQLITE_TABLE} WHERE {SQLITE_TABLE} MATCH %s", [match])
+            count = cursor.fetchone()[0]
+            offset = _last_page_offset(offset, count, limit)
+            cursor.execute(
+                f"SELECT rowid FROM {SQLITE_TABLE} WHERE {SQLITE_TABLE} MATCH %s "
+                f"ORDER BY bm25({SQLITE_TABLE}, 5.0, 1.0, 1.0), rowid LIMIT %s OFFSET %s",
+                [match, limit, offset],
+            )
+            return count, [row[0] for row in cursor.fetchall()]
+
+        if connection.vendor == "postgresql":
+            tsquery = " & ".join(f"{term}:*" for term in terms)
+            cursor.execute(
+                f"SELECT COUNT(*) FROM {POSTGRES_TABLE} WHERE document @@ to_tsquery('simple', %s)", [tsquery]
+            )
+            count = cursor.fetchone()[0]
+            offset = _last_page_offset(offset, count, limit)
+            cursor.execute(
+                f"SELECT action_id FROM {POSTGRES_TABLE}, to_tsquery('simple', %s) AS query "
+                "WHERE document @@ query ORDER BY ts_rank_cd(document, query) DESC, action_id "
+                "LIMIT %s OFFSET %s",
+                [tsquery, limit, offset],
+            )
+            return count, [row[0] for row in cursor.fetchall()]
+
+    matches = Action.objects.order_by("id")
+    for term in terms:
+        matches = matches.filter(title__icontains=term)
+    count = matches.count()
+    offset = _last_page_offset(offset, count, limit)
+    return count, list(matches.values_list("id", flat=True)[offset:offset + limit])
+
+
+def _last_page_offset(offset, count, limit):
+    """Returns ``offset``, or the offset of the last page of ``count`` matches if it is past the end."""
+    return max(min(offset, (max(count, 1) - 1) // limit * limit), 0)
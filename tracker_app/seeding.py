@@ -0,0 +1,279 @@
+"""Declarative, idempotent seeding of themes, objectives and actions.
+
+A spec (JSON, or YAML when PyYAML is installed) lists themes with their
+objectives and actions, and/or asks for a synthetic dataset::
+
+    {
+      "themes": [
+        {"title": "Digital services", "title_ga": "Seirbhísí digiteacha",
+         "objectives": [
+           {"title": "Digital services objective", "description": "...",
+            "actions": [
+              {"title": "Launch the online portal", "status": "IN_PROGRESS",
+               "progress_started_at": "2025-01-15", "is_approved": true}
+            ]}
+         ]}
+      ],
+      "synthetic": {"actions": 100000, "years": [2024, 2026], "seed": 1}
+    }
+
+Synthetic actions are spread over the spec's objectives, or over generated
+themes/objectives (``themes`` x ``objectives_per_theme``) when the spec has
+none. Rows are upserted on their unique titles with ``bulk_create`` in one
+transaction, so re-running a spec updates rows rather than duplicating them.
+Bulk writes bypass signals, so the roadmap rollups, the search index and the
+content version are rebuilt once at the end.
+"""
+import datetime
+import json
+import random
+from pathlib import Path
+
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from . import history, search
+from .cache import bump_content_version
+from .models import Action, ActionMonthlyStat, ActionStatus, Objective, Theme
+from .roadmap import refresh_rollups, source_years
+from .signals import suspend_derived_updates
+
+BATCH_SIZE = 1000
+ACTION_FIELDS = (
+    "small_description",
+    "small_description_ga",
+    "description",
+    "description_ga",
+    "update",
+    "update_ga",
+    "status",
+    "progress_started_at",
+    "is_approved",
+    "is_ga_approved",
+)
+# Written by SanitizedHTMLField.pre_save() alongside the rich text, so upserts
+# must update them too.
+ACTION_PLAIN_FIELDS = ("description_plain", "description_ga_plain", "update_plain", "update_ga_plain")
+OBJECTIVE_PLAIN_FIELDS = ("description_plain", "description_ga_plain")
+TIMESTAMP_FIELDS = ("created_at", "updated_at")
+
+_WORDS_EN = "council digital service community access online support local plan review network skills data".split()
+_WORDS_GA = "comhairle digiteach seirbhís pobal rochtain ar líne tacaíocht áitiúil plean athbhreithniú líonra scileanna sonraí".split()
+
+
+def load_spec(path):
+    """Reads a seed spec from a ``.json`` or ``.yaml``/``.yml`` file."""
+    path = Path(path)
+    text = path.read_text(encoding="utf-8")
+    if path.suffix.lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("Install PyYAML to load YAML seed specs, or use JSON.")
+        return yaml.safe_load(text) or {}
+    return json.loads(text)
+
+
+def _words(rng, vocabulary, count):
+    return " ".join(rng.choices(vocabulary, k=count)).capitalize() + "."
+
+
+def synthetic_rows(options, objectives=None):
+    """Generates ``(themes, objectives, actions)`` row dicts for a synthetic dataset.
+
+    Deterministic for a given ``seed``; dates fall between 1 January of the
+    first year and the end of the last year (or now, if earlier).
+    """
+    rng = random.Random(options.get("seed", 0))
+    now = timezone.now()
+    first_year, last_year = options.get("years", [now.year - 2, now.year])
+    start = timezone.make_aware(datetime.datetime(first_year, 1, 1))
+    end = min(timezone.make_aware(datetime.datetime(last_year + 1, 1, 1)), now)
+    span = (end - start).total_seconds()
+
+    themes = []
+    if not objectives:
+        objectives = []
+        for t in range(1, options.get("themes", 4) + 1):
+            theme_title = f"Synthetic theme {t:02d}"
+            themes.append({"title": theme_title, "title_ga": f"Téama sintéiseach {t:02d}"})
+            for o in range(1, options.get("objectives_per_theme", 10) + 1):
+                objectives.append({
+                    "title": f"Synthetic objective {t:02d}-{o:03d}",
+                    "theme": theme_title,
+                    "description": f"<p>{_words(rng, _WORDS_EN, 15)}</p>",
+                    "description_ga": f"<p>{_words(rng, _WORDS_GA, 15)}</p>",
+                })
+    objective_titles = [objective["title"] for objective in objectives]
+
+    actions = []
+    for number in range(1, int(options["actions"]) + 1):
+        status = rng.choices(ActionStatus.values, weights=(2, 5, 3))[0]
+        updated_at = start + datetime.timedelta(seconds=rng.uniform(0, span))
+        started = None
+        if status != ActionStatus.NOT_STARTED:
+            started_at = start + datetime.timedelta(seconds=rng.uniform(0, (updated_at - start).total_seconds()))
+            started = timezone.localtime(started_at).date()
+        irish = rng.random() < 0.5
+        actions.append({
+            "title": f"Synthetic action {number:06d}",
+            "objective": objective_titles[number % len(objective_titles)],
+            "small_description": _words(rng, _WORDS_EN, 10),
+            "small_description_ga": _words(rng, _WORDS_GA, 10) if irish else None,
+            "description": f"<p>{_words(rng, _WORDS_EN, rng.randint(20, 200))}</p>",
+            "description_ga": f"<p>{_words(rng, _WORDS_GA, rng.randint(20, 200))}</p>" if irish else "",
+            "update": f"<p>{_words(rng, _WORDS_EN, rng.randint(10, 80))}</p>" if started else "",
+            "status": status,
+            "progress_started_at": started,
+            "is_approved": rng.random() < 0.9,
+            "is_ga_approved": irish and rng.random() < 0.7,
+            "created_at": updated_at,
+            "updated_at": updated_at,
+        })
+    return themes, objectives, actions
+
+
+def expand_spec(spec):
+    """Flattens a spec into ``(themes, objectives, actions)`` lists of row dicts.
+
+    Objectives carry their theme's title and actions their objective's title.
+    """
+    themes, objectives, actions = [], [], []
+    for theme in spec.get("themes", []):
+        themes.append({key: value for key, value in theme.items() if key != "objectives"})
+        for objective in theme.get("objectives", []):
+            objectives.append({
+                **{key: value for key, value in objective.items() if key != "actions"},
+                "theme": theme["title"],
+            })
+            for action in objective.get("actions", []):
+                actions.append({**action, "objective": objective["title"]})
+
+    if spec.get("synthetic"):
+        more_themes, more_objectives, more_actions = synthetic_rows(spec["synthetic"], objectives)
+        themes += more_themes
+        objectives += more_objectives if more_themes else []
+        actions += more_actions
+
+    for kind, rows in (("theme", themes), ("objective", objectives), ("action", actions)):
+        titles = [row["title"] for row in rows]
+        if len(titles) != len(set(titles)):
+            raise ValueError(f"Duplicate {kind} titles in the seed spec.")
+    return themes, objectives, actions
+
+
+def _date(value):
+    return parse_date(value) if isinstance(value, str) else value
+
+
+def _datetime(value):
+    if isinstance(value, str):
+        value = parse_datetime(value) or datetime.datetime.combine(parse_date(value), datetime.time.min)
+    if value is not None and timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+def _action(row, objective_ids):
+    values = {field: row[field] for field in ACTION_FIELDS if field in row}
+    values["status"] = values.get("status", ActionStatus.NOT_STARTED).upper()
+    values["progress_started_at"] = _date(values.get("progress_started_at"))
+    try:
+        objective_id = objective_ids[row["objective"]]
+    except KeyError:
+        raise ValueError(f"Action {row['title']!r} refers to unknown objective {row['objective']!r}.")
+    return Action(title=row["title"], objective_id=objective_id, **values)
+
+
+def _stamp_actions(rows):
+    """Writes the spec's created_at/updated_at, which auto_now(_add) overwrote on insert.
+
+    A plain parameterised UPDATE per row: bulk_update() builds a CASE with one
+    branch per row, which is far slower for synthetic datasets.
+    """
+    if not rows:
+        return
+    action_ids = dict(Action.objects.values_list("title", "id"))
+    adapt = connection.ops.adapt_datetimefield_value
+    params = []
+    for row in rows:
+        created_at = _datetime(row.get("created_at") or row.get("updated_at"))
+        updated_at = _datetime(row.get("updated_at") or row.get("created_at"))
+        params.append((adapt(created_at), adapt(updated_at), action_ids[row["title"]]))
+
+    meta = Action._meta
+    columns = [meta.get_field(name).column for name in TIMESTAMP_FIELDS]
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"UPDATE {quote(meta.db_table)} SET {quote(columns[0])} = %s, {quote(columns[1])} = %s "
+            f"WHERE {quote(meta.pk.column)} = %s",
+            params,
+        )
+
+
+def rebuild_derived_data():
+    """Rebuilds the rollups and search index from scratch and invalidates cached content.
+
+    Bulk-inserted actions also get a reconstructed status history.
+    """
+    history.backfill_events()
+    ActionMonthlyStat.objects.all().delete()
+    refresh_rollups(source_years())
+    search.rebuild_index()
+    transaction.on_commit(bump_content_version)
+
+
+def seed(spec, replace=False, batch_size=BATCH_SIZE):
+    """Upserts every row of ``spec`` in one transaction; returns the row counts.
+
+    ``replace`` first deletes all existing actions (themes and objectives are
+    kept and upserted).
+    """
+    themes, objectives, actions = expand_spec(spec)
+
+    with transaction.atomic(), suspend_derived_updates():
+        if replace:
+            Action.objects.all().delete()
+
+        Theme.objects.bulk_create(
+            [Theme(title=row["title"], title_ga=row.get("title_ga")) for row in themes],
+            update_conflicts=True,
+            unique_fields=["title"],
+            update_fields=["title_ga"],
+            batch_size=batch_size,
+        )
+        theme_ids = dict(Theme.objects.values_list("title", "id"))
+
+        objective_rows = []
+        for row in objectives:
+            if row["theme"] not in theme_ids:
+                raise ValueError(f"Objective {row['title']!r} refers to unknown theme {row['theme']!r}.")
+            objective_rows.append(Objective(
+                title=row["title"],
+                description=row.get("description", ""),
+                description_ga=row.get("description_ga", ""),
+                theme_id=theme_ids[row["theme"]],
+            ))
+        Objective.objects.bulk_create(
+            objective_rows,
+            update_conflicts=True,
+            unique_fields=["title"],
+            update_fields=["description", "description_ga", "theme", *OBJECTIVE_PLAIN_FIELDS],
+            batch_size=batch_size,
+        )
+        objective_ids = dict(Objective.objects.values_list("title", "id"))
+
+        Action.objects.bulk_create(
+            [_action(row, objective_ids) for row in actions],
+            update_conflicts=True,
+            unique_fields=["title"],
+            update_fields=[*ACTION_FIELDS, *ACTION_PLAIN_FIELDS, "objective"],
+            batch_size=batch_size,
+        )
+
+        _stamp_actions([row for row in actions if any(row.get(field) for field in TIMESTAMP_FIELDS)])
+        rebuild_derived_data()
+
+    return {"themes": len(themes), "objectives": len(objectives), "actions": len(actions)}
@@ -0,0 +1,180 @@
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .cache import bump_content_version
+from .models import ROLLUP_FIELDS, Action, Objective, Theme, actions_updated
+from .roadmap import (
+    apply_rollup_deltas,
+    event_contributions,
+    events_enabled,
+    field_contributions,
+    open_current_month,
+)
+from . import history, search
+
+_suspended = ContextVar("tracker_derived_updates_suspended", default=False)
+
+
+@contextmanager
+def suspend_derived_updates():
+    """Skips the per-row receivers below; the caller rebuilds derived data once afterwards.
+
+    For bulk loads/deletes, where refreshing rollups and the search index per
+    row would dominate the run time (see seeding.rebuild_derived_data()).
+    """
+    token = _suspended.set(True)
+    try:
+        yield
+    finally:
+        _suspended.reset(token)
+
+
+def _open_event_rollups():
+    """Brings the event-source rollups up to the current month before new events are logged."""
+    if not _suspended.get():
+        open_current_month()
+
+
+def _move_event_rollups(events):
+    """Adds just-logged status events to the roadmap rollups, when the roadmap reads the log.
+
+    Only the changed actions' events are read: their contribution with and
+    without the new events gives the months to move.
+    """
+    if _suspended.get() or not events_enabled():
+        return
+    approved = [event for event in events if event.approved]
+    if not approved:
+        return
+    action_ids = {event.action_id for event in approved}
+    years = {timezone.localtime(event.at).year for event in approved}
+    apply_rollup_deltas(
+        event_contributions(action_ids, years, exclude=[event.pk for event in approved]),
+        event_contributions(action_ids, years),
+    )
+
+
+def _stored_field_contributions(pks):
+    """Returns the rollup cells the saved rows of ``pks`` count towards (see field_contributions())."""
+    return field_contributions(Action.objects.filter(pk__in=pks).values_list(*ROLLUP_FIELDS))
+
+
+# The status log is primary data rather than derived, so it is written even
+# while derived updates are suspended. With the event source, the rollups
+# move with the events logged here; with the field source, with the action
+# rows (the receivers further down).
+@receiver(post_save, sender=Action)
+def record_status_event_on_save(sender, instance, created, raw=False, **kwargs):
+    """Appends an ActionStatusEvent when a save changes the status or approval."""
+    if not raw:
+        _open_event_rollups()
+        _move_event_rollups(history.record_save(instance, created))
+
+
+@receiver(actions_updated, sender=Action)
+def record_status_events_on_update(sender, pks, previous_states=None, **kwargs):
+    """Appends ActionStatusEvents for a queryset update() that set status or approval."""
+    if previous_states is not None:
+        _open_event_rollups()
+        _move_event_rollups(history.record_update(pks, previous_states))
+
+
+@receiver(pre_save, sender=Action)
+def remember_rollup_cells_on_save(sender, instance, **kwargs):
+    """Notes the rollup cells the action counts towards before the save (field source)."""
+    if _suspended.get() or events_enabled():
+        return
+    instance._rollup_cells = Counter() if instance.pk is None else _stored_field_contributions([instance.pk])
+
+
+@receiver(post_save, sender=Action)
+def update_rollups_on_save(sender, instance, update_fields=None, **kwargs):
+    """Moves the action's roadmap rollup counts from the months it left to those it entered."""
+    if _suspended.get() or events_enabled():
+        return
+    if update_fields is None:
+        after = field_contributions([tuple(getattr(instance, field) for field in ROLLUP_FIELDS)])
+    else:
+        # Fields left out of update_fields may hold unsaved values.
+        after = _stored_field_contributions([instance.pk])
+    apply_rollup_deltas(getattr(instance, "_rollup_cells", Counter()), after)
+    instance._rollup_cells = after
+
+
+@receiver(pre_delete, sender=Action)
+def remember_rollup_cells_on_delete(sender, instance, **kwargs):
+    """Notes the rollup cells a deleted action counts towards (its status events go with it)."""
+    if _suspended.get():
+        return
+    if not events_enabled():
+        instance._rollup_cells = _stored_field_contributions([instance.pk])
+        return
+    open_current_month()
+    first = instance.status_events.filter(approved=True).datetimes("at", "year").first()
+    # In-progress work carries into every later year (the "continued" series).
+    years = range(first.year, timezone.localtime().year + 1) if first else ()
+    instance._rollup_cells = event_contributions([instance.pk], years)
+
+
+@receiver(post_delete, sender=Action)
+def update_rollups_on_delete(sender, instance, **kwargs):
+    """Removes a deleted action's contribution from the roadmap rollups."""
+    if _suspended.get():
+        return
+    apply_rollup_deltas(getattr(instance, "_rollup_cells", Counter()), Counter())
+
+
+@receiver(actions_updated, sender=Action)
+def update_rollups_on_update(sender, pks, previous_rows=None, **kwargs):
+    """Moves the roadmap rollup counts changed by a queryset update() (field source)."""
+    if _suspended.get() or events_enabled() or previous_rows is None:
+        return
+    apply_rollup_deltas(field_contributions(previous_rows.values()), _stored_field_contributions(pks))
+
+
+@receiver(post_save, sender=Action)
+def update_search_index_on_save(sender, instance, **kwargs):
+    """Re-indexes the saved action's text for full-text search."""
+    if _suspended.get():
+        return
+    search.index_action(instance)
+
+
+@receiver(post_delete, sender=Action)
+def update_search_index_on_delete(sender, instance, **kwargs):
+    """Drops a deleted action from the full-text index."""
+    if _suspended.get():
+        return
+    search.remove_actions([instance.pk])
+
+
+@receiver(actions_updated, sender=Action)
+def update_search_index_on_update(sender, pks, **kwargs):
+    """Re-indexes actions changed by a queryset update()."""
+    if _suspended.get():
+        return
+    search.reindex_actions(pks)
+
+
+@receiver(post_save, sender=Theme)
+@receiver(post_delete, sender=Theme)
+@receiver(post_save, sender=Objective)
+@receiver(post_delete, sender=Objective)
+@receiver(post_save, sender=Action)
+@receiver(post_delete, sender=Action)
+@receiver(actions_updated, sender=Action)
+def invalidate_cached_content(sender, **kwargs):
+    """Moves to a new content version, once the change is committed, so cached content is rebuilt.
+
+    Bumping before the commit would let a concurrent request cache the old
+    rows under the new version (and answer 304s for them until the next write).
+    """
+    if _suspended.get():
+        return
+    transaction.on_commit(bump_content_version)
@@ -0,0 +1,16 @@
+/**
+ * Applies the changelist filter picked in an autocomplete filter box
+ * (tracker_app.changelist.AutocompleteFilter).
+ */
+'use strict';
+{
+    const $ = django.jQuery;
+
+    $(document).on('change', '.tracker-autocomplete-filter', function() {
+        const value = this.value;
+        const url = value
+            ? this.dataset.filterUrl.replace('__value__', encodeURIComponent(value))
+            : this.dataset.clearUrl;
+        window.location.search = url;
+    });
+}
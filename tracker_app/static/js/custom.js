@@ -155,6 +155,7 @@ function handleDetailsToggle(clickedElement) {
     const isHidden = window.getComputedStyle(detailsRow).display === 'none';
 
     if (isHidden) {
+        loadActionDetails(summaryRow, detailsRow);
         detailsRow.classList.add('expanded');
 
         // Dynamic display: use 'table-row' for desktop, 'block' for mobile.
@@ -172,6 +173,41 @@ function handleDetailsToggle(clickedElement) {
     }
 }
 
+/**
+ * Fills a details row with the action's description and update the first
+ * time it is opened; the list request only carries the summary fields.
+ */
+function loadActionDetails(summaryRow, detailsRow) {
+    if (detailsRow.dataset.loaded) {
+        return;
+    }
+    detailsRow.dataset.loaded = '1';
+
+    const labels = document.getElementById('js-table-labels').dataset;
+    const currentLang = document.documentElement.lang || 'en';
+    const descriptionArea = detailsRow.querySelector('.action-description');
+    const updateArea = detailsRow.querySelector('.action-update');
+
+    fetch(`/${currentLang}/api/actions/${summaryRow.dataset.actionId}/?fields=description,update`)
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}`);
+            }
+            return response.json();
+        })
+        .then(action => {
+            descriptionArea.innerHTML = action.description;
+            if (updateArea) {
+                updateArea.innerHTML = action.update || labels.noUpdate;
+            }
+        })
+        .catch(error => {
+            // Let the next click try again.
+            delete detailsRow.dataset.loaded;
+            console.error('Error loading action details:', error);
+        });
+}
+
 /* =====================================================
    Roadmap Chart
    ===================================================== */
@@ -437,6 +473,8 @@ function fetchAndDisplayActions(status, page = 1) {
     } else {
         url = `/${currentLang}/api/actions/filter/${statusLower}/?page=${page}${themeQuery}`;
     }
+    // Only the summary columns; descriptions and updates load when a row is opened.
+    url += '&fields=id,title,small_description,status';
 
     const tableArea = document.getElementById('filtered-table-view-container');
     const accordionArea = document.getElementById('accordion-view-container');
@@ -485,7 +523,7 @@ function fetchAndDisplayActions(status, page = 1) {
                 const showUpdates = actionStatusLower === 'in_progress' || actionStatusLower === 'completed';
 
                 htmlOutput += `
-                    <tr class="action-summary-row status-${statusLower}">
+                    <tr class="action-summary-row status-${statusLower}" data-action-id="${action.id}">
                         <td class="title-col"><strong>${action.title}</strong></td>
                         <td class="objective-col">${action.small_description}</td>
                         <td class="details-col text-center">
@@ -497,11 +535,11 @@ function fetchAndDisplayActions(status, page = 1) {
                         <td colspan="3">
                             <div class="details-content">
                                 <p class="fw-bold details-heading">${labels.actionDesc}</p>
-                                <div>${action.description}</div>
+                                <div class="action-description">${labels.loading}</div>
                                 ${showUpdates ? `
                                     <hr class="bg-light">
                                     <p class="fw-bold details-heading">${labels.latestUpdate}</p>
-                                    <div>${action.update || labels.noUpdate}</div>
+                                    <div class="action-update">${labels.loading}</div>
                                 ` : ''}
                             </div>
                         </td>
@@ -545,6 +583,153 @@ function fetchAndDisplayActions(status, page = 1) {
 
 let currentModalThemeTitle = '';
 let currentThemeId = null;
+// Theme modal payloads fetched ahead of a click by warmThemeDetails(), by theme id.
+const themeDetailsCache = new Map();
+
+let themeTrendChartInstance = null;
+
+/**
+ * Draws the open modal's monthly trend from the theme's roadmap series
+ * (completed, and started + continued as in progress).
+ */
+function renderThemeTrend(contentArea, roadmap) {
+    const canvas = contentArea.querySelector('.theme-trend-chart');
+    if (themeTrendChartInstance) {
+        themeTrendChartInstance.destroy();
+        themeTrendChartInstance = null;
+    }
+    if (!canvas || !roadmap || typeof Chart === 'undefined') {
+        return;
+    }
+
+    const useGa = document.documentElement.lang === 'ga';
+    const labelsNode = document.getElementById(useGa ? 'activity-chart-labels-ga' : 'activity-chart-labels-en');
+    const labels = labelsNode ? JSON.parse(labelsNode.textContent) : roadmap.completed.map((_, index) => index + 1);
+    const inProgress = roadmap.started.map((started, index) => started + roadmap.continued[index]);
+
+    themeTrendChartInstance = new Chart(canvas, {
+        type: 'line',
+        data: {
+            labels: labels,
+            datasets: [
+                {
+                    label: canvas.dataset.labelCompleted,
+                    data: roadmap.completed,
+                    borderColor: 'rgb(113, 153, 73)',
+                    tension: 0.4,
+                },
+                {
+                    label: canvas.dataset.labelInProgress,
+                    data: inProgress,
+                    borderColor: 'rgb(254, 186, 53)',
+                    tension: 0.4,
+                },
+            ],
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                title: { display: true, text: String(roadmap.year) },
+            },
+            scales: {
+                y: { beginAtZero: true, ticks: { precision: 0 } },
+            },
+        },
+    });
+}
+
+/**
+ * Renders a theme-details payload into the modal and shows it.
+ */
+function showThemeDetails(data) {
+    const contentArea = document.getElementById('dynamicModalContent');
+    contentArea.innerHTML = data.html_content;
+    processExternalLinks(contentArea);
+    initTooltips();
+    renderThemeTrend(contentArea, data.roadmap);
+
+    const capitalizedTitle = capitalizeEachWord(data.title);
+    document.getElementById('modalThemeTitle').textContent = capitalizedTitle;
+
+    const modalElement = document.getElementById('portfolioModal');
+    const modal = bootstrap.Modal.getOrCreateInstance(modalElement);
+    modal.show();
+}
+
+// Theme modal requests in flight, by theme id, so a click can reuse a warm-up.
+const themeDetailsPending = new Map();
+// Theme ids hovered or focused since the last warm-up request.
+const themeWarmQueue = new Set();
+let themeWarmTimer = null;
+// Intents arriving within this window (e.g. a pointer sweeping across tiles) share one request.
+const THEME_WARM_DELAY_MS = 80;
+
+/**
+ * Fetches the queued themes' modals in one batch request.
+ */
+function flushThemeWarmQueue() {
+    themeWarmTimer = null;
+    const templateNode = document.getElementById('api-url-template');
+    const batchUrl = templateNode && templateNode.getAttribute('data-batch-url');
+    const ids = Array.from(themeWarmQueue);
+    themeWarmQueue.clear();
+    if (!batchUrl || ids.length === 0) {
+        return;
+    }
+
+    const request = fetch(`${batchUrl}?ids=${ids.join(',')}`)
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}`);
+            }
+            return response.json();
+        })
+        .then(data => {
+            Object.entries(data.themes).forEach(([themeId, payload]) => themeDetailsCache.set(themeId, payload));
+        })
+        .catch(error => {
+            // Clicks fall back to fetching their own theme.
+            console.error('Error warming theme details:', error);
+        })
+        .finally(() => ids.forEach(themeId => themeDetailsPending.delete(themeId)));
+    ids.forEach(themeId => themeDetailsPending.set(themeId, request));
+}
+
+/**
+ * Queues a theme's modal for warming when the visitor shows intent to open it
+ * (hovering or focusing its tile), so only modals that are likely to be opened
+ * are downloaded.
+ */
+function warmThemeDetails(themeId) {
+    if (!themeId || themeDetailsCache.has(themeId) || themeDetailsPending.has(themeId)) {
+        return;
+    }
+    themeWarmQueue.add(themeId);
+    if (themeWarmTimer === null) {
+        themeWarmTimer = setTimeout(flushThemeWarmQueue, THEME_WARM_DELAY_MS);
+    }
+}
+
+/**
+ * Fetches one theme's modal on its own and shows it.
+ */
+function fetchThemeDetails(themeId) {
+    const urlTemplate = document.getElementById('api-url-template').getAttribute('data-url-template');
+    const url = urlTemplate.replace('__ID__', themeId);
+
+    document.getElementById('modalThemeTitle').textContent = 'Loading...';
+    document.getElementById('dynamicModalContent').innerHTML = '<p>Fetching data, please wait...</p>';
+
+    fetch(url)
+        .then(response => response.json())
+        .then(data => showThemeDetails(data))
+        .catch(error => {
+            console.error('Error fetching theme details:', error);
+            document.getElementById('dynamicModalContent').innerHTML = '<p>Error loading content.</p>';
+            document.getElementById('modalThemeTitle').textContent = 'Error';
+        });
+}
 
 /**
  * Wires modal interactions and theme data loading.
@@ -567,38 +752,38 @@ function initModalHandlers() {
     }
 
     document.querySelectorAll('a[data-theme-id]').forEach(link => {
+        const warm = () => warmThemeDetails(link.getAttribute('data-theme-id'));
+        link.addEventListener('pointerenter', warm);
+        link.addEventListener('focus', warm);
+        link.addEventListener('touchstart', warm, { passive: true });
+
         link.addEventListener('click', function(event) {
             event.preventDefault();
 
             const themeId = this.getAttribute('data-theme-id');
             currentThemeId = themeId;
 
-            const urlTemplate = document.getElementById('api-url-template').getAttribute('data-url-template');
-            const url = urlTemplate.replace('__ID__', themeId);
-
-            document.getElementById('modalThemeTitle').textContent = 'Loading...';
-            document.getElementById('dynamicModalContent').innerHTML = '<p>Fetching data, please wait...</p>';
-
-            fetch(url)
-                .then(response => response.json())
-                .then(data => {
-                    const contentArea = document.getElementById('dynamicModalContent');
-                    contentArea.innerHTML = data.html_content;
-                    processExternalLinks(contentArea);
-                    initTooltips();
-
-                    const capitalizedTitle = capitalizeEachWord(data.title);
-                    document.getElementById('modalThemeTitle').textContent = capitalizedTitle;
-
-                    const modalElement = document.getElementById('portfolioModal');
-                    const modal = bootstrap.Modal.getOrCreateInstance(modalElement);
-                    modal.show();
-                })
-                .catch(error => {
-                    console.error('Error fetching theme details:', error);
-                    document.getElementById('dynamicModalContent').innerHTML = '<p>Error loading content.</p>';
-                    document.getElementById('modalThemeTitle').textContent = 'Error';
+            if (themeDetailsCache.has(themeId)) {
+                showThemeDetails(themeDetailsCache.get(themeId));
+                return;
+            }
+
+            if (themeDetailsPending.has(themeId)) {
+                // The warm-up request is already on its way; wait for it rather than asking twice.
+                themeDetailsPending.get(themeId).then(() => {
+                    if (currentThemeId !== themeId) {
+                        return;
+                    }
+                    if (themeDetailsCache.has(themeId)) {
+                        showThemeDetails(themeDetailsCache.get(themeId));
+                    } else {
+                        fetchThemeDetails(themeId);
+                    }
                 });
+                return;
+            }
+
+            fetchThemeDetails(themeId);
         });
     });
 
@@ -1,12 +1,97 @@
+from django.conf import settings
 from django.contrib.admin.sites import AdminSite
 from django.contrib.auth import get_user_model
-from django.test import Client, RequestFactory, TestCase
+from django.contrib.auth.models import Permission
+from django.core.management import call_command
+from django.core import checks, mail
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import CommandError
+from django.db import connection
+from django.template.base import Template
+from django.core.cache import cache
+from django.test import Client, RequestFactory, TestCase as DjangoTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from django.utils import translation
+from django.utils import timezone, translation
+import csv
+import gzip
+import importlib
+import json
+import logging
+import os
+import tempfile
+import re
+import shutil
+from datetime import date, datetime, timezone as dt_timezone
+from io import StringIO
+from logging.handlers import QueueHandler, RotatingFileHandler
 from unittest.mock import patch
 
+from . import search, views
 from .admin import ActionAdmin, ObjectiveAdmin, ThemeAdmin
-from .models import Action, ActionStatus, Objective, Theme
+from .benchmarks import QUERY_BUDGETS, WALL_MS_BUDGETS, _QueryCounter, check_budgets, compare, run_benchmarks
+from .changelist import EstimatedCountPaginator, estimated_row_count
+from .cache import current_content_version
+from .counts import dashboard_counts
+from .log_handlers import _listeners, queue_handlers
+from .middleware import _record_query
+from .models import (
+	Action,
+	ActionMonthlyStat,
+	ActionStatus,
+	ActionStatusEvent,
+	ApprovalNotification,
+	Objective,
+	Theme,
+)
+from .notifications import deliver_pending_notifications
+from .roadmap import (
+	event_series,
+	field_range_series,
+	monthly_series,
+	range_series,
+	rollup_series,
+	theme_monthly_series,
+	theme_roadmap,
+	theme_series,
+)
+from .views import _build_range_payload, _build_roadmap_payload
+
+# The default cache is a file cache shared by every process on the host; give
+# the test run its own directory so it neither reads a previous run's content
+# version nor clears the development server's cache.
+_test_cache_settings = None
+
+
+def setUpModule():
+	global _test_cache_settings
+	location = tempfile.mkdtemp(prefix="tracker-test-cache-")
+	_test_cache_settings = override_settings(CACHES={
+		"default": {
+			"BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+			"LOCATION": location,
+		}
+	})
+	_test_cache_settings.enable()
+
+
+class TestCase(DjangoTestCase):
+	"""Each test starts from an empty cache.
+
+	Test transactions never commit, so writes made in a test do not move the
+	content version (it moves on commit); content cached by an earlier test
+	would otherwise still look fresh.
+	"""
+
+	def _post_teardown(self):
+		super()._post_teardown()
+		cache.clear()
+
+
+def tearDownModule():
+	location = settings.CACHES["default"]["LOCATION"]
+	_test_cache_settings.disable()
+	shutil.rmtree(location, ignore_errors=True)
 
 
 class ActionAdminSaveModelTests(TestCase):
@@ -202,8 +287,7 @@ class ActionAdminSaveModelTests(TestCase):
 		self.assertEqual(action.created_by, self.staff_user)
 		self.assertEqual(action.updated_by, self.staff_user)
 
-	@patch("tracker_app.admin.send_mail")
-	def test_staff_update_triggers_email_on_update_change(self, mocked_send_mail):
+	def test_staff_update_queues_notification_on_update_change(self):
 		action = Action.objects.create(
 			title="Action Notify",
 			objective=self.objective,
@@ -233,10 +317,12 @@ class ActionAdminSaveModelTests(TestCase):
 		action.status = cleaned_data["status"]
 
 		self.action_admin.save_model(request, action, form, change=True)
-		self.assertTrue(mocked_send_mail.called)
+		notification = ApprovalNotification.objects.get(action=action)
+		self.assertEqual(notification.update_note, "ENGLISH")
+		self.assertEqual(notification.requested_by, self.staff_user)
+		self.assertIsNone(notification.sent_at)
 
-	@patch("tracker_app.admin.send_mail")
-	def test_staff_update_no_email_when_update_not_changed(self, mocked_send_mail):
+	def test_staff_update_no_notification_when_update_not_changed(self):
 		action = Action.objects.create(
 			title="Action No Notify",
 			objective=self.objective,
@@ -266,10 +352,9 @@ class ActionAdminSaveModelTests(TestCase):
 		action.status = cleaned_data["status"]
 
 		self.action_admin.save_model(request, action, form, change=True)
-		self.assertFalse(mocked_send_mail.called)
+		self.assertFalse(ApprovalNotification.objects.exists())
 
-	@patch("tracker_app.admin.send_mail")
-	def test_staff_update_ga_does_not_trigger_email(self, mocked_send_mail):
+	def test_staff_update_ga_queues_notification(self):
 		action = Action.objects.create(
 			title="Action GA Notify",
 			objective=self.objective,
@@ -301,7 +386,7 @@ class ActionAdminSaveModelTests(TestCase):
 
 		self.action_admin.save_model(request, action, form, change=True)
 		# Irish-only update should trigger notification to superusers
-		self.assertTrue(mocked_send_mail.called)
+		self.assertEqual(ApprovalNotification.objects.get(action=action).update_note, "IRISH")
 
 	def test_superuser_save_keeps_completed_status(self):
 		action = Action.objects.create(
@@ -337,6 +422,40 @@ class ActionAdminSaveModelTests(TestCase):
 		self.assertTrue(action.is_approved)
 		self.assertEqual(action.status, ActionStatus.COMPLETED)
 
+	def _diagnostic_form(self):
+		class DummyForm:
+			cleaned_data = {"update": "<p>New</p>", "update_ga": "", "status": ActionStatus.IN_PROGRESS}
+			changed_data = ["update"]
+			initial = {"update": "<p>Old</p>"}
+
+		return DummyForm()
+
+	@override_settings(TRACKER_DIAGNOSTICS_USERS=["staff_user"])
+	def test_save_diagnostics_use_form_initial_without_refetch(self):
+		action = Action.objects.create(title="Action Diag", objective=self.objective, update="<p>Old</p>")
+		action = Action.objects.get(pk=action.pk)
+		request = self.factory.post("/admin/")
+		request.user = self.staff_user
+		request.build_absolute_uri = lambda x: f"http://testserver{x}"
+
+		with self.assertLogs("tracker_app.diagnostics", "INFO") as logs, CaptureQueriesContext(connection) as ctx:
+			self.action_admin.save_model(request, action, self._diagnostic_form(), change=True)
+
+		self.assertEqual(len(logs.records), 1)
+		self.assertIn('"from": "<p>Old</p>"', logs.output[0])
+		self.assertIn('"to": "<p>New</p>"', logs.output[0])
+		refetches = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith('SELECT "tracker_app_action"."id"')]
+		self.assertEqual(refetches, [])
+
+	@override_settings(TRACKER_DIAGNOSTICS_USERS=["someone_else"], TRACKER_DIAGNOSTICS_ACTIONS=[])
+	def test_save_diagnostics_skipped_for_other_users(self):
+		action = Action.objects.create(title="Action Diag Off", objective=self.objective)
+		request = self.factory.post("/admin/")
+		request.user = self.super_user
+
+		with self.assertNoLogs("tracker_app.diagnostics", "INFO"):
+			self.action_admin.save_model(request, action, self._diagnostic_form(), change=True)
+
 	def test_get_readonly_fields_for_staff(self):
 		request = self.factory.get("/admin/")
 		request.user = self.staff_user
@@ -439,6 +558,114 @@ class ActionDisplayUpdateTests(TestCase):
 		self.assertEqual(action.display_update, "")
 
 
+class LocalizedProjectionTests(TestCase):
+	def setUp(self):
+		self.theme = Theme.objects.create(title="Theme Projection")
+		self.objective = Objective.objects.create(
+			title="Objective Projection",
+			theme=self.theme,
+			description="Obj EN",
+			description_ga="Obj GA",
+		)
+		Action.objects.create(
+			title="Projection Both",
+			objective=self.objective,
+			small_description="Small EN",
+			small_description_ga="Small GA",
+			description="Desc EN",
+			description_ga="",
+			update="Update EN",
+			update_ga="Update GA",
+			is_approved=True,
+		)
+		Action.objects.create(
+			title="Projection Unapproved",
+			objective=self.objective,
+			small_description="Small EN 2",
+			update="Hidden",
+			is_approved=False,
+		)
+
+	def test_display_text_matches_display_properties(self):
+		for language in ("en", "ga"):
+			with translation.override(language):
+				for action in Action.objects.with_display_text(language):
+					self.assertEqual(action.small_description_text, action.display_small_description)
+					self.assertEqual(action.description_text, action.display_description)
+					self.assertEqual(action.update_text, action.display_update)
+				objective = Objective.objects.with_display_text(language).get()
+				self.assertEqual(objective.description_text, objective.display_description)
+
+	def test_api_text_requires_approved_irish(self):
+		action = Action.objects.with_api_text("ga").get(title="Projection Both")
+		self.assertEqual(action.small_description_text, "Small EN")
+
+		Action.objects.filter(title="Projection Both").update(is_ga_approved=True)
+		action = Action.objects.with_api_text("ga").get(title="Projection Both")
+		self.assertEqual(action.small_description_text, "Small GA")
+		self.assertEqual(action.description_text, "Desc EN")
+		self.assertEqual(action.update_text, "Update GA")
+
+
+class SanitizedRichTextTests(TestCase):
+	def setUp(self):
+		self.theme = Theme.objects.create(title="Theme Clean")
+		self.objective = Objective.objects.create(
+			title="Objective Clean",
+			theme=self.theme,
+			description="<p>Plan <script>alert(1)</script></p>",
+		)
+
+	def test_save_sanitizes_html_and_stores_plain_text(self):
+		action = Action.objects.create(
+			title="Action Clean",
+			objective=self.objective,
+			description='<p onclick="x()">Fix <strong>roads</strong>&amp; paths</p>',
+			update_ga="<p>Nuashonrú</p>",
+		)
+		action.refresh_from_db()
+		self.assertEqual(action.description, "<p>Fix <strong>roads</strong>&amp; paths</p>")
+		self.assertEqual(action.description_plain, "Fix roads & paths")
+		self.assertEqual(action.update_ga_plain, "Nuashonrú")
+		self.assertEqual(action.update_plain, "")
+
+		self.objective.refresh_from_db()
+		self.assertNotIn("<script>", self.objective.description)
+		self.assertEqual(self.objective.description_plain, "Plan <script>alert(1)</script>")
+
+	def test_queryset_update_refreshes_plain_text(self):
+		action = Action.objects.create(title="Action Update", objective=self.objective)
+		Action.objects.filter(pk=action.pk).update(update="<p>Works <em>started</em></p>")
+		action.refresh_from_db()
+		self.assertEqual(action.update_plain, "Works started")
+
+	def test_reads_and_lookups_do_not_sanitize_again(self):
+		Action.objects.create(title="Action Read", objective=self.objective, description="<p>Text</p>")
+		with patch("tracker_app.fields.clean_html") as clean_html:
+			self.assertTrue(Action.objects.filter(description="<p>Text</p>").exists())
+			list(Action.objects.with_api_text("en").values("description_text"))
+		clean_html.assert_not_called()
+
+	def test_inline_styles_are_kept(self):
+		action = Action.objects.create(
+			title="Action Style", objective=self.objective, description='<p style="color: red;">Red</p>'
+		)
+		self.assertIn("color: red", action.description)
+
+	def test_missing_css_sanitizer_fails_the_check(self):
+		with patch("tracker_app.checks.keeps_inline_styles", return_value=False):
+			ids = [message.id for message in checks.run_checks()]
+		self.assertIn("tracker_app.E002", ids)
+
+	def test_rich_text_migration_refuses_to_strip_styles(self):
+		migration = importlib.import_module("tracker_app.migrations.0013_sanitized_rich_text")
+		with patch.object(migration.bleach, "__version__", "6.3.0"), patch.dict(
+			"sys.modules", {"bleach.css_sanitizer": None}
+		):
+			with self.assertRaises(ImproperlyConfigured):
+				migration.sanitize_existing_rows(None, None)
+
+
 class ModelStringRepresentationTests(TestCase):
 	def setUp(self):
 		self.theme = Theme.objects.create(title="Theme Name")
@@ -623,6 +850,305 @@ class FilteredActionsApiTests(TestCase):
 		payload = response.json()
 		self.assertEqual(payload["actions"][0]["update"], "")
 
+	def test_action_list_query_count_independent_of_page_size(self):
+		url = reverse("tracker_app:all_actions")
+		with self.assertNumQueries(2):
+			small_page = self.client.get(url).json()
+		self.assertEqual(len(small_page["actions"]), 2)
+
+		for i in range(12):
+			other_objective = Objective.objects.create(title=f"Objective Q{i}", theme=self.theme)
+			Action.objects.create(title=f"Action Q{i}", objective=other_objective, status=ActionStatus.IN_PROGRESS)
+
+		with self.assertNumQueries(2):
+			full_page = self.client.get(url).json()
+		self.assertEqual(len(full_page["actions"]), 10)
+		self.assertEqual(full_page["actions"][-1]["objective_title"], "Objective Q7")
+
+		status_url = reverse("tracker_app:filter_actions_by_status", args=["in_progress"])
+		with self.assertNumQueries(2):
+			self.client.get(status_url, {"theme_id": self.theme.id, "page": 2})
+
+	def test_action_list_cursor_mode_walks_all_pages_without_count(self):
+		for i in range(13):
+			Action.objects.create(title=f"Action K{i}", objective=self.objective, status=ActionStatus.NOT_STARTED)
+
+		url = reverse("tracker_app:filter_actions_by_status", args=["not_started"])
+		with self.assertNumQueries(1):
+			first = self.client.get(url, {"cursor": ""}).json()
+		self.assertNotIn("count", first)
+		self.assertTrue(first["has_next"])
+		self.assertEqual(len(first["actions"]), 10)
+
+		second = self.client.get(url, {"cursor": first["next_cursor"], "with_count": "1"}).json()
+		self.assertFalse(second["has_next"])
+		self.assertIsNone(second["next_cursor"])
+		self.assertEqual(second["count"], 13)
+		seen = [a["id"] for a in first["actions"] + second["actions"]]
+		self.assertEqual(seen, sorted(seen))
+		self.assertEqual(len(set(seen)), 13)
+
+	def test_action_list_cursor_mode_rejects_bad_cursor(self):
+		response = self.client.get(reverse("tracker_app:all_actions"), {"cursor": "not-a-cursor!"})
+		self.assertEqual(response.status_code, 400)
+
+	def test_action_list_fields_and_compact_projection(self):
+		url = reverse("tracker_app:filter_actions_by_status", args=["in_progress"])
+		payload = self.client.get(url, {"fields": "title,status"}).json()
+		self.assertEqual(payload["actions"], [{"title": "Action In Progress", "status": "In progress"}])
+
+		compact = self.client.get(url, {"fields": "id,title", "compact": "1"}).json()
+		self.assertNotIn("actions", compact)
+		self.assertEqual(compact["columns"], ["id", "title"])
+		self.assertEqual(compact["rows"], [[self.action_in_progress.id, "Action In Progress"]])
+
+		self.assertEqual(self.client.get(url, {"fields": "title,secret"}).status_code, 400)
+		self.assertEqual(self.client.get(url, {"fields": ""}).status_code, 400)
+
+	def test_action_list_is_compressed_when_accepted(self):
+		for i in range(10):
+			Action.objects.create(title=f"Action Z{i}", objective=self.objective, description="Long text " * 20)
+		url = reverse("tracker_app:all_actions")
+		plain = self.client.get(url)
+		self.assertNotIn("Content-Encoding", plain)
+		self.assertNotIn(b": ", plain.content)
+
+		response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+		self.assertEqual(response["Content-Encoding"], "gzip")
+		self.assertIn("Accept-Encoding", response["Vary"])
+		self.assertTrue(response["ETag"].startswith('W/"'))
+		self.assertEqual(gzip.decompress(response.content), plain.content)
+
+		revalidated = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=response["ETag"])
+		self.assertEqual(revalidated.status_code, 304)
+
+	def test_action_details_endpoint(self):
+		url = reverse("tracker_app:action_details", args=[self.action_in_progress.id])
+		payload = self.client.get(url, {"fields": "description,update"}).json()
+		self.assertEqual(payload, {"description": "Desc EN", "update": "Update EN"})
+		self.assertEqual(self.client.get(url).json()["objective_title"], "Objective C")
+
+		missing = self.client.get(reverse("tracker_app:action_details", args=[self.action_completed.id + 100]))
+		self.assertEqual(missing.status_code, 404)
+
+
+class ActionSearchApiTests(TestCase):
+	def setUp(self):
+		self.client = Client()
+		self.theme = Theme.objects.create(title="Theme Search")
+		self.objective = Objective.objects.create(title="Objective Search", theme=self.theme)
+		self.bridge = Action.objects.create(
+			title="Repair the river bridge",
+			objective=self.objective,
+			description="<p>Structural <strong>works</strong></p>",
+		)
+		self.library = Action.objects.create(
+			title="Library opening hours",
+			objective=self.objective,
+			description="<p>Extend hours near the <em>bridge</em> area</p>",
+			description_ga="<p>Uaireanta i Meán Fómhair</p>",
+		)
+		self.url = reverse("tracker_app:search_actions")
+
+	def _titles(self, query, **params):
+		response = self.client.get(self.url, {"q": query, **params})
+		self.assertEqual(response.status_code, 200)
+		return [row["title"] for row in response.json()["actions"]]
+
+	def test_search_ranks_title_matches_first(self):
+		self.assertEqual(self._titles("bridge"), ["Repair the river bridge", "Library opening hours"])
+
+	def test_search_matches_prefixes_irish_text_and_ignores_markup(self):
+		self.assertEqual(self._titles("libr hou"), ["Library opening hours"])
+		self.assertEqual(self._titles("fomhair"), ["Library opening hours"])
+		self.assertEqual(self._titles("strong"), [])
+
+	def test_search_index_follows_saves_updates_and_deletes(self):
+		self.bridge.description = "<p>Resurfacing</p>"
+		self.bridge.save()
+		self.assertEqual(self._titles("resurfacing"), ["Repair the river bridge"])
+
+		Action.objects.filter(pk=self.library.pk).update(update="<p>Broadband rollout</p>")
+		self.assertEqual(self._titles("broadband"), ["Library opening hours"])
+
+		self.library.delete()
+		self.assertEqual(self._titles("hours"), [])
+
+	def test_search_is_paginated(self):
+		for number in range(12):
+			Action.objects.create(title=f"Greenway section {number}", objective=self.objective)
+		first = self.client.get(self.url, {"q": "greenway"}).json()
+		self.assertEqual(first["count"], 12)
+		self.assertEqual(len(first["actions"]), 10)
+		self.assertTrue(first["has_next"])
+
+		second = self.client.get(self.url, {"q": "greenway", "page": 5}).json()
+		self.assertEqual(second["current_page"], 2)
+		self.assertEqual(len(second["actions"]), 2)
+
+		# Far past the end (beyond SQLite's integer range): still the last page, one index pass.
+		with CaptureQueriesContext(connection) as queries:
+			last = self.client.get(self.url, {"q": "greenway", "page": 10 ** 30}).json()
+		self.assertEqual(last["current_page"], 2)
+		self.assertEqual(len(last["actions"]), 2)
+		self.assertEqual(sum("MATCH" in query["sql"] for query in queries.captured_queries), 2)
+
+	def test_search_requires_a_term(self):
+		response = self.client.get(self.url, {"q": " !! "})
+		self.assertEqual(response.status_code, 400)
+
+
+class ActionExportTests(TestCase):
+	def setUp(self):
+		self.client = Client()
+		self.staff = get_user_model().objects.create_user(username="reporter", password="pass", is_staff=True)
+		self.theme = Theme.objects.create(title="Theme Export", title_ga="Téama Easpórtála")
+		self.objective = Objective.objects.create(title="Objective Export", theme=self.theme)
+		self.action = Action.objects.create(
+			title="Action Export",
+			objective=self.objective,
+			status=ActionStatus.IN_PROGRESS,
+			description="<p>Line, with &amp; comma</p>",
+			update_ga="<p>Nuashonrú</p>",
+		)
+		self.url = reverse("tracker_app:export_actions")
+
+	def test_export_requires_staff(self):
+		response = self.client.get(self.url)
+		self.assertEqual(response.status_code, 302)
+
+	def test_export_streams_csv_with_optional_plain_text(self):
+		self.client.force_login(self.staff)
+		response = self.client.get(self.url)
+		self.assertTrue(response.streaming)
+		rows = list(csv.DictReader(StringIO(b"".join(response.streaming_content).decode())))
+		self.assertEqual(len(rows), 1)
+		self.assertEqual(rows[0]["theme"], "Theme Export")
+		self.assertEqual(rows[0]["objective"], "Objective Export")
+		self.assertEqual(rows[0]["description"], "<p>Line, with &amp; comma</p>")
+
+		response = self.client.get(self.url, {"strip_html": "1"})
+		rows = list(csv.DictReader(StringIO(b"".join(response.streaming_content).decode())))
+		self.assertEqual(rows[0]["description"], "Line, with & comma")
+
+	def test_export_jsonl_and_command(self):
+		self.client.force_login(self.staff)
+		response = self.client.get(self.url, {"format": "jsonl"})
+		rows = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+		self.assertEqual(rows[0]["update_ga"], "<p>Nuashonrú</p>")
+		self.assertEqual(rows[0]["theme_ga"], "Téama Easpórtála")
+
+		out = StringIO()
+		call_command("export_actions", "--format", "jsonl", "--strip-html", stdout=out)
+		self.assertEqual(json.loads(out.getvalue())["update_ga"], "Nuashonrú")
+
+		self.assertEqual(self.client.get(self.url, {"format": "xml"}).status_code, 400)
+
+
+class ConditionalGetTests(TestCase):
+	def setUp(self):
+		self.client = Client()
+		self.theme = Theme.objects.create(title="Theme Conditional")
+		self.objective = Objective.objects.create(title="Objective Conditional", theme=self.theme)
+		self.action = Action.objects.create(
+			title="Action Conditional",
+			objective=self.objective,
+			status=ActionStatus.IN_PROGRESS,
+			is_approved=True,
+		)
+
+	def _assert_revalidates(self, url, params=None):
+		first = self.client.get(url, params or {})
+		self.assertEqual(first.status_code, 200)
+		self.assertIn("ETag", first.headers)
+		self.assertIn("Last-Modified", first.headers)
+
+		unchanged = self.client.get(url, params or {}, HTTP_IF_NONE_MATCH=first.headers["ETag"])
+		self.assertEqual(unchanged.status_code, 304)
+		return first
+
+	def test_action_lists_return_304_until_actions_change(self):
+		url = reverse("tracker_app:filter_actions_by_status", args=["in_progress"])
+		first = self._assert_revalidates(url, {"theme_id": self.theme.id})
+
+		Action.objects.create(title="Action Conditional 2", objective=self.objective, status=ActionStatus.IN_PROGRESS)
+		changed = self.client.get(url, {"theme_id": self.theme.id}, HTTP_IF_NONE_MATCH=first.headers["ETag"])
+		self.assertEqual(changed.status_code, 200)
+		self.assertEqual(changed.json()["count"], 2)
+
+		self._assert_revalidates(reverse("tracker_app:all_actions"))
+
+	def test_theme_details_and_roadmap_return_304(self):
+		first = self._assert_revalidates(reverse("tracker_app:get_theme_details", args=[self.theme.id]))
+		self._assert_revalidates(reverse("tracker_app:roadmap_data"), {"year": "2026"})
+
+		self.theme.title = "Theme Conditional Renamed"
+		with self.captureOnCommitCallbacks(execute=True):
+			self.theme.save()
+		changed = self.client.get(
+			reverse("tracker_app:get_theme_details", args=[self.theme.id]),
+			HTTP_IF_NONE_MATCH=first.headers["ETag"],
+		)
+		self.assertEqual(changed.status_code, 200)
+
+	def test_if_modified_since_returns_304(self):
+		url = reverse("tracker_app:all_actions")
+		first = self.client.get(url)
+		response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=first.headers["Last-Modified"])
+		self.assertEqual(response.status_code, 304)
+
+
+class ProfilingMiddlewareTests(TestCase):
+	def setUp(self):
+		self.client = Client()
+		theme = Theme.objects.create(title="Theme Profiling")
+		objective = Objective.objects.create(title="Objective Profiling", theme=theme)
+		Action.objects.create(title="Action Profiling", objective=objective, is_approved=True)
+		self.url = reverse("tracker_app:all_actions")
+
+	def test_profiling_is_off_by_default(self):
+		response = self.client.get(self.url)
+		self.assertNotIn("Server-Timing", response.headers)
+
+	@override_settings(TRACKER_PROFILING=True, TRACKER_PROFILING_SAMPLE_RATE=0)
+	def test_server_timing_reports_queries_templates_and_size(self):
+		response = self.client.get(self.url)
+		timing = response.headers["Server-Timing"]
+		self.assertIn('db;dur=', timing)
+		self.assertIn('desc="2 queries"', timing)
+		self.assertIn(f'size;desc="{len(response.content)} bytes"', timing)
+
+		home = self.client.get(reverse("tracker_app:home"))
+		template_ms = float(re.search(r"tpl;dur=([\d.]+)", home.headers["Server-Timing"]).group(1))
+		self.assertGreater(template_ms, 0)
+
+	@override_settings(TRACKER_PROFILING_TOKEN="s3cret", TRACKER_PROFILING_SLOW_MS=0)
+	def test_header_token_enables_profiling_and_dumps_slow_requests(self):
+		self.assertNotIn("Server-Timing", self.client.get(self.url, HTTP_X_TRACKER_PROFILE="wrong").headers)
+
+		with tempfile.TemporaryDirectory() as directory, override_settings(TRACKER_PROFILING_DIR=directory):
+			response = self.client.get(self.url, HTTP_X_TRACKER_PROFILE="s3cret")
+			self.assertIn("Server-Timing", response.headers)
+			self.assertEqual(len(os.listdir(directory)), 1)
+
+	@override_settings(TRACKER_PROFILING_TOKEN="s3cret")
+	def test_hooks_are_installed_only_during_profiled_requests(self):
+		original_render = Template.render
+		seen = []
+
+		def view_spy(execute, sql, params, many, context):
+			seen.append((Template.render is original_render, _record_query in connection.execute_wrappers))
+			return execute(sql, params, many, context)
+
+		with connection.execute_wrapper(view_spy):
+			self.client.get(self.url)
+			self.client.get(self.url, HTTP_X_TRACKER_PROFILE="s3cret")
+
+		self.assertIn((True, False), seen)
+		self.assertIn((False, True), seen)
+		self.assertIs(Template.render, original_render)
+		self.assertNotIn(_record_query, connection.execute_wrappers)
+
 
 class ThemeDetailsViewTests(TestCase):
 	def setUp(self):
@@ -694,6 +1220,101 @@ class ThemeDetailsViewTests(TestCase):
 		html = payload["html_content"]
 		self.assertIn("data-target=\"1\"", html)
 
+	def test_theme_details_cached_until_content_changes(self):
+		url = reverse("tracker_app:get_theme_details", args=[self.theme.id])
+		self.client.get(url)
+
+		with self.assertNumQueries(0):
+			cached = self.client.get(url).json()
+		self.assertIn("Update EN", cached["html_content"])
+
+		self.action_approved.update = "Fresh Update"
+		with self.captureOnCommitCallbacks(execute=True):
+			self.action_approved.save()
+
+		refreshed = self.client.get(url).json()
+		self.assertIn("Fresh Update", refreshed["html_content"])
+
+	def test_content_version_moves_only_when_the_write_commits(self):
+		url = reverse("tracker_app:get_theme_details", args=[self.theme.id])
+		version = current_content_version()
+
+		with self.captureOnCommitCallbacks() as callbacks:
+			self.action_approved.update = "Fresh Update"
+			self.action_approved.save()
+			Action.objects.filter(pk=self.action_approved.pk).update(status=ActionStatus.COMPLETED)
+			# Before the commit a concurrent request would cache the old rows; it must do so under the old version.
+			self.assertEqual(current_content_version(), version)
+			self.client.get(url)
+
+		for callback in callbacks:
+			callback()
+		self.assertNotEqual(current_content_version(), version)
+		self.assertIn("Fresh Update", self.client.get(url).json()["html_content"])
+
+	def test_batch_theme_details_renders_uncached_themes_together(self):
+		other = Theme.objects.create(title="Theme Other")
+		Objective.objects.create(title="Objective Other", theme=other)
+		single = self.client.get(reverse("tracker_app:get_theme_details", args=[self.theme.id])).json()
+
+		url = reverse("tracker_app:get_themes_details")
+		# One prefetch pass (themes, objectives, actions) for the uncached theme;
+		# the counters were cached by the single-theme request.
+		with self.assertNumQueries(3):
+			payload = self.client.get(url, {"ids": f"{self.theme.id},{other.id},9999"}).json()
+		self.assertEqual(list(payload["themes"]), [str(self.theme.id), str(other.id)])
+		self.assertEqual(payload["themes"][str(self.theme.id)], single)
+		self.assertEqual(payload["missing"], [9999])
+
+		with self.assertNumQueries(0):
+			self.client.get(url, {"ids": f"{other.id},{self.theme.id}"})
+		with self.assertNumQueries(0):
+			self.client.get(reverse("tracker_app:get_theme_details", args=[other.id]))
+
+	def test_batch_theme_details_rejects_bad_ids(self):
+		url = reverse("tracker_app:get_themes_details")
+		for ids in ("", "1,x", ",".join(str(i) for i in range(1, 30))):
+			self.assertEqual(self.client.get(url, {"ids": ids}).status_code, 400)
+
+	def test_theme_details_cache_is_per_language(self):
+		url = reverse("tracker_app:get_theme_details", args=[self.theme.id])
+		self.client.get(url)
+
+		with translation.override("ga"):
+			ga_url = reverse("tracker_app:get_theme_details", args=[self.theme.id])
+			payload = self.client.get(ga_url).json()
+
+		self.assertEqual(payload["title"], "Téama")
+
+
+class DashboardCountsTests(TestCase):
+	def setUp(self):
+		self.theme = Theme.objects.create(title="Theme Counts")
+		self.empty_theme = Theme.objects.create(title="Theme Empty")
+		for i in range(2):
+			objective = Objective.objects.create(title=f"Objective Counts {i}", theme=self.theme)
+			Action.objects.create(title=f"Action Counts {i}", objective=objective, status=ActionStatus.COMPLETED)
+		Action.objects.create(title="Action Counts 2", objective=objective, status=ActionStatus.IN_PROGRESS)
+
+	def test_counts_come_from_one_query_and_are_cached(self):
+		with self.assertNumQueries(1):
+			counts = dashboard_counts()
+		self.assertEqual((counts["themes"], counts["objectives"], counts["actions"]), (2, 2, 3))
+		self.assertEqual(counts["by_theme"][self.theme.id], {"completed": 2, "in_progress": 1, "not_started": 0})
+		self.assertEqual(counts["by_theme"][self.empty_theme.id], {"completed": 0, "in_progress": 0, "not_started": 0})
+
+		with self.assertNumQueries(0):
+			dashboard_counts()
+
+		with self.captureOnCommitCallbacks(execute=True):
+			Theme.objects.create(title="Theme Counts New")
+		self.assertEqual(dashboard_counts()["themes"], 3)
+
+	def test_home_page_renders_live_counters(self):
+		response = self.client.get(reverse("tracker_app:home"))
+		self.assertContains(response, 'data-target="2">2<', count=2)
+		self.assertContains(response, 'data-target="3">3<')
+
 
 class LanguageRoutingTests(TestCase):
 	def setUp(self):
@@ -713,15 +1334,52 @@ class LanguageRoutingTests(TestCase):
 		self.assertIn("/en/", response.headers.get("Location", ""))
 
 
+class QueuedLoggingTests(TestCase):
+	def test_file_handler_is_written_from_a_background_listener(self):
+		handlers = logging.getLogger("tracker_app").handlers
+		self.assertEqual([type(handler) for handler in handlers], [QueueHandler])
+		self.assertIs(logging.getLogger("django").handlers[0], handlers[0])
+		targets = [target for listener in _listeners for target in listener.handlers]
+		self.assertTrue(any(isinstance(target, RotatingFileHandler) for target in targets))
+
+		listeners = len(_listeners)
+		queue_handlers(["file"])
+		self.assertEqual(len(_listeners), listeners)
+
+
+class SharedCacheCheckTests(TestCase):
+	"""Several workers must not each keep their own content version."""
+
+	def _errors(self):
+		return [message for message in checks.run_checks() if message.id == "tracker_app.E001"]
+
+	def test_default_cache_is_shared_between_processes(self):
+		from progresstracker import settings as project_settings
+
+		self.assertNotEqual(project_settings.CACHES["default"]["BACKEND"], "django.core.cache.backends.locmem.LocMemCache")
+
+	@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+	def test_locmem_cache_with_several_workers_fails_the_check(self):
+		with patch.dict(os.environ, {"WEB_CONCURRENCY": "4"}):
+			self.assertEqual(len(self._errors()), 1)
+		with patch.dict(os.environ, {"WEB_CONCURRENCY": "1"}):
+			self.assertEqual(self._errors(), [])
+
+	def test_shared_cache_with_several_workers_passes(self):
+		with patch.dict(os.environ, {"WEB_CONCURRENCY": "4"}):
+			self.assertEqual(self._errors(), [])
+
+
 class AdminConfigTests(TestCase):
 	def test_action_admin_list_config(self):
 		admin_site = AdminSite()
 		action_admin = ActionAdmin(Action, admin_site)
 
-		self.assertIn("objective", action_admin.list_filter)
-		self.assertIn("status", action_admin.list_filter)
-		self.assertIn("is_approved", action_admin.list_filter)
-		self.assertIn("updated_by", action_admin.list_filter)
+		filtered_fields = [spec[0] if isinstance(spec, tuple) else spec for spec in action_admin.list_filter]
+		self.assertIn("objective", filtered_fields)
+		self.assertIn("status", filtered_fields)
+		self.assertIn("is_approved", filtered_fields)
+		self.assertIn("updated_by", filtered_fields)
 
 		self.assertIn("title", action_admin.list_display)
 		self.assertIn("objective", action_admin.list_display)
@@ -739,3 +1397,873 @@ class AdminConfigTests(TestCase):
 		objective_admin = ObjectiveAdmin(Objective, admin_site)
 		self.assertIn("theme", objective_admin.list_filter)
 		self.assertIn("title", objective_admin.list_display)
+
+
+class AdminChangelistTests(TestCase):
+	"""The action changelist's query count must not grow with the number of rows or users."""
+
+	def setUp(self):
+		User = get_user_model()
+		self.admin_user = User.objects.create_superuser("admin", "admin@example.com", "pass")
+		theme = Theme.objects.create(title="Theme")
+		objectives = [Objective.objects.create(title=f"Objective {n}", theme=theme) for n in range(5)]
+		editors = [User.objects.create_user(f"editor{n}", is_staff=True) for n in range(5)]
+		Action.objects.bulk_create([
+			Action(title=f"Action {n}", objective=objectives[n % 5], updated_by=editors[n % 5])
+			for n in range(60)
+		])
+		self.objective = objectives[2]
+		self.client.force_login(self.admin_user)
+		self.url = reverse("admin:tracker_app_action_changelist")
+
+	def count_queries(self, url):
+		queries = _QueryCounter()
+		with connection.execute_wrapper(queries):
+			response = self.client.get(url)
+		self.assertEqual(response.status_code, 200)
+		return response, queries.count
+
+	def test_changelist_query_count_is_capped(self):
+		# Session + user, one COUNT, the joined page and the estimate lookup.
+		response, count = self.count_queries(self.url)
+		self.assertLessEqual(count, 5)
+		self.assertContains(response, "Objective 0")
+		self.assertContains(response, "tracker-autocomplete-filter")
+
+		Action.objects.bulk_create([
+			Action(title=f"More {n}", objective=self.objective) for n in range(40)
+		])
+		_response, count_after = self.count_queries(self.url)
+		self.assertEqual(count_after, count)
+
+	def test_filtered_changelist_loads_only_selected_objective(self):
+		response, count = self.count_queries(f"{self.url}?objective__id__exact={self.objective.pk}")
+		# Session + user, the selected objective, one COUNT and the joined page.
+		self.assertLessEqual(count, 5)
+		self.assertContains(response, f'<option value="{self.objective.pk}" selected>')
+		self.assertNotContains(response, '<option value="%s" selected>' % Objective.objects.exclude(pk=self.objective.pk).first().pk)
+		self.assertEqual(response.context["cl"].result_count, 12)
+
+	def test_filter_choices_come_from_the_autocomplete_view(self):
+		response = self.client.get(reverse("admin:autocomplete"), {
+			"app_label": "tracker_app", "model_name": "action", "field_name": "updated_by", "term": "editor",
+		})
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(len(response.json()["results"]), 5)
+
+	def test_invalid_filter_value_is_ignored_by_the_filter(self):
+		response = self.client.get(f"{self.url}?objective__id__exact=abc")
+		self.assertIn(response.status_code, (200, 302))
+
+	def test_unfiltered_count_uses_the_table_estimate(self):
+		# A tenth of the rows approved, so the partial is_approved indexes cover fewer rows than the table.
+		Action.objects.filter(pk__in=Action.objects.order_by("pk").values("pk")[:6]).update(is_approved=True)
+		with connection.cursor() as cursor:
+			cursor.execute("ANALYZE")
+			cursor.execute(
+				"SELECT CAST(stat AS INTEGER) FROM sqlite_stat1 WHERE idx = 'action_approved_updated_idx'"
+			)
+			self.assertEqual(cursor.fetchone()[0], 6)
+		with patch.object(EstimatedCountPaginator, "estimate_threshold", 10):
+			paginator = EstimatedCountPaginator(Action.objects.order_by("pk"), 25)
+			self.assertEqual(paginator.count, Action.objects.count())
+			self.assertEqual(paginator.count, 60)
+			self.assertEqual(estimated_row_count(Action), 60)
+
+			filtered = EstimatedCountPaginator(Action.objects.filter(objective=self.objective).order_by("pk"), 25)
+			with self.assertNumQueries(1):
+				self.assertEqual(filtered.count, 12)
+
+	def test_small_tables_are_counted_exactly(self):
+		paginator = EstimatedCountPaginator(Action.objects.order_by("pk"), 25)
+		self.assertEqual(paginator.count, 60)
+
+
+class AdminBulkActionTests(TestCase):
+	"""Changelist bulk actions apply save_model()'s status rules in one UPDATE."""
+
+	def setUp(self):
+		User = get_user_model()
+		self.admin_user = User.objects.create_superuser("admin", "admin@example.com", "pass")
+		self.staff = User.objects.create_user("staff", "staff@example.com", "pass", is_staff=True)
+		objective = Objective.objects.create(title="Objective", theme=Theme.objects.create(title="Theme"))
+		self.with_update = Action.objects.create(title="With update", objective=objective, update="<p>Done some</p>")
+		self.irish_update = Action.objects.create(title="Irish update", objective=objective, update_ga="<p>Rinneadh</p>")
+		self.blank = Action.objects.create(title="Blank", objective=objective, update="<p> </p>")
+		self.completed = Action.objects.create(title="Completed", objective=objective, status=ActionStatus.COMPLETED)
+		self.started = Action.objects.create(
+			title="Started", objective=objective, update="<p>x</p>", progress_started_at=date(2024, 3, 1)
+		)
+		self.actions = [self.with_update, self.irish_update, self.blank, self.completed, self.started]
+		self.url = reverse("admin:tracker_app_action_changelist")
+
+	def run_action(self, name, actions=None):
+		return self.client.post(self.url, {
+			"action": name,
+			"_selected_action": [action.pk for action in actions or self.actions],
+		})
+
+	def statuses(self):
+		return {action.title: (action.status, action.is_approved) for action in Action.objects.all()}
+
+	def test_approve_keeps_completed_and_derives_the_rest_from_update_text(self):
+		self.client.force_login(self.admin_user)
+		self.run_action("approve_selected")
+		self.assertEqual(self.statuses(), {
+			"With update": (ActionStatus.IN_PROGRESS, True),
+			"Irish update": (ActionStatus.IN_PROGRESS, True),
+			"Blank": (ActionStatus.NOT_STARTED, True),
+			"Completed": (ActionStatus.COMPLETED, True),
+			"Started": (ActionStatus.IN_PROGRESS, True),
+		})
+		self.with_update.refresh_from_db()
+		self.started.refresh_from_db()
+		self.completed.refresh_from_db()
+		self.assertEqual(self.with_update.progress_started_at, date.today())
+		self.assertEqual(self.started.progress_started_at, date(2024, 3, 1))
+		self.assertIsNone(self.completed.progress_started_at)
+		self.assertEqual(self.with_update.updated_by, self.admin_user)
+
+	def test_mark_completed_approves(self):
+		self.client.force_login(self.admin_user)
+		self.run_action("mark_completed", [self.blank, self.with_update])
+		self.assertEqual(self.statuses()["Blank"], (ActionStatus.COMPLETED, True))
+		self.assertEqual(self.statuses()["With update"], (ActionStatus.COMPLETED, True))
+		self.assertEqual(self.statuses()["Irish update"], (ActionStatus.NOT_STARTED, False))
+
+	def test_set_in_progress_needs_update_text(self):
+		self.client.force_login(self.admin_user)
+		self.run_action("set_in_progress")
+		statuses = self.statuses()
+		self.assertEqual(statuses["With update"], (ActionStatus.IN_PROGRESS, True))
+		self.assertEqual(statuses["Completed"], (ActionStatus.NOT_STARTED, True))
+		self.assertEqual(statuses["Blank"], (ActionStatus.NOT_STARTED, True))
+
+	def test_derived_data_is_refreshed_once_per_batch(self):
+		self.client.force_login(self.admin_user)
+		with patch("tracker_app.signals.bump_content_version") as bump, \
+				patch("tracker_app.signals.apply_rollup_deltas") as move_rollups, \
+				patch("tracker_app.signals.search.reindex_actions") as reindex, \
+				self.captureOnCommitCallbacks(execute=True):
+			self.run_action("approve_selected")
+		bump.assert_called_once()
+		move_rollups.assert_called_once()
+		reindex.assert_called_once()
+		self.assertEqual(sorted(reindex.call_args.args[0]), sorted(action.pk for action in self.actions))
+		# The status changes are still logged, one event per changed action.
+		self.assertEqual(
+			ActionStatusEvent.objects.filter(approved=True, action=self.with_update).last().to_status,
+			ActionStatus.IN_PROGRESS,
+		)
+
+	def test_query_count_does_not_grow_with_the_selection(self):
+		self.client.force_login(self.admin_user)
+		queries = _QueryCounter()
+		with connection.execute_wrapper(queries):
+			self.run_action("approve_selected", self.actions[:2])
+		objective = self.with_update.objective
+		more = Action.objects.bulk_create([
+			Action(title=f"Bulk {n}", objective=objective, update_plain="text") for n in range(30)
+		])
+		Action.objects.update(is_approved=False)
+		larger = _QueryCounter()
+		with connection.execute_wrapper(larger):
+			self.run_action("approve_selected", self.actions[:2] + more)
+		self.assertEqual(larger.count, queries.count)
+
+	def test_staff_cannot_run_the_bulk_actions(self):
+		self.staff.user_permissions.add(*Permission.objects.filter(codename__in=["view_action", "change_action"]))
+		self.client.force_login(self.staff)
+		response = self.client.get(self.url)
+		self.assertNotContains(response, "approve_selected")
+		self.run_action("mark_completed")
+		self.assertEqual(self.statuses()["Blank"], (ActionStatus.NOT_STARTED, False))
+
+
+class RoadmapPayloadQueryTests(TestCase):
+	def setUp(self):
+		self.theme = Theme.objects.create(title="Theme Roadmap")
+		self.objective = Objective.objects.create(title="Objective Roadmap", theme=self.theme)
+
+	def _create_action(self, title, progress_started_at, updated_at, status=ActionStatus.IN_PROGRESS):
+		action = Action.objects.create(
+			title=title,
+			objective=self.objective,
+			status=status,
+			progress_started_at=progress_started_at,
+			is_approved=True,
+		)
+		Action.objects.filter(pk=action.pk).update(updated_at=updated_at)
+		return action
+
+	@patch("tracker_app.views.timezone.now")
+	def test_roadmap_payload_uses_single_query(self, mock_now):
+		mock_now.return_value = datetime(2026, 1, 1, tzinfo=dt_timezone.utc)
+		for i in range(5):
+			self._create_action(f"Started {i}", date(2024, i + 1, 1), datetime(2024, i + 1, 2, tzinfo=dt_timezone.utc))
+
+		with self.assertNumQueries(1):
+			payload = _build_roadmap_payload("2024")
+
+		self.assertEqual(payload["started_total_year"], 5)
+
+	@patch("tracker_app.views.timezone.now")
+	def test_roadmap_payload_series_and_kpis(self, mock_now):
+		mock_now.return_value = datetime(2026, 1, 1, tzinfo=dt_timezone.utc)
+		self._create_action("Started Jan", date(2024, 1, 5), datetime(2024, 1, 6, tzinfo=dt_timezone.utc))
+		self._create_action("Continued Jan", date(2023, 6, 1), datetime(2024, 1, 7, tzinfo=dt_timezone.utc))
+		self._create_action("No start Mar", None, datetime(2024, 3, 15, tzinfo=dt_timezone.utc))
+		self._create_action(
+			"Completed Apr",
+			date(2023, 4, 1),
+			datetime(2024, 4, 20, tzinfo=dt_timezone.utc),
+			status=ActionStatus.COMPLETED,
+		)
+		self._create_action("Other year", date(2025, 2, 1), datetime(2025, 2, 2, tzinfo=dt_timezone.utc))
+
+		payload = _build_roadmap_payload("2024")
+
+		self.assertEqual(payload["chart_data_started"][0], 1)
+		self.assertEqual(payload["chart_data_continued"][0], 1)
+		self.assertEqual(payload["chart_data_continued"][2], 1)
+		self.assertEqual(payload["chart_data_completed"][3], 1)
+		self.assertEqual(payload["chart_data_in_progress"][0], 2)
+		self.assertEqual(payload["completed_total_year"], 1)
+		self.assertEqual(payload["started_total_year"], 1)
+		self.assertEqual(payload["continued_total_year"], 2)
+		self.assertEqual(payload["in_progress_total_year"], 3)
+
+
+class RoadmapRangeTests(TestCase):
+	"""``/api/roadmap-data/?from=&to=&granularity=`` over arbitrary ranges."""
+
+	def setUp(self):
+		objective = Objective.objects.create(title="Objective Range", theme=Theme.objects.create(title="Theme Range"))
+		rows = [
+			("Started Jan", date(2024, 1, 5), datetime(2024, 1, 6, tzinfo=dt_timezone.utc), ActionStatus.IN_PROGRESS),
+			("Continued Feb", date(2023, 6, 1), datetime(2024, 2, 7, tzinfo=dt_timezone.utc), ActionStatus.IN_PROGRESS),
+			("No start May", None, datetime(2024, 5, 15, tzinfo=dt_timezone.utc), ActionStatus.IN_PROGRESS),
+			("Completed Aug", date(2023, 4, 1), datetime(2024, 8, 20, tzinfo=dt_timezone.utc), ActionStatus.COMPLETED),
+			("Started 2025", date(2025, 2, 1), datetime(2025, 2, 2, tzinfo=dt_timezone.utc), ActionStatus.IN_PROGRESS),
+		]
+		for title, started, updated, status in rows:
+			action = Action.objects.create(
+				title=title, objective=objective, status=status, progress_started_at=started, is_approved=True
+			)
+			Action.objects.filter(pk=action.pk).update(updated_at=updated)
+		self.url = reverse("tracker_app:roadmap_data")
+
+	def test_quarterly_range_across_years(self):
+		response = self.client.get(self.url, {"from": "2024-01-01", "to": "2025-12-31", "granularity": "quarter"})
+		self.assertEqual(response.status_code, 200)
+		payload = response.json()
+		self.assertEqual(payload["chart_labels"], [f"{year}-Q{quarter}" for year in (2024, 2025) for quarter in range(1, 5)])
+		self.assertEqual(payload["chart_data_started"], [1, 0, 0, 0, 1, 0, 0, 0])
+		self.assertEqual(payload["chart_data_continued"], [1, 1, 0, 0, 0, 0, 0, 0])
+		self.assertEqual(payload["chart_data_completed"], [0, 0, 1, 0, 0, 0, 0, 0])
+		self.assertEqual(payload["in_progress_total"], 4)
+
+	def test_monthly_range_over_a_year_matches_the_yearly_series(self):
+		self.assertEqual(field_range_series(date(2024, 1, 1), date(2025, 1, 1), "month"), monthly_series(2024))
+
+	def test_weekly_buckets_start_on_monday(self):
+		with self.assertNumQueries(2):
+			payload = _build_range_payload(date(2024, 1, 3), date(2024, 2, 1), "week")
+		self.assertEqual(payload["bucket_starts"][0], "2024-01-01")
+		self.assertEqual(payload["chart_labels"][:2], ["2024-W01", "2024-W02"])
+		self.assertEqual(payload["chart_data_started"][0], 1)
+		self.assertEqual(payload["started_total"], 1)
+
+	@override_settings(TRACKER_ROADMAP_SOURCE="events")
+	def test_event_source_matches_the_yearly_event_series(self):
+		starts, series = range_series(date(2024, 1, 1), date(2025, 1, 1), "month")
+		self.assertEqual(len(starts), 12)
+		self.assertEqual(series, event_series(2024))
+
+	def test_invalid_ranges_are_rejected(self):
+		for params in (
+			{"granularity": "day"},
+			{"from": "2024-13-01"},
+			{"from": "2024-05-01", "to": "2024-04-01"},
+			{"from": "1900-01-01", "to": "2030-12-31", "granularity": "week"},
+			{"from": "9999-12-01", "to": "9999-12-31"},
+			{"to": "9999-12-31", "granularity": "quarter"},
+			{"from": "0001-01-01", "to": "0001-03-01"},
+		):
+			response = self.client.get(self.url, params)
+			self.assertEqual(response.status_code, 400, params)
+			self.assertIn("error", response.json())
+
+	def test_year_only_requests_keep_the_yearly_payload(self):
+		payload = self.client.get(self.url, {"year": "2024"}).json()
+		self.assertEqual(payload["chart_year"], 2024)
+		self.assertEqual(len(payload["chart_data_started"]), 12)
+
+
+class RoadmapThemeMatrixTests(TestCase):
+	"""Per-theme monthly series (themes x months) from one grouped query."""
+
+	def setUp(self):
+		self.year, _current_year = views._resolve_chart_year(None)
+		self.digital = Theme.objects.create(title="Digital services")
+		self.workforce = Theme.objects.create(title="Workforce")
+		self.quiet = Theme.objects.create(title="Communities")
+		Objective.objects.create(title="Quiet objective", theme=self.quiet)
+		digital_objectives = [Objective.objects.create(title=f"Digital {n}", theme=self.digital) for n in range(2)]
+		workforce_objective = Objective.objects.create(title="Workforce 1", theme=self.workforce)
+		rows = [
+			(digital_objectives[0], date(self.year, 1, 5), (1, 6), ActionStatus.IN_PROGRESS),
+			(digital_objectives[1], date(self.year, 3, 1), (4, 2), ActionStatus.COMPLETED),
+			(workforce_objective, date(self.year - 1, 6, 1), (2, 7), ActionStatus.IN_PROGRESS),
+			(workforce_objective, date(self.year, 2, 10), (2, 11), ActionStatus.IN_PROGRESS),
+		]
+		for n, (objective, started, (month, day), status) in enumerate(rows):
+			action = Action.objects.create(
+				title=f"Matrix {n}", objective=objective, status=status, progress_started_at=started, is_approved=True
+			)
+			Action.objects.filter(pk=action.pk).update(
+				updated_at=datetime(self.year, month, day, tzinfo=dt_timezone.utc)
+			)
+
+	def test_matrix_is_one_query_and_sums_to_the_global_series(self):
+		with self.assertNumQueries(1):
+			matrix = theme_monthly_series(self.year)
+		self.assertEqual(matrix["theme_ids"], [self.digital.pk, self.workforce.pk])
+		digital = theme_series(matrix, self.digital.pk)
+		self.assertEqual(digital["started"][:3], [1, 0, 1])
+		self.assertEqual(digital["completed"][3], 1)
+		workforce = theme_series(matrix, self.workforce.pk)
+		self.assertEqual(workforce["continued"][1], 1)
+		self.assertEqual(workforce["started"][1], 1)
+		self.assertEqual(theme_series(matrix, self.quiet.pk)["started"], [0] * 12)
+
+		overall = monthly_series(self.year)
+		for name in ("completed", "started", "continued"):
+			self.assertEqual([sum(month) for month in zip(*matrix[name])], overall[name])
+
+	def test_roadmap_api_returns_the_matrix_by_theme(self):
+		url = reverse("tracker_app:roadmap_data")
+		payload = self.client.get(url, {"year": self.year, "by": "theme"}).json()
+		self.assertEqual(payload["year"], self.year)
+		self.assertEqual(len(payload["started"]), 2)
+		self.assertEqual(len(payload["started"][0]), 12)
+
+		response = self.client.get(url, {"by": "theme", "granularity": "quarter"})
+		self.assertEqual(response.status_code, 400)
+
+	def test_theme_modals_embed_their_trend_from_the_shared_matrix(self):
+		first = self.client.get(reverse("tracker_app:get_theme_details", args=[self.digital.pk])).json()
+		self.assertEqual(first["roadmap"]["year"], self.year)
+		self.assertEqual(first["roadmap"]["completed"][3], 1)
+
+		# The counters and matrix are cached: the next modal only loads its theme.
+		with self.assertNumQueries(3):
+			second = self.client.get(reverse("tracker_app:get_theme_details", args=[self.workforce.pk])).json()
+		self.assertEqual(second["roadmap"]["continued"][1], 1)
+
+	@override_settings(TRACKER_ROADMAP_SOURCE="events")
+	def test_event_source_splits_the_event_series_by_theme(self):
+		digital, workforce = Action.objects.get(title="Matrix 1"), Action.objects.get(title="Matrix 2")
+		ActionStatusEvent.objects.all().delete()
+		at = lambda year, month: datetime(year, month, 15, 12, tzinfo=dt_timezone.utc)
+		ActionStatusEvent.objects.bulk_create([
+			ActionStatusEvent(action=workforce, to_status=ActionStatus.IN_PROGRESS, at=at(self.year - 1, 6), approved=True),
+			ActionStatusEvent(action=digital, to_status=ActionStatus.IN_PROGRESS, at=at(self.year, 1), approved=True),
+			# Completed in January, although the action fields say April.
+			ActionStatusEvent(
+				action=digital, from_status=ActionStatus.IN_PROGRESS, to_status=ActionStatus.COMPLETED,
+				at=at(self.year, 1), approved=True,
+			),
+		])
+
+		matrix = theme_roadmap(self.year)
+		self.assertEqual(matrix["theme_ids"], [self.digital.pk, self.workforce.pk])
+		self.assertEqual(theme_series(matrix, self.digital.pk)["completed"][:4], [1, 0, 0, 0])
+		self.assertEqual(theme_series(matrix, self.workforce.pk)["continued"][0], 1)
+
+		overall = event_series(self.year)
+		for name in ("completed", "started", "continued"):
+			self.assertEqual([sum(month) for month in zip(*matrix[name])], overall[name])
+
+
+class RoadmapRollupTests(TestCase):
+	def setUp(self):
+		self.theme = Theme.objects.create(title="Theme Rollup")
+		self.objective = Objective.objects.create(title="Objective Rollup", theme=self.theme)
+
+	def _stat(self, year, month):
+		return ActionMonthlyStat.objects.get(year=year, month=month)
+
+	def test_save_refreshes_rollups_for_old_and_new_months(self):
+		action = Action.objects.create(
+			title="Rollup Action",
+			objective=self.objective,
+			status=ActionStatus.IN_PROGRESS,
+			progress_started_at=date(2024, 2, 1),
+			is_approved=True,
+		)
+		self.assertEqual(self._stat(2024, 2).started, 1)
+
+		action = Action.objects.get(pk=action.pk)
+		action.progress_started_at = date(2025, 5, 1)
+		action.save()
+
+		self.assertEqual(self._stat(2024, 2).started, 0)
+		self.assertEqual(self._stat(2025, 5).started, 1)
+
+	def test_queryset_update_moves_completed_month(self):
+		action = Action.objects.create(
+			title="Rollup Completed",
+			objective=self.objective,
+			status=ActionStatus.COMPLETED,
+			is_approved=True,
+		)
+		Action.objects.filter(pk=action.pk).update(updated_at=datetime(2024, 3, 10, tzinfo=dt_timezone.utc))
+		self.assertEqual(self._stat(2024, 3).completed, 1)
+
+		Action.objects.filter(pk=action.pk).update(updated_at=datetime(2024, 7, 10, tzinfo=dt_timezone.utc))
+		self.assertEqual(self._stat(2024, 3).completed, 0)
+		self.assertEqual(self._stat(2024, 7).completed, 1)
+
+	def test_delete_removes_contribution(self):
+		action = Action.objects.create(
+			title="Rollup Deleted",
+			objective=self.objective,
+			progress_started_at=date(2024, 9, 1),
+			is_approved=True,
+		)
+		Action.objects.get(pk=action.pk).delete()
+		self.assertEqual(self._stat(2024, 9).started, 0)
+
+	def test_writes_keep_rollups_equal_to_the_live_aggregation(self):
+		carried = Action.objects.create(
+			title="Rollup Carried",
+			objective=self.objective,
+			status=ActionStatus.IN_PROGRESS,
+			progress_started_at=date(2023, 11, 1),
+			is_approved=True,
+		)
+		done = Action.objects.create(
+			title="Rollup Done", objective=self.objective, status=ActionStatus.COMPLETED, is_approved=True
+		)
+		Action.objects.filter(pk__in=[carried.pk, done.pk]).update(
+			updated_at=datetime(2024, 2, 3, tzinfo=dt_timezone.utc)
+		)
+		self.assertEqual((self._stat(2024, 2).continued, self._stat(2024, 2).completed), (1, 1))
+
+		carried = Action.objects.get(pk=carried.pk)
+		carried.status = ActionStatus.COMPLETED
+		carried.save()
+		Action.objects.filter(pk=done.pk).update(is_approved=False)
+		self.assertEqual((self._stat(2024, 2).continued, self._stat(2024, 2).completed), (0, 0))
+		call_command("rebuild_roadmap_rollups", "--check", stdout=StringIO())
+
+	def test_save_moves_counts_without_reaggregating_the_table(self):
+		action = Action.objects.create(
+			title="Rollup Moved", objective=self.objective, progress_started_at=date(2024, 2, 1), is_approved=True
+		)
+
+		def save_queries(started):
+			instance = Action.objects.get(pk=action.pk)
+			instance.progress_started_at = started
+			with CaptureQueriesContext(connection) as ctx:
+				instance.save()
+			return [query["sql"] for query in ctx.captured_queries]
+
+		few = save_queries(date(2024, 3, 1))
+		Action.objects.bulk_create([
+			Action(title=f"Rollup Bulk {n}", objective=self.objective, is_approved=True) for n in range(30)
+		])
+		many = save_queries(date(2024, 4, 1))
+		self.assertEqual(len(many), len(few))
+		self.assertFalse([sql for sql in many if "COUNT(" in sql.upper()])
+		self.assertEqual((self._stat(2024, 3).started, self._stat(2024, 4).started), (0, 1))
+
+	@override_settings(TRACKER_ROADMAP_SOURCE="events")
+	def test_event_source_moves_counts_with_the_logged_events(self):
+		year, month = timezone.localtime().year, timezone.localtime().month
+		action = Action.objects.create(title="Rollup Events", objective=self.objective, is_approved=True)
+		action.status = ActionStatus.IN_PROGRESS
+		action.save()
+		Action.objects.filter(pk=action.pk).update(status=ActionStatus.COMPLETED)
+		self.assertEqual((self._stat(year, month).started, self._stat(year, month).completed), (1, 1))
+		self.assertEqual(rollup_series(year), event_series(year))
+
+		Action.objects.get(pk=action.pk).delete()
+		self.assertEqual((self._stat(year, month).started, self._stat(year, month).completed), (0, 0))
+
+	def test_rebuild_command_restores_and_verifies_rollups(self):
+		Action.objects.create(
+			title="Rollup Rebuild",
+			objective=self.objective,
+			progress_started_at=date(2024, 4, 1),
+			is_approved=True,
+		)
+		ActionMonthlyStat.objects.filter(year=2024, month=4).update(started=7)
+
+		with self.assertRaises(CommandError):
+			call_command("rebuild_roadmap_rollups", "--check", stdout=StringIO(), stderr=StringIO())
+
+		call_command("rebuild_roadmap_rollups", stdout=StringIO())
+		self.assertEqual(self._stat(2024, 4).started, 1)
+
+
+class ActionStatusEventTests(TestCase):
+	def setUp(self):
+		self.theme = Theme.objects.create(title="Theme Events")
+		self.objective = Objective.objects.create(title="Objective Events", theme=self.theme)
+
+	def _events(self, action):
+		return list(action.status_events.values_list("from_status", "to_status", "approved"))
+
+	def _at(self, year, month, day):
+		return datetime(year, month, day, 12, tzinfo=dt_timezone.utc)
+
+	def test_saves_log_transitions_and_the_public_timeline(self):
+		action = Action.objects.create(title="Action Events", objective=self.objective)
+		action.status = ActionStatus.IN_PROGRESS
+		action.save()
+		action.title = "Action Events (renamed)"
+		action.save()
+		self.assertEqual(self._events(action), [
+			("", ActionStatus.NOT_STARTED, False),
+			(ActionStatus.NOT_STARTED, ActionStatus.IN_PROGRESS, False),
+		])
+
+		# Approval publishes the status; the public had not seen the action before.
+		action = Action.objects.get(pk=action.pk)
+		action.is_approved = True
+		action.save()
+		Action.objects.filter(pk=action.pk).update(status=ActionStatus.COMPLETED)
+		self.assertEqual(self._events(action)[2:], [
+			("", ActionStatus.IN_PROGRESS, True),
+			(ActionStatus.IN_PROGRESS, ActionStatus.COMPLETED, True),
+		])
+
+	def test_backfill_command_reconstructs_history_once(self):
+		action = Action.objects.create(
+			title="Action Backfill",
+			objective=self.objective,
+			status=ActionStatus.COMPLETED,
+			progress_started_at=date(2024, 1, 10),
+			is_approved=True,
+		)
+		Action.objects.filter(pk=action.pk).update(updated_at=self._at(2024, 3, 5))
+		action.status_events.all().delete()
+
+		out = StringIO()
+		call_command("backfill_status_events", stdout=out)
+		self.assertIn("Wrote 2 status event(s)", out.getvalue())
+		self.assertEqual(
+			list(action.status_events.values_list("to_status", "at")),
+			[
+				(ActionStatus.IN_PROGRESS, datetime(2024, 1, 10, tzinfo=dt_timezone.utc)),
+				(ActionStatus.COMPLETED, self._at(2024, 3, 5)),
+			],
+		)
+		call_command("backfill_status_events", stdout=out)
+		self.assertIn("Wrote 0 status event(s)", out.getvalue())
+
+	@override_settings(TRACKER_ROADMAP_SOURCE="events")
+	def test_event_series_and_snapshot_use_transition_times(self):
+		carried = Action.objects.create(title="Action Carried", objective=self.objective, is_approved=True)
+		late_edit = Action.objects.create(title="Action Late Edit", objective=self.objective, is_approved=True)
+		ActionStatusEvent.objects.all().delete()
+		ActionStatusEvent.objects.bulk_create([
+			ActionStatusEvent(action=carried, to_status=ActionStatus.IN_PROGRESS, at=self._at(2023, 6, 1), approved=True),
+			ActionStatusEvent(
+				action=carried, from_status=ActionStatus.IN_PROGRESS, to_status=ActionStatus.COMPLETED,
+				at=self._at(2024, 4, 2), approved=True,
+			),
+			ActionStatusEvent(action=late_edit, to_status=ActionStatus.IN_PROGRESS, at=self._at(2024, 1, 3), approved=True),
+			# Completed in January even though the action was last edited later.
+			ActionStatusEvent(
+				action=late_edit, from_status=ActionStatus.IN_PROGRESS, to_status=ActionStatus.COMPLETED,
+				at=self._at(2024, 1, 20), approved=True,
+			),
+		])
+
+		with self.assertNumQueries(2):
+			series = event_series(2024)
+		self.assertEqual(series["completed"][:4], [1, 0, 0, 1])
+		self.assertEqual(series["started"][:2], [1, 0])
+		self.assertEqual(series["continued"][:5], [1, 1, 1, 0, 0])
+
+		call_command("rebuild_roadmap_rollups", stdout=StringIO())
+		self.assertEqual(rollup_series(2024), series)
+
+		snapshot = self.client.get(reverse("tracker_app:status_snapshot"), {"as_of": "2024-01-10"}).json()
+		self.assertEqual(snapshot["counts"], {"completed": 0, "in_progress": 2, "not_started": 0})
+		self.assertEqual(
+			self.client.get(reverse("tracker_app:status_snapshot"), {"as_of": "2024-13-01"}).status_code, 400
+		)
+		self.assertEqual(
+			self.client.get(reverse("tracker_app:status_snapshot"), {"as_of": "9999-12-31"}).status_code, 400
+		)
+		self.assertEqual(
+			self.client.get(reverse("tracker_app:status_snapshot"), {"as_of": "9999-12-30"}).status_code, 200
+		)
+
+	@override_settings(TRACKER_ROADMAP_SOURCE="events")
+	def test_continued_work_fills_months_opened_after_the_last_write(self):
+		carried = Action.objects.create(title="Action Ongoing", objective=self.objective, is_approved=True)
+		ActionStatusEvent.objects.all().delete()
+		ActionStatusEvent.objects.create(
+			action=carried, to_status=ActionStatus.IN_PROGRESS, at=self._at(2029, 6, 1), approved=True
+		)
+		with patch("django.utils.timezone.now", return_value=self._at(2030, 3, 15)):
+			call_command("rebuild_roadmap_rollups", stdout=StringIO())
+			self.assertEqual(rollup_series(2030)["continued"][:5], [1, 1, 1, 0, 0])
+
+		# No write since March: April and May still count the carried work once they start.
+		with patch("django.utils.timezone.now", return_value=self._at(2030, 5, 2)):
+			self.assertEqual(rollup_series(2030)["continued"][:6], [1, 1, 1, 1, 1, 0])
+			self.assertEqual(rollup_series(2030), event_series(2030))
+
+		with patch("django.utils.timezone.now", return_value=self._at(2031, 1, 10)):
+			self.assertEqual(rollup_series(2030)["continued"][11], 1)
+			self.assertEqual(rollup_series(2031)["continued"][:2], [1, 0])
+
+
+class QueryPlanTests(TestCase):
+	"""Runs EXPLAIN over each view's queries and fails if the action table is fully scanned."""
+
+	SQLITE_FULL_SCAN = re.compile(r"^SCAN tracker_app_action\b")
+
+	def setUp(self):
+		if connection.vendor not in ("sqlite", "postgresql"):
+			self.skipTest("Query plan checks support SQLite and PostgreSQL only.")
+		self.client = Client()
+		self.theme = Theme.objects.create(title="Theme Plan")
+		self.objective = Objective.objects.create(title="Objective Plan", theme=self.theme)
+		for i, status in enumerate(ActionStatus.values):
+			Action.objects.create(
+				title=f"Action Plan {i}",
+				objective=self.objective,
+				status=status,
+				progress_started_at=date(2024, i + 1, 1),
+				is_approved=True,
+			)
+
+	def _explain(self, sql):
+		with connection.cursor() as cursor:
+			if connection.vendor == "postgresql":
+				# Tiny test tables always favour a sequential scan; make the
+				# planner pick an index whenever a usable one exists.
+				cursor.execute("SET LOCAL enable_seqscan = off")
+				cursor.execute("EXPLAIN " + sql)
+			else:
+				cursor.execute("EXPLAIN QUERY PLAN " + sql)
+			return [str(row[-1]) for row in cursor.fetchall()]
+
+	def _is_full_scan(self, line):
+		if connection.vendor == "postgresql":
+			return "Seq Scan on tracker_app_action " in line + " "
+		return bool(self.SQLITE_FULL_SCAN.match(line.strip()))
+
+	def assertNoFullActionScan(self, run):
+		with CaptureQueriesContext(connection) as ctx:
+			run()
+		checked = 0
+		for query in ctx.captured_queries:
+			sql = query["sql"]
+			if not sql.startswith("SELECT") or "tracker_app_action" not in sql:
+				continue
+			checked += 1
+			plan = self._explain(sql)
+			for line in plan:
+				self.assertFalse(self._is_full_scan(line), f"Full scan in plan {plan} for: {sql}")
+		self.assertGreater(checked, 0)
+
+	def test_status_list_uses_indexes(self):
+		url = reverse("tracker_app:filter_actions_by_status", args=["completed"])
+		self.assertNoFullActionScan(lambda: self.client.get(url))
+		self.assertNoFullActionScan(lambda: self.client.get(url, {"cursor": "", "with_count": "1"}))
+
+	def test_theme_scoped_lists_use_indexes(self):
+		status_url = reverse("tracker_app:filter_actions_by_status", args=["in_progress"])
+		all_url = reverse("tracker_app:all_actions")
+		self.assertNoFullActionScan(lambda: self.client.get(status_url, {"theme_id": self.theme.id}))
+		self.assertNoFullActionScan(lambda: self.client.get(all_url, {"theme_id": self.theme.id}))
+
+	def test_theme_details_uses_indexes(self):
+		url = reverse("tracker_app:get_theme_details", args=[self.theme.id])
+		self.assertNoFullActionScan(lambda: self.client.get(url))
+
+	def test_roadmap_aggregation_uses_indexes(self):
+		self.assertNoFullActionScan(lambda: monthly_series(2024))
+
+	def test_roadmap_range_uses_indexes(self):
+		self.assertNoFullActionScan(lambda: field_range_series(date(2024, 1, 1), date(2026, 1, 1), "quarter"))
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class SeedTrackerCommandTests(TestCase):
+	def _spec_file(self, spec):
+		handle = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False)
+		with handle:
+			json.dump(spec, handle)
+		self.addCleanup(os.remove, handle.name)
+		return handle.name
+
+	def _spec(self, status="IN_PROGRESS"):
+		return {
+			"themes": [{
+				"title": "Seed Theme",
+				"objectives": [{
+					"title": "Seed Objective",
+					"actions": [{
+						"title": "Seed Action",
+						"status": status,
+						"progress_started_at": "2025-03-04",
+						"updated_at": "2025-06-01T12:00:00",
+						"is_approved": True,
+						"description": "<p>Seeded broadband</p>",
+					}],
+				}],
+			}],
+		}
+
+	def test_seed_is_idempotent_upsert(self):
+		call_command("seed_tracker", self._spec_file(self._spec()), stdout=StringIO())
+		call_command("seed_tracker", self._spec_file(self._spec(status="COMPLETED")), stdout=StringIO())
+
+		self.assertEqual(Theme.objects.filter(title="Seed Theme").count(), 1)
+		action = Action.objects.get(title="Seed Action")
+		self.assertEqual(action.status, ActionStatus.COMPLETED)
+		self.assertEqual(action.progress_started_at, date(2025, 3, 4))
+		self.assertEqual(action.updated_at.year, 2025)
+		self.assertEqual(action.description_plain, "Seeded broadband")
+		self.assertEqual(monthly_series(2025)["completed"][5], 1)
+		self.assertEqual(ActionMonthlyStat.objects.get(year=2025, month=6).completed, 1)
+		self.assertEqual(search.search("broadband", 10), (1, [action.pk]))
+
+	def test_synthetic_dataset_uses_spec_objectives_and_keeps_rollups_consistent(self):
+		spec = self._spec()
+		spec["synthetic"] = {"actions": 50, "years": [2024, 2025], "seed": 3}
+		call_command("seed_tracker", self._spec_file(spec), stdout=StringIO())
+
+		self.assertEqual(Action.objects.count(), 51)
+		self.assertEqual(Objective.objects.count(), 1)
+		call_command("rebuild_roadmap_rollups", "--check", stdout=StringIO())
+
+	def test_duplicate_titles_are_rejected(self):
+		spec = self._spec()
+		objective = spec["themes"][0]["objectives"][0]
+		objective["actions"].append(dict(objective["actions"][0]))
+		with self.assertRaises(CommandError):
+			call_command("seed_tracker", self._spec_file(spec), stdout=StringIO())
+		self.assertFalse(Theme.objects.filter(title="Seed Theme").exists())
+
+
+class BenchmarkSuiteTests(TestCase):
+	def test_benchmarks_report_every_target_within_query_budget(self):
+		report = run_benchmarks(sizes=[30, 60], repeat=1)
+		json.dumps(report)
+
+		self.assertEqual(len(report["results"]), 2 * 2 * len(QUERY_BUDGETS))
+		self.assertEqual(set(WALL_MS_BUDGETS[1000]), set(QUERY_BUDGETS))
+		for row in report["results"]:
+			self.assertLessEqual(row["queries"], QUERY_BUDGETS[row["target"]], row)
+			self.assertGreater(row["bytes"], 0)
+			self.assertGreater(row["peak_kib"], 0)
+
+	def _report(self, median, queries=1, peak_kib=10.0, size=1000):
+		return {"results": [{
+			"size": size, "language": "en", "target": "roadmap_payload",
+			"wall_ms": {"min": median, "median": median, "max": median},
+			"queries": queries, "peak_kib": peak_kib, "bytes": 100,
+		}]}
+
+	def test_budgets_flag_slow_or_chatty_results(self):
+		budget = WALL_MS_BUDGETS[1000]["roadmap_payload"]
+		self.assertEqual(check_budgets(self._report(budget / 2)), [])
+		self.assertEqual(len(check_budgets(self._report(budget * 2))), 1)
+		self.assertEqual(len(check_budgets(self._report(budget * 2, size=30))), 0)
+		self.assertEqual(len(check_budgets(self._report(1, queries=3))), 1)
+
+	def test_compare_flags_regressions_beyond_tolerance_and_noise(self):
+		baseline = self._report(10.0)
+		self.assertEqual(compare(self._report(12.0), baseline), [])
+		self.assertEqual(len(compare(self._report(20.0), baseline)), 1)
+		self.assertEqual(len(compare(self._report(10.0, queries=2), baseline)), 1)
+		self.assertEqual(len(compare(self._report(10.0, peak_kib=30.0), baseline)), 1)
+		# Sub-millisecond targets double on timer noise alone.
+		self.assertEqual(compare(self._report(0.6), self._report(0.2)), [])
+
+
+class ApprovalNotificationDeliveryTests(TestCase):
+	def setUp(self):
+		User = get_user_model()
+		self.staff = User.objects.create_user("staff_notify", "staff@example.com", "pass", is_staff=True)
+		User.objects.create_superuser("boss_one", "boss1@example.com", "pass")
+		User.objects.create_superuser("boss_two", "boss2@example.com", "pass")
+		theme = Theme.objects.create(title="Theme Notify")
+		objective = Objective.objects.create(title="Objective Notify", theme=theme)
+		self.actions = [
+			Action.objects.create(title=f"Action Notify {i}", objective=objective) for i in range(3)
+		]
+
+	def _queue(self, action):
+		return ApprovalNotification.objects.create(
+			action=action,
+			requested_by=self.staff,
+			update_note="ENGLISH",
+			admin_url=f"http://testserver/admin/tracker_app/action/{action.pk}/change/",
+		)
+
+	def test_pending_notifications_batched_into_one_digest_per_superuser(self):
+		for action in self.actions:
+			self._queue(action)
+
+		self.assertEqual(deliver_pending_notifications(), 3)
+
+		self.assertEqual(len(mail.outbox), 2)
+		self.assertEqual(sorted(m.to[0] for m in mail.outbox), ["boss1@example.com", "boss2@example.com"])
+		self.assertIn("3 Action Updates Pending Approval", mail.outbox[0].subject)
+		for action in self.actions:
+			self.assertIn(action.title, mail.outbox[0].body)
+		self.assertFalse(ApprovalNotification.objects.filter(sent_at__isnull=True).exists())
+
+		self.assertEqual(deliver_pending_notifications(), 0)
+		self.assertEqual(len(mail.outbox), 2)
+
+	def test_failed_delivery_is_retried(self):
+		notification = self._queue(self.actions[0])
+
+		with patch("django.core.mail.backends.locmem.EmailBackend.send_messages", side_effect=OSError("SMTP down")):
+			self.assertEqual(deliver_pending_notifications(), 0)
+
+		notification.refresh_from_db()
+		self.assertEqual(notification.attempts, 1)
+		self.assertIn("SMTP down", notification.last_error)
+		self.assertIsNone(notification.sent_at)
+
+		call_command("send_approval_notifications", stdout=StringIO())
+		notification.refresh_from_db()
+		self.assertIsNotNone(notification.sent_at)
+		self.assertEqual(len(mail.outbox), 2)
+
+	def test_batch_is_claimed_while_mail_is_sent(self):
+		notification = self._queue(self.actions[0])
+		overlapping_runs = []
+
+		def send_messages(backend, messages):
+			# A second run while the first is still talking to the mail server finds nothing to send.
+			overlapping_runs.append(deliver_pending_notifications())
+			return len(messages)
+
+		with patch("django.core.mail.backends.locmem.EmailBackend.send_messages", send_messages):
+			self.assertEqual(deliver_pending_notifications(), 1)
+
+		self.assertEqual(overlapping_runs, [0])
+		notification.refresh_from_db()
+		self.assertIsNotNone(notification.sent_at)
+		self.assertIsNone(notification.claimed_at)
+
+	def test_abandoned_claim_is_taken_over(self):
+		notification = self._queue(self.actions[0])
+		ApprovalNotification.objects.filter(pk=notification.pk).update(claimed_at=datetime(2020, 1, 1, tzinfo=dt_timezone.utc))
+
+		self.assertEqual(deliver_pending_notifications(), 1)
+		self.assertEqual(len(mail.outbox), 2)
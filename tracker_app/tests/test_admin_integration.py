@@ -4,6 +4,7 @@ from django.urls import reverse
 from django.core import mail
 
 from tracker_app.models import Theme, Objective, Action, ActionStatus
+from tracker_app.notifications import deliver_pending_notifications
 
 
 class AdminIntegrationTests(TestCase):
@@ -52,7 +53,8 @@ class AdminIntegrationTests(TestCase):
         # Staff edits should leave is_approved False
         self.assertFalse(self.action.is_approved)
 
-        # Notification should have been sent to superusers (locmem backend)
+        # Notification is queued, then delivered to superusers by the worker (locmem backend)
+        deliver_pending_notifications()
         self.assertGreaterEqual(len(mail.outbox), 1)
 
     @override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
@@ -3,9 +3,14 @@ from django.urls import path
 from .views import (
     get_filtered_actions_by_status,
     get_roadmap_data,
+    get_status_snapshot,
+    export_actions,
+    get_action_details,
     get_all_actions,
     get_theme_details,
+    get_themes_details,
     home,
+    search_actions,
     handler_403,
     handler_404,
     handler_500,
@@ -19,8 +24,13 @@ app_name = 'tracker_app' # <-- This is vital
 urlpatterns = [
     path('', home, name='home'),
     path('api/roadmap-data/', get_roadmap_data, name='roadmap_data'),
+    path('api/status-snapshot/', get_status_snapshot, name='status_snapshot'),
+    path('api/theme-details/', get_themes_details, name='get_themes_details'),
     path('api/theme-details/<int:theme_id>/', get_theme_details, name='get_theme_details'),
     path('api/actions/', get_all_actions, name='all_actions'),
+    path('api/actions/<int:action_id>/', get_action_details, name='action_details'),
+    path('api/actions/export/', export_actions, name='export_actions'),
+    path('api/actions/search/', search_actions, name='search_actions'),
     path('api/actions/filter/<str:status>/', get_filtered_actions_by_status, name='filter_actions_by_status'),
 
     # Temporary preview routes for error pages (safe to remove later)
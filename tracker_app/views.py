@@ -1,14 +1,38 @@
 
 from django.shortcuts import render, get_object_or_404   
 from django.template.loader import render_to_string
-from django.http import JsonResponse
-from django.db.models import Count, Q, Prefetch 
-from django.db.models.functions import TruncMonth
+from django.http import JsonResponse, StreamingHttpResponse
+from django.contrib.admin.views.decorators import staff_member_required
+from django.db.models import Count, Max, Q, Prefetch 
 from django.utils import timezone
+from django.views.decorators.cache import cache_control
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from functools import wraps
 import calendar
-from .models import Theme, Action, ActionStatus 
+import datetime
+import hashlib
+from .models import Theme, Objective, Action, ActionStatus 
+from .roadmap import (
+    GRANULARITIES,
+    bucket_starts,
+    range_scope,
+    range_series,
+    rollup_series,
+    status_snapshot,
+    theme_roadmap,
+    theme_series,
+    year_scope,
+)
+from . import cache as tracker_cache
+from . import search
+from .compression import compress_response
+from .counts import STATUS_KEYS, dashboard_counts, theme_counts
+from .export import EXPORT_FORMATS, iter_export
 from django.utils.html import strip_tags 
 from django.core.paginator import Paginator
+from django.utils.encoding import force_bytes, force_str
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 from django.http import JsonResponse
 from django.utils import translation
 from django.utils.translation import get_language
@@ -19,8 +43,58 @@ from django.utils.translation import get_language, activate
 PUBLIC_ACTIONS_FILTER = Q()
 
 
-def _build_roadmap_payload(year_param):
-    """Builds Roadmap chart + KPI payload for a given year."""
+def _conditional_on_actions(scope=None):
+    """Adds ETag/Last-Modified revalidation to a tracker JSON view.
+
+    The validator combines the content version (bumped on every Theme,
+    Objective and Action change) with, when ``scope`` is given, the row count
+    and latest ``updated_at`` of the actions the view reads. A request whose
+    If-None-Match/If-Modified-Since still matches gets a 304 before the
+    payload is built or serialized.
+
+    Django's ``condition()`` would compute the ETag and Last-Modified in two
+    separate passes; this validator builds both from one aggregate.
+    """
+    def validator(request, *args, **kwargs):
+        version = tracker_cache.current_content_version()
+        last_modified = tracker_cache.content_version_issued_at(version)
+        # The month too: the event-source roadmap fills in "continued" as months open.
+        parts = [request.path, request.GET.urlencode(), get_language(), timezone.localdate().strftime('%Y-%m'), version]
+        # Keyset pages skip COUNT(*) by design, so they validate on the content version alone.
+        skip_count = 'cursor' in request.GET and request.GET.get('with_count') != '1'
+        if scope is not None and not skip_count:
+            stats = scope(request, *args, **kwargs).aggregate(
+                total=Count('id'), last_modified=Max('updated_at')
+            )
+            parts += [stats['total'], stats['last_modified']]
+            # The list views reuse this as their row count instead of a second COUNT(*).
+            request._tracker_action_count = stats['total']
+            if stats['last_modified']:
+                last_modified = max(last_modified, stats['last_modified'])
+        etag = hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+        return quote_etag(etag), int(last_modified.timestamp())
+
+    def decorator(view):
+        @wraps(view)
+        def inner(request, *args, **kwargs):
+            etag, last_modified = validator(request, *args, **kwargs)
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = view(request, *args, **kwargs)
+            if request.method in ('GET', 'HEAD'):
+                if not response.has_header('Last-Modified'):
+                    response.headers['Last-Modified'] = http_date(last_modified)
+                response.headers.setdefault('ETag', etag)
+            return response
+
+        # Let browsers and proxies store the JSON but revalidate it on every use.
+        return cache_control(no_cache=True)(inner)
+
+    return decorator
+
+
+def _resolve_chart_year(year_param):
+    """Returns (chart_year, current_year), clamping the requested year to 2024..now."""
     current_year = timezone.now().year
     default_year = 2026 if current_year >= 2026 else current_year
     try:
@@ -30,60 +104,19 @@ def _build_roadmap_payload(year_param):
 
     if chart_year < 2024 or chart_year > current_year:
         chart_year = default_year
+    return chart_year, current_year
 
-    # Existing behavior: totals by updated_at (keeps Completed series working)
-    monthly_counts = (
-        Action.objects.filter(
-            is_approved=True,
-            status__in=[ActionStatus.COMPLETED, ActionStatus.IN_PROGRESS],
-            updated_at__year=chart_year,
-        )
-        .annotate(month=TruncMonth("updated_at"))
-        .values("month", "status")
-        .annotate(total=Count("id"))
-        .order_by("month")
-    )
-    completed_totals = {}
-    in_progress_totals = {}
-    for item in monthly_counts:
-        month_value = item["month"].month if item["month"] else None
-        if not month_value:
-            continue
-        if item["status"] == ActionStatus.COMPLETED:
-            completed_totals[month_value] = item["total"]
-        elif item["status"] == ActionStatus.IN_PROGRESS:
-            in_progress_totals[month_value] = item["total"]
-
-    # New: counts for actions that *started* in this year (progress_started_at)
-    started_qs = (
-        Action.objects.filter(
-            is_approved=True,
-            progress_started_at__year=chart_year,
-        )
-        .annotate(month=TruncMonth("progress_started_at"))
-        .values("month")
-        .annotate(total=Count("id"))
-        .order_by("month")
-    )
-    started_totals = {item["month"].month: item["total"] for item in started_qs if item.get("month")}
-
-    # New: continued updates = updated in this year but started in an earlier year (or no start date)
-    continued_qs = (
-        Action.objects.filter(
-            is_approved=True,
-            status=ActionStatus.IN_PROGRESS,
-            updated_at__year=chart_year,
-        )
-        .filter(
-            (Q(progress_started_at__year__lt=chart_year) | Q(progress_started_at__isnull=True))
-        )
-        .annotate(month=TruncMonth("updated_at"))
-        .values("month")
-        .annotate(total=Count("id"))
-        .order_by("month")
-    )
-    continued_totals = {item["month"].month: item["total"] for item in continued_qs if item.get("month")}
 
+def _build_roadmap_payload(year_param):
+    """Builds Roadmap chart + KPI payload for a given year."""
+    chart_year, current_year = _resolve_chart_year(year_param)
+    # Read the 12 precomputed monthly rows; they are kept in step with Action
+    # saves/updates by tracker_app.signals (see roadmap.py).
+    return _compose_roadmap_payload(chart_year, current_year, rollup_series(chart_year))
+
+
+def _compose_roadmap_payload(chart_year, current_year, series):
+    """Shapes the monthly series of ``chart_year`` into the chart + KPI payload."""
     labels_en = [calendar.month_name[i] for i in range(1, 13)]
     labels_ga = [
         "Eanáir",
@@ -99,119 +132,365 @@ def _build_roadmap_payload(year_param):
         "Samhain",
         "Nollaig",
     ]
-    chart_data_completed = [completed_totals.get(i, 0) for i in range(1, 13)]
+    chart_data, totals = _roadmap_series_payload(series)
+    return {
+        "chart_year": chart_year,
+        "chart_labels_en": labels_en,
+        "chart_labels_ga": labels_ga,
+        **chart_data,
+        **{f"{name}_total_year": total for name, total in totals.items()},
+        "year_options": list(range(2024, current_year + 1)),
+    }
+
+
+def _roadmap_series_payload(series):
+    """Returns the ``chart_data_*`` lists and the KPI totals for a roadmap series."""
     # In-progress series: defined as Started this year + Continued updates
     # (continued = updated this year but started earlier or unknown).
     # This makes the KPI/chart show the sum of new starts and continued work
     # rather than all actions updated in the year, avoiding unexpectedly
-    # large counts from unrelated updates.
-    chart_data_in_progress = [0] * 12
-    chart_data_started = [started_totals.get(i, 0) for i in range(1, 13)]
-    chart_data_continued = [continued_totals.get(i, 0) for i in range(1, 13)]
-
-    # Compose the in-progress monthly series as started + continued,
-    # avoiding double-counting by construction (these are disjoint sets
-    # by the continued query definition).
-    for idx in range(12):
-        chart_data_in_progress[idx] = chart_data_started[idx] + chart_data_continued[idx]
-
-    # Completed KPI should reflect the same monthly completed series
-    # (completions that occurred in the selected year). Use the sum
-    # of the monthly completed series so the card matches the chart.
-    completed_total_year = sum(chart_data_completed)
-    # KPI: year-scoped in-progress total (sum of monthly started+continued)
-    in_progress_total_year = sum(chart_data_in_progress)
-    started_total_year = sum(chart_data_started)
-    continued_total_year = sum(chart_data_continued)
+    # large counts from unrelated updates. The two sets are disjoint by
+    # construction, so there is no double-counting.
+    in_progress = [started + continued for started, continued in zip(series["started"], series["continued"])]
+    chart_data = {
+        "chart_data_completed": series["completed"],
+        "chart_data_in_progress": in_progress,
+        "chart_data_started": series["started"],
+        "chart_data_continued": series["continued"],
+    }
+    # Completed KPI should reflect the same completed series, so the card
+    # matches the chart; likewise for the other totals.
+    totals = {
+        "completed": sum(series["completed"]),
+        "in_progress": sum(in_progress),
+        "started": sum(series["started"]),
+        "continued": sum(series["continued"]),
+    }
+    return chart_data, totals
+
+
+# Longest range answered in one request: ten years of weeks.
+ROADMAP_MAX_BUCKETS = 530
+# Dates accepted in a range; the upper bound leaves room to step to the
+# day/bucket after ``to`` without overflowing ``datetime.date``.
+ROADMAP_DATE_LIMITS = (datetime.date(1900, 1, 1), datetime.date(9998, 12, 31))
+
+
+def _roadmap_range(params):
+    """Returns ``(start, end, granularity)`` for a range request, or None for the yearly payload.
+
+    A range is requested with ``?from=``/``?to=`` (inclusive YYYY-MM-DD
+    dates) and/or ``?granularity=week|month|quarter``. Missing bounds
+    default to the ``?year=`` (or current year) up to today. ``end`` is
+    exclusive. Raises ValueError for invalid or oversized ranges.
+    """
+    if not any(key in params for key in ('from', 'to', 'granularity')):
+        return None
+    granularity = params.get('granularity') or 'month'
+    if granularity not in GRANULARITIES:
+        raise ValueError(_('Use a granularity of week, month or quarter.'))
+    chart_year, _current_year = _resolve_chart_year(params.get('year'))
+    try:
+        start = datetime.date.fromisoformat(params['from']) if params.get('from') else datetime.date(chart_year, 1, 1)
+        last_day = (
+            datetime.date.fromisoformat(params['to']) if params.get('to')
+            else min(datetime.date(start.year, 12, 31), timezone.localdate())
+        )
+    except ValueError:
+        raise ValueError(_('Use YYYY-MM-DD dates.')) from None
+    first_allowed, last_allowed = ROADMAP_DATE_LIMITS
+    if not (first_allowed <= start <= last_allowed and first_allowed <= last_day <= last_allowed):
+        raise ValueError(
+            _('Use dates between %(first)s and %(last)s.')
+            % {'first': first_allowed.isoformat(), 'last': last_allowed.isoformat()}
+        )
+    end = last_day + datetime.timedelta(days=1)
+    if end <= start:
+        raise ValueError(_('"from" must not be after "to".'))
+    if len(bucket_starts(start, end, granularity)) > ROADMAP_MAX_BUCKETS:
+        raise ValueError(_('The range is too long for this granularity.'))
+    return start, end, granularity
+
 
+def _bucket_label(day, granularity):
+    if granularity == 'week':
+        year, week, _weekday = day.isocalendar()
+        return f"{year}-W{week:02d}"
+    if granularity == 'quarter':
+        return f"{day.year}-Q{(day.month - 1) // 3 + 1}"
+    return f"{day.year}-{day.month:02d}"
+
+
+def _build_range_payload(start, end, granularity):
+    """Builds the Roadmap chart + KPI payload for ``[start, end)`` per week, month or quarter.
+
+    Computed live (two grouped queries), unlike the yearly payload, which
+    reads the precomputed monthly rollups.
+    """
+    starts, series = range_series(start, end, granularity)
+    chart_data, totals = _roadmap_series_payload(series)
     return {
-        "chart_year": chart_year,
-        "chart_labels_en": labels_en,
-        "chart_labels_ga": labels_ga,
-        "chart_data_completed": chart_data_completed,
-        "chart_data_in_progress": chart_data_in_progress,
-        "chart_data_started": chart_data_started,
-        "chart_data_continued": chart_data_continued,
-        "completed_total_year": completed_total_year,
-        "in_progress_total_year": in_progress_total_year,
-        "started_total_year": started_total_year,
-        "continued_total_year": continued_total_year,
-        "year_options": list(range(2024, current_year + 1)),
+        "from": start.isoformat(),
+        "to": (end - datetime.timedelta(days=1)).isoformat(),
+        "granularity": granularity,
+        "bucket_starts": [day.isoformat() for day in starts],
+        "chart_labels": [_bucket_label(day, granularity) for day in starts],
+        **chart_data,
+        **{f"{name}_total": total for name, total in totals.items()},
     }
 
 
 def home(request):
     """Render the public-facing home page template."""
     roadmap_payload = _build_roadmap_payload(request.GET.get("year"))
-    return render(request, 'tracker_app/home.html', roadmap_payload)
+    context = {**roadmap_payload, 'counts': dashboard_counts()}
+    return render(request, 'tracker_app/home.html', context)
+
+
+def _roadmap_actions(request):
+    """Actions that feed the Roadmap payload for the requested year or range."""
+    try:
+        date_range = _roadmap_range(request.GET)
+    except ValueError:
+        return Action.objects.none()
+    if date_range is not None:
+        start, end, _granularity = date_range
+        return Action.objects.filter(range_scope(start, end))
+    chart_year, _current_year = _resolve_chart_year(request.GET.get("year"))
+    return Action.objects.filter(year_scope(chart_year))
 
 
+@_conditional_on_actions(_roadmap_actions)
 def get_roadmap_data(request):
-    """Return Roadmap chart data for AJAX year changes."""
+    """Return Roadmap chart data for AJAX year changes, or for a date range.
+
+    ``?year=`` returns the monthly payload of one calendar year (with
+    ``&by=theme``, the themes x months matrix of roadmap.theme_roadmap());
+    ``?from=&to=&granularity=week|month|quarter`` returns the series over
+    any range (see _roadmap_range()).
+    """
+    try:
+        date_range = _roadmap_range(request.GET)
+    except ValueError as error:
+        return JsonResponse({'error': str(error)}, status=400)
+    by_theme = request.GET.get('by') == 'theme'
+    if date_range is not None:
+        if by_theme:
+            return JsonResponse({'error': _('The per-theme breakdown is only available per year.')}, status=400)
+        payload = _build_range_payload(*date_range)
+        return JsonResponse(payload)
+    if by_theme:
+        chart_year, _current_year = _resolve_chart_year(request.GET.get("year"))
+        return JsonResponse(theme_roadmap(chart_year))
     payload = _build_roadmap_payload(request.GET.get("year"))
     return JsonResponse(payload)
 
 
+# Every status change bumps the content version, which validates the snapshot.
+@_conditional_on_actions()
+def get_status_snapshot(request):
+    """Return how many actions were in each status at the end of ``?as_of=YYYY-MM-DD`` (default today).
 
+    Read from the approved ActionStatusEvent log, so it reflects when each
+    status change happened rather than when the action was last edited.
+    """
+    as_of = request.GET.get('as_of')
+    try:
+        day = datetime.date.fromisoformat(as_of) if as_of else timezone.localdate()
+    except ValueError:
+        return JsonResponse({'error': _('Use a YYYY-MM-DD date.')}, status=400)
+    if day == datetime.date.max:
+        # The snapshot is taken at the start of the next day, which does not exist.
+        return JsonResponse({'error': _('Use a date before %(date)s.') % {'date': day.isoformat()}}, status=400)
 
-def get_filtered_actions_by_status(request, status):
-    """Return paginated actions for a given status, with bilingual fallback handling."""
+    end_of_day = timezone.make_aware(datetime.datetime.combine(day + datetime.timedelta(days=1), datetime.time.min))
+    snapshot = status_snapshot(end_of_day)
+    return JsonResponse({
+        'as_of': day.isoformat(),
+        'counts': {key: snapshot[status] for key, status in STATUS_KEYS.items()},
+    })
 
 
-    # Map URL status tokens to ActionStatus values used in the database.
-    status_map = {
-        'completed': ActionStatus.COMPLETED,
-        'in_progress': ActionStatus.IN_PROGRESS,
-        'not_started': ActionStatus.NOT_STARTED,
+
+
+# Action JSON key -> the ``values()`` column it is read from. The objective
+# title comes in via a join and the ``*_text`` columns are resolved to the
+# active language in SQL.
+ACTION_API_FIELDS = {
+    'id': 'id',
+    'title': 'title',  # Remains same for both
+    'small_description': 'small_description_text',
+    'description': 'description_text',
+    'status': 'status',
+    'objective_title': 'objective__title',
+    'update': 'update_text',
+}
+ACTION_LIST_PAGE_SIZE = 10
+
+
+def _action_projection(request):
+    """Returns ``(fields, compact)`` from ``?fields=a,b`` and ``?compact=1``.
+
+    Raises ValueError for an empty or unknown field list.
+    """
+    requested = request.GET.get('fields')
+    if requested is None:
+        fields = list(ACTION_API_FIELDS)
+    else:
+        fields = [field.strip() for field in requested.split(',') if field.strip()]
+    if not fields or any(field not in ACTION_API_FIELDS for field in fields):
+        raise ValueError("Invalid fields")
+    return fields, request.GET.get('compact') == '1'
+
+
+def _action_columns(fields):
+    """Returns the ``values()`` columns to read for ``fields`` (always including the id)."""
+    return ['id'] + [ACTION_API_FIELDS[field] for field in fields if field != 'id']
+
+
+def _actions_payload(rows, fields, compact=False):
+    """Serializes ``values()`` rows as ``{'actions': [{...}]}``.
+
+    In compact mode the keys are sent once: ``{'columns': [...], 'rows': [[...]]}``.
+    """
+    # Status labels are translated via the .po file.
+    status_labels = {value: str(label) for value, label in ActionStatus.choices}
+
+    def value(row, field):
+        raw = row[ACTION_API_FIELDS[field]]
+        return status_labels.get(raw, raw) if field == 'status' else raw
+
+    if compact:
+        return {'columns': fields, 'rows': [[value(row, field) for field in fields] for row in rows]}
+    return {'actions': [{field: value(row, field) for field in fields} for row in rows]}
+
+
+# No spaces after separators: the action JSON is mostly short values.
+COMPACT_JSON = {'separators': (',', ':')}
+
+
+def _invalid_fields_response():
+    return JsonResponse(
+        {'error': _('Unknown field. Choose from: %s.') % ', '.join(ACTION_API_FIELDS)}, status=400
+    )
+
+
+def _encode_cursor(last_id):
+    """Returns the opaque token pointing just past action ``last_id``."""
+    return urlsafe_base64_encode(force_bytes(last_id))
+
+
+def _decode_cursor(token):
+    """Returns the last seen action id for a cursor token (empty token = start)."""
+    if not token:
+        return 0
+    try:
+        return int(force_str(urlsafe_base64_decode(token)))
+    except (TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+
+def _action_cursor_response(request, rows, status_title, fields, compact):
+    """Keyset page: seeks past the cursor id instead of using OFFSET.
+
+    Fetches one extra row to know whether another page exists, and only runs
+    COUNT(*) when ``?with_count=1`` is given.
+    """
+    try:
+        last_id = _decode_cursor(request.GET.get('cursor'))
+    except ValueError:
+        return JsonResponse({'error': _('Invalid cursor.')}, status=400)
+
+    page = list(rows.filter(id__gt=last_id)[:ACTION_LIST_PAGE_SIZE + 1])
+    has_next = len(page) > ACTION_LIST_PAGE_SIZE
+    page = page[:ACTION_LIST_PAGE_SIZE]
+
+    payload = {
+        'status_title': status_title,
+        **_actions_payload(page, fields, compact),
+        'next_cursor': _encode_cursor(page[-1]['id']) if has_next else None,
+        'has_next': has_next,
     }
-    target_status = status_map.get(status.lower())
-    
-    # Base queryset for the requested status, optionally scoped by theme.
-    actions_list = Action.objects.filter(status=target_status)
-    theme_id = request.GET.get('theme_id')
-    if theme_id:
-        actions_list = actions_list.filter(objective__theme_id=theme_id)
-    actions_list = actions_list.order_by('id')
-    
-    # Paginate results for incremental loading in the modal list.
-    paginator = Paginator(actions_list, 10)
-    page_number = request.GET.get('page', 1)
-    page_obj = paginator.get_page(page_number)
-    
-    # Dual-language behavior: prefer Irish content when language is Irish and approved.
-    current_lang = get_language()
-    is_ga = current_lang == 'ga'
-
-    # Build the JSON payload with safe bilingual fallbacks.
-    data = []
-    for action in page_obj:
-        # Use Irish only when on the Irish site and the translation is approved.
-        show_ga = is_ga and action.is_ga_approved
-
-        data.append({
-            'id': action.id,
-            'title': action.title,  # Remains same for both
-            # Prefer Irish fields when approved, otherwise fallback to English.
-            'small_description': action.small_description_ga if show_ga and action.small_description_ga else action.small_description,
-            'description': action.description_ga if show_ga and action.description_ga else action.description,
-            # .get_status_display() uses the translated label from the .po file.
-            'status': action.get_status_display(),
-            'objective_title': action.objective.title,
-            'update': action.update_ga if show_ga and action.update_ga else (action.update if action.update else "")
-        })
+    if request.GET.get('with_count') == '1':
+        payload['count'] = getattr(request, '_tracker_action_count', None)
+        if payload['count'] is None:
+            payload['count'] = rows.count()
+    return JsonResponse(payload, json_dumps_params=COMPACT_JSON)
+
+
+def _action_list_response(request, actions_list, status_title):
+    """Paginates an action queryset and returns the modal list JSON.
+
+    Fetches only the requested fields (``?fields=``, default all of
+    ACTION_API_FIELDS), so each page costs two queries - COUNT (shared with
+    the ETag validator) plus the page itself - whatever its size.
+    ``?compact=1`` sends the rows as arrays under a single ``columns`` header.
+    Passing ``?cursor=`` (empty for the first page) switches to keyset paging.
+    """
+    try:
+        fields, compact = _action_projection(request)
+    except ValueError:
+        return _invalid_fields_response()
+
+    # Dual-language behavior: Irish content is used when the site is Irish and
+    # the translation is approved, otherwise English (resolved in SQL).
+    rows = actions_list.with_api_text(get_language()).values(*_action_columns(fields)).order_by('id')
+    if 'cursor' in request.GET:
+        return _action_cursor_response(request, rows, status_title, fields, compact)
+
+    # Paginate results for incremental loading in the modal list, reusing the
+    # count the ETag validator already ran when there is one.
+    paginator = Paginator(rows, ACTION_LIST_PAGE_SIZE)
+    paginator.count = getattr(request, '_tracker_action_count', None)
+    if paginator.count is None:
+        paginator.count = rows.count()
+    page_obj = paginator.get_page(request.GET.get('page', 1))
+
+    page = list(page_obj.object_list)
 
     # Return the payload expected by the modal UI.
     return JsonResponse({
-        'status_title': _(status.replace('_', ' ').title()),
-        'actions': data,
+        'status_title': status_title,
+        **_actions_payload(page, fields, compact),
         'count': paginator.count,
         'current_page': page_obj.number,
         'total_pages': paginator.num_pages,
-        'has_next': page_obj.has_next(), 
+        'has_next': page_obj.has_next(),
         'has_previous': page_obj.has_previous(),
-    })
+    }, json_dumps_params=COMPACT_JSON)
+
+
+def _theme_actions(request):
+    """All actions, optionally scoped by the ``theme_id`` query parameter."""
+    actions_list = Action.objects.all()
+    theme_id = request.GET.get('theme_id')
+    if theme_id:
+        actions_list = actions_list.filter(objective__theme_id=theme_id)
+    return actions_list
+
+
+def _status_actions(request, status):
+    """Actions for a URL status token, optionally scoped by theme."""
+    # Map URL status tokens to ActionStatus values used in the database.
+    status_map = {
+        'completed': ActionStatus.COMPLETED,
+        'in_progress': ActionStatus.IN_PROGRESS,
+        'not_started': ActionStatus.NOT_STARTED,
+    }
+    target_status = status_map.get(status.lower())
+    return _theme_actions(request).filter(status=target_status)
+
+
+@compress_response
+@_conditional_on_actions(_status_actions)
+def get_filtered_actions_by_status(request, status):
+    """Return paginated actions for a given status, with bilingual fallback handling."""
+    actions_list = _status_actions(request, status)
+    return _action_list_response(request, actions_list, _(status.replace('_', ' ').title()))
 
 
+@compress_response
+@_conditional_on_actions(_theme_actions)
 def get_all_actions(request):
     """Return paginated actions for a given theme (no status filter).
 
@@ -219,88 +498,205 @@ def get_all_actions(request):
     so the client can request all actions for a theme (used by the TOTAL/ALL
     status card).
     """
+    return _action_list_response(request, _theme_actions(request), _('All Actions'))
 
-    actions_list = Action.objects.all()
-    theme_id = request.GET.get('theme_id')
-    if theme_id:
-        actions_list = actions_list.filter(objective__theme_id=theme_id)
+# The search index is kept in step with every Action change, which also bumps
+# the content version, so that version alone validates search results.
+@compress_response
+@_conditional_on_actions()
+def search_actions(request):
+    """Return ranked, paginated actions matching ``?q=`` from the full-text index.
 
-    actions_list = actions_list.order_by('id')
+    Matches every word (as a prefix) against the tag-stripped English and Irish
+    text; the response mirrors the action list JSON.
+    """
+    query = request.GET.get('q', '').strip()
+    if not search.query_terms(query):
+        return JsonResponse({'error': _('Enter a search term.')}, status=400)
+    try:
+        fields, compact = _action_projection(request)
+    except ValueError:
+        return _invalid_fields_response()
 
-    paginator = Paginator(actions_list, 10)
-    page_number = request.GET.get('page', 1)
+    # The index answers the count and the page of ids; the page rows are then
+    # fetched by primary key with the same projection as the lists.
+    paginator = Paginator([], ACTION_LIST_PAGE_SIZE)
+    try:
+        page_number = max(int(request.GET.get('page', 1)), 1)
+    except (TypeError, ValueError):
+        page_number = 1
+    # Past the last page, search() serves the last page, as the list endpoints do.
+    paginator.count, ids = search.search(query, ACTION_LIST_PAGE_SIZE, (page_number - 1) * ACTION_LIST_PAGE_SIZE)
     page_obj = paginator.get_page(page_number)
 
-    current_lang = get_language()
-    is_ga = current_lang == 'ga'
-
-    data = []
-    for action in page_obj:
-        show_ga = is_ga and action.is_ga_approved
-
-        data.append({
-            'id': action.id,
-            'title': action.title,
-            'small_description': action.small_description_ga if show_ga and action.small_description_ga else action.small_description,
-            'description': action.description_ga if show_ga and action.description_ga else action.description,
-            'status': action.get_status_display(),
-            'objective_title': action.objective.title,
-            'update': action.update_ga if show_ga and action.update_ga else (action.update if action.update else "")
-        })
+    rows = Action.objects.filter(id__in=ids).with_api_text(get_language()).values(*_action_columns(fields))
+    rows_by_id = {row['id']: row for row in rows}
 
     return JsonResponse({
-        'status_title': _('All Actions'),
-        'actions': data,
+        'query': query,
+        **_actions_payload([rows_by_id[pk] for pk in ids if pk in rows_by_id], fields, compact),
         'count': paginator.count,
         'current_page': page_obj.number,
         'total_pages': paginator.num_pages,
         'has_next': page_obj.has_next(),
         'has_previous': page_obj.has_previous(),
-    })
+    }, json_dumps_params=COMPACT_JSON)
 
-def get_theme_details(request, theme_id):
-    """Return the HTML fragment and localized title for a single theme modal."""
-    PUBLIC_ACTIONS_FILTER = Q()
-    current_language = get_language()
-    
-    # Fetch theme with prefetched approved actions for modal rendering.
-    theme = Theme.objects.filter(pk=theme_id).prefetch_related(
+
+@compress_response
+@_conditional_on_actions()
+def get_action_details(request, action_id):
+    """Return one action's fields (``?fields=`` as for the lists), with bilingual fallback.
+
+    Lets the list views ask only for the columns a row shows and load the long
+    description/update when a row is expanded.
+    """
+    try:
+        fields, _compact = _action_projection(request)
+    except ValueError:
+        return _invalid_fields_response()
+
+    row = (
+        Action.objects.filter(pk=action_id)
+        .with_api_text(get_language())
+        .values(*_action_columns(fields))
+        .first()
+    )
+    if row is None:
+        return JsonResponse({'error': _('Action not found.')}, status=404)
+    return JsonResponse(_actions_payload([row], fields)['actions'][0], json_dumps_params=COMPACT_JSON)
+
+
+@staff_member_required
+def export_actions(request):
+    """Stream every action as CSV (default) or ``?format=jsonl`` for reporting.
+
+    Includes unapproved text, so it is limited to staff. ``?strip_html=1``
+    exports descriptions/updates as plain text.
+    """
+    export_format = request.GET.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return JsonResponse({'error': _('Unsupported export format.')}, status=400)
+
+    lines = iter_export(export_format, strip_html=request.GET.get('strip_html') == '1')
+    content_type = 'text/csv' if export_format == 'csv' else 'application/x-ndjson'
+    response = StreamingHttpResponse(lines, content_type=f'{content_type}; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="actions.{export_format}"'
+    return response
+
+
+THEME_BATCH_LIMIT = 20
+
+
+def _theme_modal_queryset(language):
+    """Themes with the objectives and actions their modal renders prefetched.
+
+    Both prefetched querysets carry language-resolved ``*_text`` columns for
+    the template.
+    """
+    return Theme.objects.prefetch_related(
+       Prefetch('objectives', queryset=Objective.objects.with_display_text(language)),
        Prefetch(
            'objectives__actions', 
-           queryset=Action.objects.filter(PUBLIC_ACTIONS_FILTER),
+           queryset=Action.objects.filter(PUBLIC_ACTIONS_FILTER).with_display_text(language),
            to_attr='approved_actions'
        )
-    ).first()
-    
+    )
+
+
+def _render_theme_modal(request, theme, action_counts, roadmap, language):
+    """Renders the modal fragment and localized title for a prefetched theme.
+
+    ``roadmap`` is the theme's monthly series for the default chart year,
+    passed through for the modal's trend chart.
+    """
+    # Render under the requested language so the fragment's {% trans %} tags match.
+    with translation.override(language):
+        html_content = render_to_string(
+            'tracker_app/modal_content_fragment.html',
+            {'theme': theme, 'counts': action_counts},
+            request=request
+        )
+
+    # Localize the modal header title with Irish fallback when available.
+    theme_title = theme.title_ga if language == 'ga' and theme.title_ga else theme.title
+    return {'html_content': html_content, 'title': theme_title, 'roadmap': roadmap}
+
+
+# The modal is cached per content version already, so that version alone is
+# its validator and revalidation costs no queries.
+@_conditional_on_actions()
+def get_theme_details(request, theme_id):
+    """Return the HTML fragment and localized title for a single theme modal."""
+    current_language = get_language()
+
+    # Serve the rendered modal from cache while the content version is unchanged.
+    cached_payload = tracker_cache.get_theme_details(theme_id, current_language)
+    if cached_payload is not None:
+        return JsonResponse(cached_payload)
+    content_version = tracker_cache.current_content_version()
+
+    # Fetch theme with prefetched approved actions for modal rendering.
+    theme = _theme_modal_queryset(current_language).filter(pk=theme_id).first()
+
+    # The status cards and trend chart inside the modal read the shared
+    # (cached) counters and per-theme roadmap matrix.
+    chart_year, _current_year = _resolve_chart_year(None)
+    action_counts = theme_counts(dashboard_counts(), theme_id)
+
     if not theme:
         return JsonResponse({
             'html_content': '<p>Strategic theme not found.</p>',
             'title': 'Error'
         }, status=404)
 
-    # Calculate counts for the status cards inside the modal.
-    theme_actions = Action.objects.filter(objective__theme=theme).filter(PUBLIC_ACTIONS_FILTER)
-    action_counts = theme_actions.aggregate(
-        completed=Count('id', filter=Q(status=ActionStatus.COMPLETED)),
-        in_progress=Count('id', filter=Q(status=ActionStatus.IN_PROGRESS)),
-        not_started=Count('id', filter=Q(status=ActionStatus.NOT_STARTED)),
-    )
-    
-    # Activate translation so the fragment template renders in the correct language.
-    translation.activate(current_language)
-    
-    html_content = render_to_string(
-        'tracker_app/modal_content_fragment.html',
-        {'theme': theme, 'counts': action_counts},
-        request=request
-    )
-    
-    # Localize the modal header title with Irish fallback when available.
-    theme_title = theme.title_ga if current_language == 'ga' and theme.title_ga else theme.title
-    
-    translation.deactivate()
-    
-    return JsonResponse({'html_content': html_content, 'title': theme_title})
+    roadmap = theme_series(theme_roadmap(chart_year), theme_id)
+    payload = _render_theme_modal(request, theme, action_counts, roadmap, current_language)
+    tracker_cache.set_theme_details(theme_id, current_language, payload, content_version)
+    return JsonResponse(payload)
+
+
+@compress_response
+@_conditional_on_actions()
+def get_themes_details(request):
+    """Return the modal payloads of several themes (``?ids=1,2,3``) in one response.
+
+    Lets the home page warm the modals of the tiles a visitor hovers or focuses
+    with one request per burst of intent. Cached modals are read in one cache
+    round-trip; the rest share one prefetch pass, the cached counters and the
+    cached per-theme roadmap. Unknown ids are listed under ``missing``.
+    """
+    try:
+        theme_ids = list(dict.fromkeys(int(value) for value in request.GET.get('ids', '').split(',') if value.strip()))
+    except ValueError:
+        theme_ids = []
+    if not theme_ids or len(theme_ids) > THEME_BATCH_LIMIT:
+        return JsonResponse(
+            {'error': _('Pass between 1 and %(limit)d theme ids.') % {'limit': THEME_BATCH_LIMIT}}, status=400
+        )
+
+    current_language = get_language()
+    payloads = tracker_cache.get_many_theme_details(theme_ids, current_language)
+    uncached = [theme_id for theme_id in theme_ids if theme_id not in payloads]
+    if uncached:
+        content_version = tracker_cache.current_content_version()
+        themes = _theme_modal_queryset(current_language).filter(pk__in=uncached)
+        counts = dashboard_counts()
+        chart_year, _current_year = _resolve_chart_year(None)
+        roadmap = theme_roadmap(chart_year)
+        rendered = {
+            theme.pk: _render_theme_modal(
+                request, theme, theme_counts(counts, theme.pk), theme_series(roadmap, theme.pk), current_language
+            )
+            for theme in themes
+        }
+        tracker_cache.set_many_theme_details(rendered, current_language, content_version)
+        payloads.update(rendered)
+
+    return JsonResponse({
+        'themes': {theme_id: payloads[theme_id] for theme_id in theme_ids if theme_id in payloads},
+        'missing': [theme_id for theme_id in theme_ids if theme_id not in payloads],
+    })
 
 
 # Custom error handlers